@@ -33,12 +33,6 @@
 from src import commands as commands_
 from src import itemtree
 from src import setting as setting_
-from src.gui import messages as messages_
-
-messages_.set_gui_excepthook(
-  title=CONFIG.PLUGIN_TITLE,
-  report_uri_list=CONFIG.BUG_REPORT_URL_LIST,
-)
 
 gi.require_version('Gimp', '3.0')
 from gi.repository import Gimp
@@ -46,27 +40,87 @@
 from gi.repository import GLib
 
 from src import core
+from src import directory as directory_
 from src import exceptions
 from src import plugin_settings
 from src import procedure as procedure_
 from src import update
 from src import utils_itemtree as utils_itemtree_
 from src import utils_setting as utils_setting_
-from src.gui import main as gui_main
+from src import watch as watch_
 from src.procedure_groups import *
 
+# Modules from the `src.gui` package are imported only for runs invoked from
+# the GIMP user interface, as importing them is relatively expensive and not
+# needed for non-interactive runs.
+
+
+_CREATE_SETTINGS_FUNCS = {
+  CONVERT_GROUP: plugin_settings.create_settings_for_convert,
+  EXPORT_IMAGES_GROUP: plugin_settings.create_settings_for_export_images,
+  EDIT_AND_SAVE_IMAGES_GROUP: plugin_settings.create_settings_for_edit_and_save_images,
+  EXPORT_LAYERS_GROUP: plugin_settings.create_settings_for_export_layers,
+  EDIT_LAYERS_GROUP: plugin_settings.create_settings_for_edit_layers,
+}
+
+_SETTINGS = {}
+
+_USED_PROCEDURE_GROUPS = set()
+
+_PERSISTENT_PROCEDURE_NAMES = [
+  'plug-in-batch-convert',
+  'plug-in-batch-export-images',
+  'plug-in-batch-edit-and-save-images',
+  'plug-in-batch-export-layers',
+  'plug-in-batch-edit-layers',
+]
+
+
+def _get_settings(procedure_group):
+  """Returns settings for the specified procedure group, creating them on the
+  first call.
+
+  Settings are created lazily as only one procedure is run per plug-in
+  process, unless the process was started via ``plug-in-batch-server``.
+  """
+  if procedure_group not in _SETTINGS:
+    _SETTINGS[procedure_group] = _CREATE_SETTINGS_FUNCS[procedure_group]()
+
+  return _SETTINGS[procedure_group]
+
+
+def _get_watch_settings():
+  if 'watch' not in _SETTINGS:
+    _SETTINGS['watch'] = plugin_settings.create_settings_for_convert_watch()
+
+  return _SETTINGS['watch']
+
+
+def plug_in_batch_server(procedure, _config, _data):
+  procedure_.run_persistent(
+    procedure, _PERSISTENT_PROCEDURE_NAMES, idle_func=_create_settings_for_next_run)
+
+  return Gimp.PDBStatusType.SUCCESS, ''
+
+
+def _create_settings_for_next_run():
+  # Settings are modified during a procedure run (e.g. by loading settings from
+  # a file or by connecting event handlers), hence settings used in a previous
+  # run are replaced. This is done while waiting for the next call so that the
+  # call itself does not have to create settings.
+  for procedure_group, create_settings_func in _CREATE_SETTINGS_FUNCS.items():
+    if procedure_group not in _SETTINGS or procedure_group in _USED_PROCEDURE_GROUPS:
+      _SETTINGS[procedure_group] = create_settings_func()
 
-SETTINGS_CONVERT = plugin_settings.create_settings_for_convert()
-SETTINGS_EXPORT_IMAGES = plugin_settings.create_settings_for_export_images()
-SETTINGS_EDIT_AND_SAVE_IMAGES = plugin_settings.create_settings_for_edit_and_save_images()
-SETTINGS_EXPORT_LAYERS = plugin_settings.create_settings_for_export_layers()
-SETTINGS_EDIT_LAYERS = plugin_settings.create_settings_for_edit_layers()
+  _USED_PROCEDURE_GROUPS.clear()
 
 
 def plug_in_batch_convert(_procedure, config, _data):
   run_mode = config.get_property('run-mode')
 
-  _set_up_procedure_on_start(SETTINGS_CONVERT, CONVERT_GROUP, run_mode)
+  settings = _get_settings(CONVERT_GROUP)
+
+  _set_up_procedure_on_start(settings, CONVERT_GROUP, run_mode)
 
   image_tree = itemtree.ImageFileTree()
 
@@ -78,221 +132,251 @@ def _fill_image_tree_with_loaded_inputs(settings):
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_CONVERT,
+      settings,
       image_tree,
-      gui_main.BatchProcessingGui,
+      'BatchProcessingGui',
       gui_class_kwargs=dict(
         mode='export', item_type='image', title=_('Batch Convert')),
       process_loaded_settings_func=_fill_image_tree_with_loaded_inputs,
     )
   elif run_mode == Gimp.RunMode.WITH_LAST_VALS:
     return _run_with_last_vals(
-      SETTINGS_CONVERT,
+      settings,
       image_tree,
       mode='export',
       process_loaded_settings_func=_fill_image_tree_with_loaded_inputs,
     )
   else:
-    return _run_noninteractive(SETTINGS_CONVERT, image_tree, config, mode='export')
+    return _run_noninteractive(settings, image_tree, config, mode='export')
+
+
+def plug_in_batch_convert_watch(_procedure, config, _data):
+  run_mode = config.get_property('run-mode')
+
+  settings = _get_settings(CONVERT_GROUP)
+
+  _set_up_procedure_on_start(settings, CONVERT_GROUP, run_mode)
+
+  return _run_watch(settings, _get_watch_settings(), config)
 
 
 def plug_in_batch_export_images(_procedure, config, _data):
   run_mode = config.get_property('run-mode')
 
-  _set_up_procedure_on_start(SETTINGS_EXPORT_IMAGES, EXPORT_IMAGES_GROUP, run_mode)
+  settings = _get_settings(EXPORT_IMAGES_GROUP)
+
+  _set_up_procedure_on_start(settings, EXPORT_IMAGES_GROUP, run_mode)
 
   image_tree = itemtree.GimpImageTree()
   image_tree.add_opened_images()
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EXPORT_IMAGES,
+      settings,
       image_tree,
-      gui_main.BatchProcessingGui,
+      'BatchProcessingGui',
       gui_class_kwargs=dict(
         mode='export', item_type='image', title=_('Export Images')),
     )
   elif run_mode == Gimp.RunMode.WITH_LAST_VALS:
     return _run_with_last_vals(
-      SETTINGS_EXPORT_IMAGES,
+      settings,
       image_tree,
       mode='export',
     )
   else:
-    return _run_noninteractive(SETTINGS_EXPORT_IMAGES, image_tree, config, mode='export')
+    return _run_noninteractive(settings, image_tree, config, mode='export')
 
 
 def plug_in_batch_export_images_quick(_procedure, config, _data):
   run_mode = config.get_property('run-mode')
 
-  _set_up_procedure_on_start(SETTINGS_EXPORT_IMAGES, EXPORT_IMAGES_GROUP, run_mode)
+  settings = _get_settings(EXPORT_IMAGES_GROUP)
+
+  _set_up_procedure_on_start(settings, EXPORT_IMAGES_GROUP, run_mode)
 
   image_tree = itemtree.GimpImageTree()
   image_tree.add_opened_images()
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EXPORT_IMAGES,
+      settings,
       image_tree,
-      gui_main.BatchProcessingQuickGui,
+      'BatchProcessingQuickGui',
       gui_class_kwargs=dict(
         mode='export', item_type='image', title=_('Export Images (Quick)')))
   else:
-    return _run_with_last_vals(SETTINGS_EXPORT_IMAGES, image_tree, mode='export')
+    return _run_with_last_vals(settings, image_tree, mode='export')
 
 
 def plug_in_batch_edit_and_save_images(_procedure, config, _data):
   run_mode = config.get_property('run-mode')
 
-  _set_up_procedure_on_start(SETTINGS_EDIT_AND_SAVE_IMAGES, EDIT_AND_SAVE_IMAGES_GROUP, run_mode)
+  settings = _get_settings(EDIT_AND_SAVE_IMAGES_GROUP)
+
+  _set_up_procedure_on_start(settings, EDIT_AND_SAVE_IMAGES_GROUP, run_mode)
 
   image_tree = itemtree.GimpImageTree()
   image_tree.add_opened_images()
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EDIT_AND_SAVE_IMAGES,
+      settings,
       image_tree,
-      gui_main.BatchProcessingGui,
+      'BatchProcessingGui',
       gui_class_kwargs=dict(
         mode='edit', item_type='image', title=_('Edit and Save Images')),
     )
   elif run_mode == Gimp.RunMode.WITH_LAST_VALS:
-    return _run_with_last_vals(SETTINGS_EDIT_AND_SAVE_IMAGES, image_tree, mode='edit')
+    return _run_with_last_vals(settings, image_tree, mode='edit')
   else:
-    return _run_noninteractive(SETTINGS_EDIT_AND_SAVE_IMAGES, image_tree, config, mode='edit')
+    return _run_noninteractive(settings, image_tree, config, mode='edit')
 
 
 def plug_in_batch_edit_and_save_images_quick(_procedure, config, _data):
   run_mode = config.get_property('run-mode')
 
-  _set_up_procedure_on_start(SETTINGS_EDIT_AND_SAVE_IMAGES, EDIT_AND_SAVE_IMAGES_GROUP, run_mode)
+  settings = _get_settings(EDIT_AND_SAVE_IMAGES_GROUP)
+
+  _set_up_procedure_on_start(settings, EDIT_AND_SAVE_IMAGES_GROUP, run_mode)
 
   image_tree = itemtree.GimpImageTree()
   image_tree.add_opened_images()
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EDIT_AND_SAVE_IMAGES,
+      settings,
       image_tree,
-      gui_main.BatchProcessingQuickGui,
+      'BatchProcessingQuickGui',
       gui_class_kwargs=dict(
         mode='edit', item_type='image', title=_('Edit and Save Images (Quick)')))
   else:
-    return _run_with_last_vals(SETTINGS_EXPORT_IMAGES, image_tree, mode='edit')
+    return _run_with_last_vals(settings, image_tree, mode='edit')
 
 
 def plug_in_batch_export_layers(_procedure, run_mode, image, _drawables, config, _data):
-  _set_up_procedure_on_start(SETTINGS_EXPORT_LAYERS, EXPORT_LAYERS_GROUP, run_mode)
+  settings = _get_settings(EXPORT_LAYERS_GROUP)
+
+  _set_up_procedure_on_start(settings, EXPORT_LAYERS_GROUP, run_mode)
 
   layer_tree = itemtree.LayerTree()
   layer_tree.add_from_image(image)
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EXPORT_LAYERS,
+      settings,
       layer_tree,
-      gui_main.BatchProcessingGui,
+      'BatchProcessingGui',
       gui_class_kwargs=dict(
         mode='export', item_type='layer', title=_('Export Layers'), current_image=image))
   elif run_mode == Gimp.RunMode.WITH_LAST_VALS:
-    return _run_with_last_vals(SETTINGS_EXPORT_LAYERS, layer_tree, mode='export')
+    return _run_with_last_vals(settings, layer_tree, mode='export')
   else:
-    return _run_noninteractive(SETTINGS_EXPORT_LAYERS, layer_tree, config, mode='export')
+    return _run_noninteractive(settings, layer_tree, config, mode='export')
 
 
 def plug_in_batch_export_layers_quick(_procedure, run_mode, image, _drawables, _config, _data):
-  _set_up_procedure_on_start(SETTINGS_EXPORT_LAYERS, EXPORT_LAYERS_GROUP, run_mode)
+  settings = _get_settings(EXPORT_LAYERS_GROUP)
+
+  _set_up_procedure_on_start(settings, EXPORT_LAYERS_GROUP, run_mode)
 
   layer_tree = itemtree.LayerTree()
   layer_tree.add_from_image(image)
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EXPORT_LAYERS,
+      settings,
       layer_tree,
-      gui_main.BatchProcessingQuickGui,
+      'BatchProcessingQuickGui',
       gui_class_kwargs=dict(
         mode='export', item_type='layer', title=_('Export Layers (Quick)'), current_image=image))
   else:
-    return _run_with_last_vals(SETTINGS_EXPORT_LAYERS, layer_tree, mode='export')
+    return _run_with_last_vals(settings, layer_tree, mode='export')
 
 
 def plug_in_batch_export_selected_layers(_procedure, run_mode, image, _drawables, _config, _data):
-  _set_up_procedure_on_start(SETTINGS_EXPORT_LAYERS, EXPORT_LAYERS_GROUP, run_mode)
+  settings = _get_settings(EXPORT_LAYERS_GROUP)
+
+  _set_up_procedure_on_start(settings, EXPORT_LAYERS_GROUP, run_mode)
 
   layer_tree = itemtree.LayerTree()
   layer_tree.add_from_image(image)
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EXPORT_LAYERS,
+      settings,
       layer_tree,
-      gui_main.BatchProcessingQuickGui,
+      'BatchProcessingQuickGui',
       gui_class_kwargs=dict(
         mode='export', item_type='layer', title=_('Export Selected Layers'), current_image=image),
       process_loaded_settings_func=_set_conditions_to_only_selected_layers)
   else:
     return _run_with_last_vals(
-      SETTINGS_EXPORT_LAYERS,
+      settings,
       layer_tree,
       mode='export',
       process_loaded_settings_func=_set_conditions_to_only_selected_layers)
 
 
 def plug_in_batch_edit_layers(_procedure, run_mode, image, _drawables, config, _data):
-  _set_up_procedure_on_start(SETTINGS_EDIT_LAYERS, EDIT_LAYERS_GROUP, run_mode)
+  settings = _get_settings(EDIT_LAYERS_GROUP)
+
+  _set_up_procedure_on_start(settings, EDIT_LAYERS_GROUP, run_mode)
 
   layer_tree = itemtree.LayerTree()
   layer_tree.add_from_image(image)
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EDIT_LAYERS,
+      settings,
       layer_tree,
-      gui_main.BatchProcessingGui,
+      'BatchProcessingGui',
       gui_class_kwargs=dict(
         mode='edit', item_type='layer', title=_('Edit Layers'), current_image=image))
   elif run_mode == Gimp.RunMode.WITH_LAST_VALS:
-    return _run_with_last_vals(SETTINGS_EDIT_LAYERS, layer_tree, mode='edit')
+    return _run_with_last_vals(settings, layer_tree, mode='edit')
   else:
-    return _run_noninteractive(SETTINGS_EDIT_LAYERS, layer_tree, config, mode='edit')
+    return _run_noninteractive(settings, layer_tree, config, mode='edit')
 
 
 def plug_in_batch_edit_layers_quick(_procedure, run_mode, image, _drawables, _config, _data):
-  _set_up_procedure_on_start(SETTINGS_EDIT_LAYERS, EDIT_LAYERS_GROUP, run_mode)
+  settings = _get_settings(EDIT_LAYERS_GROUP)
+
+  _set_up_procedure_on_start(settings, EDIT_LAYERS_GROUP, run_mode)
 
   layer_tree = itemtree.LayerTree()
   layer_tree.add_from_image(image)
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EDIT_LAYERS,
+      settings,
       layer_tree,
-      gui_main.BatchProcessingQuickGui,
+      'BatchProcessingQuickGui',
       gui_class_kwargs=dict(
         mode='edit', item_type='layer', title=_('Edit Layers (Quick)'), current_image=image))
   else:
-    return _run_with_last_vals(SETTINGS_EDIT_LAYERS, layer_tree, mode='edit')
+    return _run_with_last_vals(settings, layer_tree, mode='edit')
 
 
 def plug_in_batch_edit_selected_layers(_procedure, run_mode, image, _drawables, _config, _data):
-  _set_up_procedure_on_start(SETTINGS_EDIT_LAYERS, EDIT_LAYERS_GROUP, run_mode)
+  settings = _get_settings(EDIT_LAYERS_GROUP)
+
+  _set_up_procedure_on_start(settings, EDIT_LAYERS_GROUP, run_mode)
 
   layer_tree = itemtree.LayerTree()
   layer_tree.add_from_image(image)
 
   if run_mode == Gimp.RunMode.INTERACTIVE:
     return _run_interactive(
-      SETTINGS_EDIT_LAYERS,
+      settings,
       layer_tree,
-      gui_main.BatchProcessingQuickGui,
+      'BatchProcessingQuickGui',
       gui_class_kwargs=dict(
         mode='edit', item_type='layer', title=_('Edit Selected Layers'), current_image=image),
       process_loaded_settings_func=_set_conditions_to_only_selected_layers)
   else:
     return _run_with_last_vals(
-      SETTINGS_EDIT_LAYERS,
+      settings,
       layer_tree,
       mode='edit',
       process_loaded_settings_func=_set_conditions_to_only_selected_layers)
@@ -311,6 +395,9 @@ def _run_noninteractive(settings, item_tree, config, mode):
     gimp_status, message = _load_settings_from_file(settings, settings_file.get_path())
     if gimp_status != Gimp.PDBStatusType.SUCCESS:
       return gimp_status, message
+
+    if CONFIG.PROCEDURE_GROUP == CONVERT_GROUP:
+      _set_settings_not_saved_to_files_from_args(settings['main'], config)
   else:
     _set_settings_from_args(settings['main'], config)
 
@@ -319,6 +406,74 @@ def _run_noninteractive(settings, item_tree, config, mode):
   return Gimp.PDBStatusType.SUCCESS, ''
 
 
+def _run_watch(settings, watch_settings, config):
+  gimp_status, message, inputs = _read_inputs(config.get_property('inputs'))
+  if gimp_status != Gimp.PDBStatusType.SUCCESS:
+    return gimp_status, message
+
+  dirpaths = [path for path in inputs if os.path.isdir(path)]
+  if not dirpaths:
+    return (
+      Gimp.PDBStatusType.EXECUTION_ERROR,
+      f'File "{_get_path(config.get_property("inputs"))}" does not contain any existing folder')
+
+  settings_file = config.get_property('settings-file')
+
+  if settings_file is not None and settings_file.get_path() is not None:
+    gimp_status, message = _load_settings_from_file(settings, settings_file.get_path())
+    if gimp_status != Gimp.PDBStatusType.SUCCESS:
+      return gimp_status, message
+
+    _set_settings_not_saved_to_files_from_args(settings['main'], config)
+  else:
+    _set_settings_from_args(
+      settings['main'],
+      config,
+      num_args_after_settings=len(setting_.create_params(watch_settings)))
+
+  _set_settings_from_args(watch_settings, config)
+
+  batcher = core.ImageBatcher(
+    item_tree=itemtree.ImageFileTree(),
+    actions=settings['main/actions'],
+    conditions=settings['main/conditions'],
+    refresh_item_tree=False,
+    initial_export_run_mode=Gimp.RunMode.NONINTERACTIVE,
+  )
+
+  output_directory = settings['main/output_directory'].value
+  if output_directory.type_ == directory_.DirectoryTypes.DIRECTORY:
+    excluded_dirpaths = [output_directory.value]
+
+    if any(os.path.abspath(dirpath) == os.path.abspath(output_directory.value)
+           for dirpath in dirpaths):
+      return (
+        Gimp.PDBStatusType.EXECUTION_ERROR,
+        f'Output folder "{output_directory.value}" must not be one of the watched folders')
+  else:
+    excluded_dirpaths = []
+
+  stop_file = watch_settings['stop_file'].value
+
+  processor = watch_.FolderWatchProcessor(
+    batcher,
+    dirpaths,
+    batcher_kwargs=utils_setting_.get_settings_for_batcher(settings['main']),
+    poll_interval=watch_settings['poll_interval'].value,
+    settle_time=watch_settings['settle_time'].value,
+    max_batch_size=watch_settings['max_batch_size'].value,
+    max_queued_files=watch_settings['max_queued_files'].value,
+    stop_filepath=stop_file.get_path() if stop_file is not None else None,
+    stats_interval=watch_settings['stats_interval'].value,
+    include_existing_files=watch_settings['process_existing_files'].value,
+    excluded_dirpaths=excluded_dirpaths,
+  )
+
+  processor.run()
+
+  return Gimp.PDBStatusType.SUCCESS, ''
+
+
 def _run_with_last_vals(
       settings,
       item_tree,
@@ -340,7 +495,7 @@ def _run_with_last_vals(
 def _run_interactive(
       settings,
       item_tree,
-      gui_class,
+      gui_class_name,
       gui_class_args=None,
       gui_class_kwargs=None,
       process_loaded_settings_func=None,
@@ -358,6 +513,11 @@ def _run_interactive(
   if process_loaded_settings_func is not None:
     process_loaded_settings_func(settings)
 
+  from src.gui import main as gui_main
+  from src.gui import messages as messages_
+
+  gui_class = getattr(gui_main, gui_class_name)
+
   gui_class(item_tree, settings, *gui_class_args, **gui_class_kwargs)
 
   if not messages_.unhandled_exception_encountered():
@@ -393,23 +553,46 @@ def _run_plugin_noninteractive(settings, run_mode, item_tree, mode):
 
 
 def _load_inputs(item_tree, filepath, max_num_inputs):
-  if filepath is None:
+  gimp_status, message, inputs = _read_inputs(filepath)
+  if gimp_status != Gimp.PDBStatusType.SUCCESS:
+    return gimp_status, message
+
+  item_tree.add(inputs)
+
+  if max_num_inputs != 0 and len(item_tree) > max_num_inputs:
     return (
-      Gimp.PDBStatusType.EXECUTION_ERROR, f'File containing inputs is not specified')
+      Gimp.PDBStatusType.EXECUTION_ERROR,
+      (f'File "{_get_path(filepath)}" contains more than {max_num_inputs} files to process'
+       ' (including files in folders).'
+       ' Check if you specified the files and folders you truly wish to process.'
+       ' To remove this restriction, set "max-num-inputs" to 0.'))
 
+  return Gimp.PDBStatusType.SUCCESS, ''
+
+
+def _get_path(filepath):
   if isinstance(filepath, Gio.File):
-    processed_filepath = filepath.get_path()
+    return filepath.get_path()
   else:
-    processed_filepath = filepath
+    return filepath
+
+
+def _read_inputs(filepath):
+  if filepath is None:
+    return (
+      Gimp.PDBStatusType.EXECUTION_ERROR, f'File containing inputs is not specified', [])
+
+  processed_filepath = _get_path(filepath)
 
   if processed_filepath is None:
     return (
-      Gimp.PDBStatusType.EXECUTION_ERROR, f'File containing inputs is not specified')
+      Gimp.PDBStatusType.EXECUTION_ERROR, f'File containing inputs is not specified', [])
 
   if not os.path.isfile(processed_filepath):
     return (
       Gimp.PDBStatusType.EXECUTION_ERROR,
-      f'File "{processed_filepath}" does not exist or is not a file')
+      f'File "{processed_filepath}" does not exist or is not a file',
+      [])
 
   try:
     with open(processed_filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as inputs_file:
@@ -417,24 +600,25 @@ def _load_inputs(item_tree, filepath, max_num_inputs):
   except Exception as e:
     return (
       Gimp.PDBStatusType.EXECUTION_ERROR,
-      f'Error obtaining inputs from file "{processed_filepath}": {e}')
+      f'Error obtaining inputs from file "{processed_filepath}": {e}',
+      [])
 
-  item_tree.add(inputs)
+  return Gimp.PDBStatusType.SUCCESS, '', inputs
 
-  if max_num_inputs != 0 and len(item_tree) > max_num_inputs:
-    return (
-      Gimp.PDBStatusType.EXECUTION_ERROR,
-      (f'File "{processed_filepath}" contains more than {max_num_inputs} files to process'
-       ' (including files in folders).'
-       ' Check if you specified the files and folders you truly wish to process.'
-       ' To remove this restriction, set "max-num-inputs" to 0.'))
 
-  return Gimp.PDBStatusType.SUCCESS, ''
+def _set_up_procedure_on_start(settings, procedure_group, run_mode):
+  if run_mode != Gimp.RunMode.NONINTERACTIVE:
+    from src.gui import messages as messages_
 
+    messages_.set_gui_excepthook(
+      title=CONFIG.PLUGIN_TITLE,
+      report_uri_list=CONFIG.BUG_REPORT_URL_LIST,
+    )
 
-def _set_up_procedure_on_start(settings, procedure_group, run_mode):
   _set_config_entries_for_procedure(procedure_group, run_mode)
 
+  _USED_PROCEDURE_GROUPS.add(procedure_group)
+
   plugin_settings.init_settings_on_procedure_start(settings)
 
 
@@ -453,7 +637,7 @@ def _load_and_update_settings(settings, run_mode):
     main_message, commands_no_longer_available_str = load_message.split('\n\n')
 
     if run_mode == Gimp.RunMode.INTERACTIVE:
-      messages_.display_alert_message(
+      _display_alert_message(
         title=CONFIG.PLUGIN_TITLE,
         message_type=Gtk.MessageType.WARNING,
         message_markup=GLib.markup_escape_text(main_message),
@@ -463,7 +647,7 @@ def _load_and_update_settings(settings, run_mode):
     return True, load_message
   elif status == update.UpdateStatuses.TERMINATE:
     if run_mode == Gimp.RunMode.INTERACTIVE:
-      messages_.display_alert_message(
+      _display_alert_message(
         title=CONFIG.PLUGIN_TITLE,
         message_type=Gtk.MessageType.WARNING,
         message_markup=_(
@@ -497,13 +681,19 @@ def _load_and_update_settings(settings, run_mode):
   return True, ''
 
 
+def _display_alert_message(**kwargs):
+  from src.gui import messages as messages_
+
+  messages_.display_alert_message(**kwargs)
+
+
 def _load_settings_from_file(settings, settings_filepath):
   if not os.path.isfile(settings_filepath):
     return (
       Gimp.PDBStatusType.EXECUTION_ERROR,
       _('"{}" is not a valid file with settings').format(settings_filepath))
 
-  setting_source = setting_.JsonFileSource(CONFIG.PROCEDURE_GROUP, settings_filepath)
+  setting_source = setting_.CachedJsonFileSource(CONFIG.PROCEDURE_GROUP, settings_filepath)
 
   status, message = update.load_and_update(
     settings, sources={'persistent': setting_source}, procedure_group=CONFIG.PROCEDURE_GROUP)
@@ -518,12 +708,13 @@ def _load_settings_from_file(settings, settings_filepath):
   return Gimp.PDBStatusType.SUCCESS, ''
 
 
-def _set_settings_from_args(settings, config):
+def _set_settings_from_args(settings, config, num_args_after_settings=0):
   args_as_settings = [
     setting for setting in settings
     if isinstance(setting, setting_.Setting) and setting.can_be_used_in_pdb()]
 
   args = [config.get_property(prop.name) for prop in config.list_properties()]
+  args = args[:len(args) - num_args_after_settings]
   # `config.list_properties()` contains additional properties or parameters
   # added by GIMP (e.g. `Gimp.Procedure` object). It appears these are added
   # before the plug-in-specific PDB parameters.
@@ -533,6 +724,20 @@ def _set_settings_from_args(settings, config):
     setting.set_value(arg)
 
 
+def _set_settings_not_saved_to_files_from_args(settings, config):
+  # These settings are not saved to files, hence they are always obtained
+  # from arguments.
+  for setting_name in [
+        'manifest_file',
+        'rebuild_all',
+        'deduplicate_inputs',
+        'duplicate_output_mode',
+        'import_at_reduced_size',
+        'apply_pointwise_actions_after_downscaling',
+  ]:
+    settings[setting_name].set_value(config.get_property(setting_name.replace('_', '-')))
+
+
 def _set_conditions_to_only_selected_layers(settings):
   commands_.clear(settings['main/conditions'], add_initial_commands=False)
 
@@ -540,10 +745,27 @@ def _set_conditions_to_only_selected_layers(settings):
     settings['main/conditions'], builtin_conditions.BUILTIN_CONDITIONS['selected_in_gimp'])
 
 
+procedure_.register_procedure(
+  plug_in_batch_server,
+  procedure_type=Gimp.Procedure,
+  pdb_procedure_type=Gimp.PDBProcType.PERSISTENT,
+  init_ui=False,
+  documentation=(
+    _('Keep the plug-in running to speed up subsequent non-interactive calls'),
+    _('This procedure keeps the plug-in running in the background and installs'
+      ' procedures with the "-persistent" suffix (e.g. "plug-in-batch-convert-persistent")'
+      ' accepting the same arguments as the corresponding procedures without the suffix.'
+      ' Calls to these procedures avoid the startup time of the plug-in.'
+      ' Call "plug-in-batch-server-quit" to terminate the plug-in.'),
+  ),
+  attribution=(CONFIG.AUTHOR_NAME, CONFIG.AUTHOR_NAME, CONFIG.COPYRIGHT_YEARS),
+)
+
+
 procedure_.register_procedure(
   plug_in_batch_convert,
   procedure_type=Gimp.Procedure,
-  arguments=setting_.create_params(SETTINGS_CONVERT['main']),
+  arguments=lambda: setting_.create_params(_get_settings(CONVERT_GROUP)['main']),
   menu_label=_('_Batch Convert...'),
   menu_path='<Image>/File/[Export]',
   image_types='',
@@ -558,10 +780,26 @@ def _set_conditions_to_only_selected_layers(settings):
 )
 
 
+procedure_.register_procedure(
+  plug_in_batch_convert_watch,
+  procedure_type=Gimp.Procedure,
+  arguments=lambda: setting_.create_params(
+    _get_settings(CONVERT_GROUP)['main'], _get_watch_settings()),
+  documentation=(
+    _('Continuously batch-process image files added to folders'),
+    _('This procedure watches the folders specified in the file passed as "inputs"'
+      ' and converts new or modified image files the same way as'
+      ' "plug-in-batch-convert", until the procedure is stopped via a signal'
+      ' or the file specified as "stop-file" is created.'),
+  ),
+  attribution=(CONFIG.AUTHOR_NAME, CONFIG.AUTHOR_NAME, CONFIG.COPYRIGHT_YEARS),
+)
+
+
 procedure_.register_procedure(
   plug_in_batch_export_images,
   procedure_type=Gimp.Procedure,
-  arguments=setting_.create_params(SETTINGS_EXPORT_IMAGES['main']),
+  arguments=lambda: setting_.create_params(_get_settings(EXPORT_IMAGES_GROUP)['main']),
   menu_label=_('E_xport Images...'),
   menu_path='<Image>/File/[Export]',
   image_types='',
@@ -574,7 +812,7 @@ def _set_conditions_to_only_selected_layers(settings):
 procedure_.register_procedure(
   plug_in_batch_export_images_quick,
   procedure_type=Gimp.Procedure,
-  arguments=setting_.create_params(SETTINGS_EXPORT_IMAGES['main/run_mode']),
+  arguments=lambda: setting_.create_params(_get_settings(EXPORT_IMAGES_GROUP)['main/run_mode']),
   menu_label=_('E_xport Images (Quick)'),
   menu_path='<Image>/File/[Export]',
   image_types='',
@@ -587,7 +825,7 @@ def _set_conditions_to_only_selected_layers(settings):
 procedure_.register_procedure(
   plug_in_batch_edit_and_save_images,
   procedure_type=Gimp.Procedure,
-  arguments=setting_.create_params(SETTINGS_EDIT_AND_SAVE_IMAGES['main']),
+  arguments=lambda: setting_.create_params(_get_settings(EDIT_AND_SAVE_IMAGES_GROUP)['main']),
   menu_label=_('E_dit and Save Images...'),
   menu_path='<Image>/File/[Export]',
   image_types='',
@@ -600,7 +838,8 @@ def _set_conditions_to_only_selected_layers(settings):
 procedure_.register_procedure(
   plug_in_batch_edit_and_save_images_quick,
   procedure_type=Gimp.Procedure,
-  arguments=setting_.create_params(SETTINGS_EDIT_AND_SAVE_IMAGES['main/run_mode']),
+  arguments=lambda: setting_.create_params(
+    _get_settings(EDIT_AND_SAVE_IMAGES_GROUP)['main/run_mode']),
   menu_label=_('E_dit and Save Images (Quick)'),
   menu_path='<Image>/File/[Export]',
   image_types='',
@@ -612,7 +851,7 @@ def _set_conditions_to_only_selected_layers(settings):
 
 procedure_.register_procedure(
   plug_in_batch_export_layers,
-  arguments=setting_.create_params(SETTINGS_EXPORT_LAYERS['main']),
+  arguments=lambda: setting_.create_params(_get_settings(EXPORT_LAYERS_GROUP)['main']),
   menu_label=_('E_xport Layers...'),
   menu_path='<Image>/File/[Export]',
   image_types='*',
@@ -654,7 +893,7 @@ def _set_conditions_to_only_selected_layers(settings):
 
 procedure_.register_procedure(
   plug_in_batch_edit_layers,
-  arguments=setting_.create_params(SETTINGS_EDIT_LAYERS['main']),
+  arguments=lambda: setting_.create_params(_get_settings(EDIT_LAYERS_GROUP)['main']),
   menu_label=_('E_dit Layers...'),
   menu_path='<Image>/File/[Export]',
   image_types='*',
@@ -23,7 +23,7 @@
 PLUGIN_DIRPATH = os.path.dirname(DEV_DIRPATH)
 SRC_DIRPATH = os.path.join(PLUGIN_DIRPATH, 'src')
 
-OUTPUT_FILEPATH = os.path.join(SRC_DIRPATH, '_gegl_operations_custom_attributes.py')
+OUTPUT_FILEPATH = os.path.join(SRC_DIRPATH, '_gegl_operations_custom_attributes.json')
 
 
 class OperationsIndexParser(html.parser.HTMLParser):
@@ -192,19 +192,11 @@ def main():
 
   output = format_attributes_for_commands(operations_and_arguments)
 
-  # We avoid constructing and unparsing an AST by exploiting the fact that
-  # JSON objects are parsed as Python dictionaries.
-  raw_output = json.dumps(output, indent=2, ensure_ascii=False)
-  # Single quotes are used in the plug-in source code everywhere.
-  raw_output = raw_output.replace('"', "'")
-
-  raw_output = f'''"""Custom attributes for GEGL operations (layer effects) installed in GIMP."""
-
-GEGL_OPERATIONS_AND_CUSTOM_ATTRIBUTES = {raw_output}
-'''
-
+  # The output is stored as JSON rather than a Python module so that it can be
+  # loaded quickly and only when needed.
   with open(OUTPUT_FILEPATH, 'w', encoding='utf-8') as f:
-    f.write(raw_output)
+    json.dump(output, f, indent=2, ensure_ascii=False)
+    f.write('\n')
 
   print(f'Output successfully written to {OUTPUT_FILEPATH}')
 
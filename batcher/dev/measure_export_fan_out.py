@@ -0,0 +1,234 @@
+"""Measuring the time it takes to export each item in multiple file formats.
+
+Each item is exported in three file formats (PNG, JPEG and WebP) via
+consecutive export actions, in two ways:
+
+* the export actions share the image to export, which is copied, rotated and
+  merged only once per item,
+* each export action copies, rotates and merges the image on its own.
+
+This is measured for the Convert procedure (the default export action preceded
+by two additional export actions) and for the Edit Layers procedure (three
+export actions in edit mode, where each export action would otherwise create a
+copy of the image).
+
+Run this module from the Python-Fu console in a GIMP session.
+"""
+
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+from unittest import mock
+
+import gi
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+from gi.repository import Gio
+
+from src import utils
+
+utils.initialize_i18n()
+
+from config import CONFIG
+from src import builtin_actions
+from src import commands
+from src import core
+from src import directory as directory_
+from src import itemtree
+from src import overwrite
+from src import plugin_settings
+from src import utils_setting as utils_setting_
+from src.procedure_groups import *
+from src.pypdb import pdb
+
+
+_IMAGE_WIDTH_DEFAULT = 3000
+_IMAGE_HEIGHT_DEFAULT = 2000
+_NUM_LAYERS_DEFAULT = 5
+_NUM_IMAGES_DEFAULT = 10
+_NUM_RUNS_DEFAULT = 3
+
+_ADDITIONAL_EXPORTS = [
+  ('jpg', builtin_actions.LayerHandlingModes.MERGE_AND_REMOVE_ALPHA),
+  ('webp', builtin_actions.LayerHandlingModes.MERGE_AND_ADD_ALPHA),
+]
+
+
+def main(
+      image_width: int = _IMAGE_WIDTH_DEFAULT,
+      image_height: int = _IMAGE_HEIGHT_DEFAULT,
+      num_layers: int = _NUM_LAYERS_DEFAULT,
+      num_images: int = _NUM_IMAGES_DEFAULT,
+      num_runs: int = _NUM_RUNS_DEFAULT,
+      print_results: bool = True,
+) -> Dict[str, List[float]]:
+  """Exports items in three file formats ``num_runs`` times for each procedure
+  and each way of exporting, and returns the duration of each run in seconds.
+
+  The Convert procedure processes ``num_images`` images, each with
+  ``num_layers`` layers. The Edit Layers procedure processes ``num_layers``
+  layers of a single image.
+  """
+  temp_dirpath = tempfile.mkdtemp()
+
+  durations = {}
+
+  try:
+    input_filepaths = _create_input_files(
+      os.path.join(temp_dirpath, 'inputs'), image_width, image_height, num_layers, num_images)
+
+    image = _create_image(image_width, image_height, num_layers)
+
+    try:
+      for procedure_name, run_func, args in [
+            ('convert', _convert, [input_filepaths]),
+            ('edit_layers', _edit_layers, [image]),
+      ]:
+        for way, should_share_image in [('shared', True), ('not_shared', False)]:
+          key = f'{procedure_name}_{way}'
+          durations[key] = []
+
+          for _run_index in range(num_runs):
+            output_dirpath = os.path.join(temp_dirpath, 'outputs')
+
+            start_time = time.perf_counter()
+
+            if should_share_image:
+              run_func(*args, output_dirpath)
+            else:
+              with mock.patch(
+                    'src.core._group_consecutive_export_actions',
+                    new=_get_action_groups_unmodified):
+                run_func(*args, output_dirpath)
+
+            durations[key].append(time.perf_counter() - start_time)
+
+            shutil.rmtree(output_dirpath)
+    finally:
+      image.delete()
+  finally:
+    shutil.rmtree(temp_dirpath)
+
+  if print_results:
+    print(
+      f'{1 + len(_ADDITIONAL_EXPORTS)} exports per item, {image_width}x{image_height} images'
+      f' with {num_layers} layers, {num_images} images for convert, {num_runs} runs:')
+
+    for key, key_durations in durations.items():
+      print(
+        f'{key}:'
+        f' median {statistics.median(key_durations):.3f} s,'
+        f' min {min(key_durations):.3f} s,'
+        f' max {max(key_durations):.3f} s')
+
+  return durations
+
+
+def _get_action_groups_unmodified(action_groups):
+  return action_groups
+
+
+def _create_input_files(dirpath, width, height, num_layers, num_images):
+  os.makedirs(dirpath)
+
+  image = _create_image(width, height, num_layers)
+
+  filepaths = []
+
+  try:
+    for index in range(num_images):
+      filepath = os.path.join(dirpath, f'image{index}.xcf')
+
+      pdb.gimp_xcf_save(image=image, file=Gio.file_new_for_path(filepath))
+
+      filepaths.append(filepath)
+  finally:
+    image.delete()
+
+  return filepaths
+
+
+def _create_image(width, height, num_layers):
+  image = Gimp.Image.new(width, height, Gimp.ImageBaseType.RGB)
+
+  for index in range(num_layers):
+    layer = Gimp.Layer.new(
+      image,
+      f'Layer {index}',
+      width // (index + 1),
+      height // (index + 1),
+      Gimp.ImageType.RGBA_IMAGE,
+      100.0,
+      Gimp.LayerMode.NORMAL)
+    image.insert_layer(layer, None, 0)
+
+    pdb.gegl__plasma(layer, seed=index, merge_filter_=True)
+
+  return image
+
+
+def _convert(input_filepaths, output_dirpath):
+  CONFIG.PROCEDURE_GROUP = CONVERT_GROUP
+
+  try:
+    settings = plugin_settings.create_settings_for_convert()
+    settings['main/output_directory'].set_value(directory_.Directory(output_dirpath))
+    settings['main/file_extension'].set_value('png')
+    settings['main/overwrite_mode'].set_value(overwrite.OverwriteModes.REPLACE)
+
+    _add_export_actions(
+      settings['main/actions'], 'export_for_convert', _ADDITIONAL_EXPORTS, output_dirpath)
+
+    item_tree = itemtree.ImageFileTree()
+    item_tree.add(input_filepaths)
+
+    batcher = core.ImageBatcher(
+      item_tree=item_tree,
+      actions=settings['main/actions'],
+      conditions=settings['main/conditions'],
+      initial_export_run_mode=Gimp.RunMode.NONINTERACTIVE,
+    )
+
+    batcher.run(**utils_setting_.get_settings_for_batcher(settings['main']))
+  finally:
+    CONFIG.PROCEDURE_GROUP = CONFIG.PLUGIN_NAME
+
+
+def _edit_layers(image, output_dirpath):
+  CONFIG.PROCEDURE_GROUP = EDIT_LAYERS_GROUP
+
+  try:
+    settings = plugin_settings.create_settings_for_edit_layers()
+
+    _add_export_actions(
+      settings['main/actions'],
+      'export_for_edit_layers',
+      [('png', builtin_actions.LayerHandlingModes.MERGE_AND_ADD_ALPHA)] + _ADDITIONAL_EXPORTS,
+      output_dirpath)
+
+    item_tree = itemtree.LayerTree()
+    item_tree.add_from_image(image)
+
+    batcher = core.LayerBatcher(
+      item_tree=item_tree,
+      actions=settings['main/actions'],
+      conditions=settings['main/conditions'],
+      initial_export_run_mode=Gimp.RunMode.NONINTERACTIVE,
+      edit_mode=True,
+    )
+
+    batcher.run(**utils_setting_.get_settings_for_batcher(settings['main']))
+  finally:
+    CONFIG.PROCEDURE_GROUP = CONFIG.PLUGIN_NAME
+
+
+def _add_export_actions(actions, export_action_name, exports, output_dirpath):
+  for file_extension, layer_handling in exports:
+    export_action = commands.add(actions, builtin_actions.BUILTIN_ACTIONS[export_action_name])
+    export_action['arguments/output_directory'].set_value(directory_.Directory(output_dirpath))
+    export_action['arguments/file_extension'].set_value(file_extension)
+    export_action['arguments/overwrite_mode'].set_value(overwrite.OverwriteModes.REPLACE)
+    export_action['arguments/layer_handling'].set_value(layer_handling)
@@ -0,0 +1,115 @@
+"""Measuring the time it takes to apply a chain of color filters destructively.
+
+Filters are applied to a large image in two ways:
+
+* each filter is merged immediately after it is applied (the way built-in
+  actions apply filters destructively),
+* all filters are applied non-destructively and merged at once at the end.
+
+Besides durations, the mean difference between the images produced by both
+ways is printed. A non-zero difference indicates that merging all filters at
+once does not produce identical output, e.g. due to rounding intermediate
+results to the image precision when merging filters one by one.
+
+Run this module from the Python-Fu console in a GIMP session.
+"""
+
+import statistics
+import time
+from typing import Dict, List
+
+from src import utils
+
+utils.initialize_i18n()
+
+from src.pypdb import pdb
+
+from src.tests.tests_requiring_gimp import utils_images
+
+
+_IMAGE_WIDTH_DEFAULT = 6000
+_IMAGE_HEIGHT_DEFAULT = 4000
+_NUM_RUNS_DEFAULT = 5
+
+_FILTERS = [
+  ('gegl:brightness-contrast', {'contrast': 1.2, 'brightness': 0.1}),
+  ('gegl:saturation', {'scale': 1.3}),
+  ('gegl:exposure', {'exposure': 0.5}),
+  ('gegl:hue-chroma', {'hue': 10.0, 'chroma': 5.0}),
+  ('gegl:invert-gamma', {}),
+]
+
+
+def main(
+      image_width: int = _IMAGE_WIDTH_DEFAULT,
+      image_height: int = _IMAGE_HEIGHT_DEFAULT,
+      num_runs: int = _NUM_RUNS_DEFAULT,
+      print_results: bool = True,
+) -> Dict[str, List[float]]:
+  """Applies filters to an image of the specified size ``num_runs`` times for
+  each way of merging filters and returns the duration of each run in seconds.
+  """
+  source_image = utils_images.create_plasma_image(image_width, image_height)
+
+  durations = {
+    'merged_immediately': [],
+    'merged_at_once': [],
+  }
+
+  images = {}
+
+  try:
+    for run_index in range(num_runs):
+      for way, apply_filters_func in [
+            ('merged_immediately', _apply_filters_merged_immediately),
+            ('merged_at_once', _apply_filters_merged_at_once),
+      ]:
+        image = source_image.duplicate()
+        layer = image.get_layers()[0]
+
+        start_time = time.perf_counter()
+
+        apply_filters_func(layer)
+
+        durations[way].append(time.perf_counter() - start_time)
+
+        if run_index == 0:
+          images[way] = image
+        else:
+          image.delete()
+
+    mean_difference = utils_images.get_mean_difference(
+      images['merged_immediately'], images['merged_at_once'])
+  finally:
+    source_image.delete()
+
+    for image in images.values():
+      image.delete()
+
+  if print_results:
+    print(
+      f'{len(_FILTERS)} filters applied to a {image_width}x{image_height} image,'
+      f' {num_runs} runs:')
+
+    for way, way_durations in durations.items():
+      print(
+        f'{way}:'
+        f' median {statistics.median(way_durations):.3f} s,'
+        f' min {min(way_durations):.3f} s,'
+        f' max {max(way_durations):.3f} s')
+
+    print(f'Mean difference between outputs: {mean_difference:.6f}')
+
+  return durations
+
+
+def _apply_filters_merged_immediately(layer):
+  for name, kwargs in _FILTERS:
+    pdb[name](layer, merge_filter_=True, **kwargs)
+
+
+def _apply_filters_merged_at_once(layer):
+  for name, kwargs in _FILTERS:
+    pdb[name](layer, merge_filter_=False, **kwargs)
+
+  layer.merge_filters()
@@ -0,0 +1,79 @@
+"""Measuring the number of items per second that can be processed with the
+plug-in GUI attached.
+
+Items are not actually processed. For each item, the progress bar and the log
+are updated the same way as during batch processing, hence the measured rate
+is an upper bound imposed by updating the GUI.
+
+Run this module from the Python-Fu console in a GIMP session.
+"""
+
+import logging
+import time
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk
+
+from src import utils
+
+utils.initialize_i18n()
+
+from src.gui import log_viewer as log_viewer_
+from src.gui import progress_updater as progress_updater_
+from src.gui.main import main as gui_main
+
+
+_NUM_ITEMS_DEFAULT = 2000
+
+_LOGGER_NAME = 'measure_gui_update_rate'
+
+
+def main(num_items: int = _NUM_ITEMS_DEFAULT, print_results: bool = True) -> float:
+  """Simulates processing ``num_items`` items with a progress bar and a log
+  viewer displayed and returns the number of items processed per second.
+  """
+  window = Gtk.Window(title='Measuring GUI update rate')
+  progress_bar = Gtk.ProgressBar()
+  window.add(progress_bar)
+  window.show_all()
+
+  log_viewer = log_viewer_.LogViewer(window)
+  log_viewer.widget.show_all()
+
+  logger = logging.getLogger(_LOGGER_NAME)
+  logger.setLevel(logging.INFO)
+  log_handler = gui_main.GuiLogHandler(log_viewer)
+  logger.addHandler(log_handler)
+
+  progress_updater = progress_updater_.GtkProgressUpdater(progress_bar, num_total_tasks=num_items)
+
+  try:
+    start_time = time.perf_counter()
+
+    for i in range(num_items):
+      processing_message = f'Processing "image-{i}"'
+      progress_updater.set_text(processing_message)
+      logger.info(processing_message)
+
+      saving_message = f'Saving "image-{i}.png"'
+      progress_updater.set_text(saving_message)
+      logger.info(saving_message)
+
+      progress_updater.update_tasks()
+
+    progress_updater.reset()
+    log_viewer.flush()
+
+    duration = time.perf_counter() - start_time
+  finally:
+    logger.removeHandler(log_handler)
+    log_viewer.widget.destroy()
+    window.destroy()
+
+  items_per_second = num_items / duration
+
+  if print_results:
+    print(f'{num_items} items in {duration:.3f} s ({items_per_second:.1f} items per second)')
+
+  return items_per_second
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""Measuring the overhead of invoking commands via `invoker.Invoker`.
+
+The commands do nothing, hence the measured time is dominated by the overhead
+of `invoker.Invoker.invoke()`. The setup mimics a batch run where a group of
+commands is invoked for each item and each command is wrapped in several
+for-each commands.
+"""
+
+import contextlib
+import inspect
+import os
+import sys
+import time
+
+DEV_DIRPATH = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+PLUGIN_DIRPATH = os.path.dirname(DEV_DIRPATH)
+
+if PLUGIN_DIRPATH not in sys.path:
+  sys.path.append(PLUGIN_DIRPATH)
+
+from src import invoker as invoker_
+
+
+_NUM_COMMANDS_DEFAULT = 20
+_NUM_FOREACH_COMMANDS_DEFAULT = 3
+_NUM_INVOCATIONS_DEFAULT = 100_000
+
+
+def main(
+      num_commands: int = _NUM_COMMANDS_DEFAULT,
+      num_foreach_commands: int = _NUM_FOREACH_COMMANDS_DEFAULT,
+      num_invocations: int = _NUM_INVOCATIONS_DEFAULT,
+      print_results: bool = True,
+) -> float:
+  """Invokes a group of ``num_commands`` commands and ``num_foreach_commands``
+  for-each commands ``num_invocations`` times and returns the total duration in
+  seconds.
+  """
+  invoker = invoker_.Invoker()
+
+  for _i in range(num_commands):
+    invoker.add(_do_nothing, groups=['main'], args=[None])
+
+  for _i in range(num_foreach_commands):
+    invoker.add(_do_nothing_before_and_after, groups=['main'], args=[None], foreach=True)
+
+  start_time = time.perf_counter()
+
+  for _i in range(num_invocations):
+    invoker.invoke(['main'], additional_args=[None])
+
+  duration = time.perf_counter() - start_time
+
+  if print_results:
+    print(
+      f'{num_invocations} invocations of {num_commands} commands'
+      f' and {num_foreach_commands} for-each commands:'
+      f' {duration:.3f} s ({duration / num_invocations * 1_000_000:.2f} us per invocation)')
+
+  return duration
+
+
+def _do_nothing(_arg, _additional_arg):
+  pass
+
+
+@contextlib.contextmanager
+def _do_nothing_before_and_after(_arg, _additional_arg):
+  yield
+
+
+if __name__ == '__main__':
+  main()
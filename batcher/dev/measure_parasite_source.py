@@ -0,0 +1,135 @@
+"""Measuring the time it takes to save and load settings via
+`setting.GimpParasiteSource`, and the size of the saved data.
+
+Settings of the Convert procedure with a number of added actions are saved and
+loaded in two ways:
+
+* compressed via ``zlib`` (the current format),
+* as plain pickled data (the legacy format).
+
+A separate parasite is used for the measurement and is removed afterwards.
+Settings saved by the plug-in itself are not affected.
+
+Run this module from the Python-Fu console in a GIMP session.
+"""
+
+import contextlib
+import statistics
+import time
+from typing import Dict, List
+from unittest import mock
+
+import gi
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+
+from src import utils
+
+utils.initialize_i18n()
+
+from config import CONFIG
+from src import builtin_actions
+from src import commands
+from src import plugin_settings
+from src import setting as setting_
+from src.procedure_groups import *
+
+
+_NUM_ACTION_COPIES_DEFAULT = 10
+_NUM_RUNS_DEFAULT = 20
+
+_PARASITE_NAME = 'plug-in-batcher-measure-parasite-source'
+
+_ACTION_NAMES = [
+  'scale_for_images',
+  'brightness_contrast',
+  'hue_saturation',
+  'insert_overlay_for_images',
+  'rename_for_convert',
+  'export_for_convert',
+]
+
+
+def main(
+      num_action_copies: int = _NUM_ACTION_COPIES_DEFAULT,
+      num_runs: int = _NUM_RUNS_DEFAULT,
+      print_results: bool = True,
+) -> Dict[str, List[float]]:
+  """Saves and loads settings ``num_runs`` times for each format and returns
+  the duration of each run in seconds.
+
+  Each action from a fixed list of built-in actions is added
+  ``num_action_copies`` times to the settings.
+  """
+  settings = _create_settings(num_action_copies)
+
+  source = setting_.GimpParasiteSource(_PARASITE_NAME)
+
+  durations = {}
+  data_sizes = {}
+
+  try:
+    for format_name, should_compress in [('compressed', True), ('legacy', False)]:
+      durations[f'{format_name}_save'] = []
+      durations[f'{format_name}_load'] = []
+
+      with _get_format_context_manager(should_compress):
+        for _run_index in range(num_runs):
+          source.clear()
+
+          start_time = time.perf_counter()
+
+          source.write([settings])
+
+          durations[f'{format_name}_save'].append(time.perf_counter() - start_time)
+
+          start_time = time.perf_counter()
+
+          source.read([settings])
+
+          durations[f'{format_name}_load'].append(time.perf_counter() - start_time)
+
+      data_sizes[format_name] = len(Gimp.get_parasite(_PARASITE_NAME).get_data())
+  finally:
+    source.clear()
+
+  if print_results:
+    print(f'{len(_ACTION_NAMES) * num_action_copies} actions, {num_runs} runs:')
+
+    for key, key_durations in durations.items():
+      print(
+        f'{key}:'
+        f' median {statistics.median(key_durations) * 1000:.3f} ms,'
+        f' min {min(key_durations) * 1000:.3f} ms,'
+        f' max {max(key_durations) * 1000:.3f} ms')
+
+    for format_name, data_size in data_sizes.items():
+      print(f'{format_name} data size: {data_size} bytes')
+
+  return durations
+
+
+def _create_settings(num_action_copies):
+  CONFIG.PROCEDURE_GROUP = CONVERT_GROUP
+
+  try:
+    settings = plugin_settings.create_settings_for_convert()
+
+    for _index in range(num_action_copies):
+      for action_name in _ACTION_NAMES:
+        commands.add(settings['main/actions'], builtin_actions.BUILTIN_ACTIONS[action_name])
+  finally:
+    CONFIG.PROCEDURE_GROUP = CONFIG.PLUGIN_NAME
+
+  return settings
+
+
+def _get_format_context_manager(should_compress):
+  if should_compress:
+    return contextlib.nullcontext()
+  else:
+    # Data without the header are read as the legacy format.
+    return mock.patch.object(
+      setting_.GimpParasiteSource,
+      '_encode_data',
+      new=classmethod(lambda _cls, raw_data: raw_data))
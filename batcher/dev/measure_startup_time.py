@@ -0,0 +1,170 @@
+"""Measuring the time it takes to run plug-in procedures non-interactively.
+
+Each plug-in procedure runs in a separate process, hence the measured time is
+dominated by the plug-in startup (importing modules, creating settings and
+registering procedures) when there is nothing to process. Procedures can
+alternatively be run in a single plug-in process started via
+``plug-in-batch-server`` to compare the time without the plug-in startup.
+
+Run this module from the Python-Fu console in a GIMP session with no images
+opened, otherwise the Export Images and Edit and Save Images procedures will
+process the opened images.
+"""
+
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import gi
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+from gi.repository import Gio
+
+
+IMAGE_PROCEDURE_NAMES = [
+  'plug-in-batch-convert',
+  'plug-in-batch-export-images',
+  'plug-in-batch-edit-and-save-images',
+]
+
+LAYER_PROCEDURE_NAMES = [
+  'plug-in-batch-export-layers',
+  'plug-in-batch-edit-layers',
+]
+
+SERVER_PROCEDURE_NAME = 'plug-in-batch-server'
+
+PERSISTENT_PROCEDURE_NAME_SUFFIX = '-persistent'
+
+_NUM_RUNS_DEFAULT = 10
+
+_NUM_RUNS_FOR_COMPARISON_DEFAULT = 1000
+
+
+def main(
+      num_runs: int = _NUM_RUNS_DEFAULT,
+      print_results: bool = True,
+      persistent: bool = False,
+) -> Dict[str, List[float]]:
+  """Runs each plug-in procedure ``num_runs`` times in the non-interactive mode
+  and returns the duration of each run in seconds, per procedure.
+
+  If ``print_results`` is ``True``, the median, minimum and maximum duration
+  for each procedure is printed.
+
+  If ``persistent`` is ``True``, procedures are run in a single plug-in process
+  started via ``plug-in-batch-server``.
+  """
+  durations = {}
+
+  if persistent:
+    _run_server_procedure(SERVER_PROCEDURE_NAME)
+
+  try:
+    _run_procedures(durations, num_runs, persistent)
+  finally:
+    if persistent:
+      _run_server_procedure(f'{SERVER_PROCEDURE_NAME}-quit')
+
+  if print_results:
+    for procedure_name, procedure_durations in durations.items():
+      print(
+        f'{procedure_name}:'
+        f' median {statistics.median(procedure_durations):.3f} s,'
+        f' min {min(procedure_durations):.3f} s,'
+        f' max {max(procedure_durations):.3f} s')
+
+  return durations
+
+
+def compare_persistent(num_runs: int = _NUM_RUNS_FOR_COMPARISON_DEFAULT):
+  """Runs each plug-in procedure ``num_runs`` times, once with each run in a
+  separate plug-in process and once in a single plug-in process started via
+  ``plug-in-batch-server``, and prints the total duration of both.
+  """
+  durations = main(num_runs, print_results=False, persistent=False)
+  persistent_durations = main(num_runs, print_results=False, persistent=True)
+
+  for procedure_name, procedure_durations in durations.items():
+    total_duration = sum(procedure_durations)
+    total_persistent_duration = sum(persistent_durations[procedure_name])
+
+    print(
+      f'{procedure_name} ({num_runs} runs):'
+      f' separate processes {total_duration:.3f} s,'
+      f' single process {total_persistent_duration:.3f} s,'
+      f' speedup {total_duration / total_persistent_duration:.2f}x')
+
+
+def _run_procedures(durations, num_runs, persistent):
+  with tempfile.TemporaryDirectory() as temp_dirpath:
+    inputs_filepath = os.path.join(temp_dirpath, 'inputs.txt')
+    with open(inputs_filepath, 'w', encoding='utf-8'):
+      pass
+
+    for procedure_name in IMAGE_PROCEDURE_NAMES:
+      durations[procedure_name] = _run_procedure(
+        _get_procedure_name(procedure_name, persistent),
+        num_runs,
+        temp_dirpath,
+        inputs_filepath=inputs_filepath)
+
+    image = Gimp.Image.new(1, 1, Gimp.ImageBaseType.RGB)
+    layer = Gimp.Layer.new(
+      image, 'Layer', 1, 1, Gimp.ImageType.RGBA_IMAGE, 100.0, Gimp.LayerMode.NORMAL)
+    image.insert_layer(layer, None, 0)
+
+    try:
+      for procedure_name in LAYER_PROCEDURE_NAMES:
+        durations[procedure_name] = _run_procedure(
+          _get_procedure_name(procedure_name, persistent), num_runs, temp_dirpath, image=image)
+    finally:
+      image.delete()
+
+
+def _get_procedure_name(procedure_name, persistent):
+  if persistent:
+    return f'{procedure_name}{PERSISTENT_PROCEDURE_NAME_SUFFIX}'
+  else:
+    return procedure_name
+
+
+def _run_server_procedure(procedure_name):
+  procedure = Gimp.get_pdb().lookup_procedure(procedure_name)
+  procedure.run(procedure.create_config())
+
+
+def _run_procedure(
+      procedure_name: str,
+      num_runs: int,
+      output_dirpath: str,
+      image: Optional[Gimp.Image] = None,
+      inputs_filepath: Optional[str] = None,
+) -> List[float]:
+  procedure = Gimp.get_pdb().lookup_procedure(procedure_name)
+
+  durations = []
+
+  for _i in range(num_runs):
+    config = procedure.create_config()
+    config.set_property('run-mode', Gimp.RunMode.NONINTERACTIVE)
+
+    property_names = [prop.name for prop in config.list_properties()]
+
+    if 'output-directory' in property_names:
+      config.set_property('output-directory', Gio.file_new_for_path(output_dirpath))
+
+    if inputs_filepath is not None and 'inputs' in property_names:
+      config.set_property('inputs', Gio.file_new_for_path(inputs_filepath))
+
+    if image is not None:
+      config.set_property('image', image)
+      config.set_property('drawables', image.get_selected_drawables())
+
+    start_time = time.perf_counter()
+    procedure.run(config)
+    durations.append(time.perf_counter() - start_time)
+
+  return durations
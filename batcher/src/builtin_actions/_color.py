@@ -1,5 +1,6 @@
 """Built-in actions related to adjusting colors."""
 
+import os
 import re
 import struct
 
@@ -62,6 +63,9 @@ def __init__(self, curve_type=None, channel=None, samples=None, points=None):
     self.samples = samples
     self.points = points
 
+    # `Gimp.Curve` created from `samples`, reused for each processed item.
+    self.curve = None
+
 
 class LevelsData:
 
@@ -291,28 +295,8 @@ def _apply_levels_curves(
   if preset_file is None or preset_file.get_path() is None:
     raise exceptions.SkipCommand(_('Preset file not specified.'))
 
-  try:
-    with open(preset_file.get_path(), 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
-      preset_data = f.readlines()
-  except Exception:
-    file_successfully_read = False
-  else:
-    file_successfully_read = True
-
-  trc = None
-  curve_data = None
-
-  if file_successfully_read:
-    try:
-      trc, curve_data = _parse_gimp_preset(preset_data)
-    except Exception as e:
-      raise ValueError(_FAILED_TO_READ_DATA_MESSAGE) from e
-  else:
-    with open(preset_file.get_path(), 'rb') as f:
-      try:
-        trc, curve_data = _parse_photoshop_preset(f)
-      except Exception as e:
-        raise ValueError(_FAILED_TO_READ_DATA_MESSAGE) from e
+  trc, curve_data = _preset_cache.get(
+    preset_file.get_path(), _parse_gimp_preset, _parse_photoshop_preset)
 
   if utils_pdb.get_gimp_version() < (3, 2) and trc != _TRC_TYPES['linear']:
     raise ValueError(
@@ -382,20 +366,23 @@ def _apply_curves(
       continue
 
     if utils_pdb.get_gimp_version() >= (3, 2):
-      curve = Gimp.Curve.new()
+      if curve_data_for_channel.curve is None:
+        curve = Gimp.Curve.new()
+
+        if curve_data_for_channel.curve_type is not None:
+          curve.set_curve_type(Gimp.CurveType.FREE)
 
-      if curve_data_for_channel.curve_type is not None:
-        curve.set_curve_type(Gimp.CurveType.FREE)
+        max_x = len(curve_data_for_channel.samples) - 1
+        for index, sample in enumerate(curve_data_for_channel.samples):
+          curve.set_sample(index / max_x, sample)
 
-      max_x = len(curve_data_for_channel.samples) - 1
-      for index, sample in enumerate(curve_data_for_channel.samples):
-        curve.set_sample(index / max_x, sample)
+        curve_data_for_channel.curve = curve
 
       pdb.gimp__curves(
         layer,
         trc=trc,
         channel=curve_data_for_channel.channel,
-        curve=curve,
+        curve=curve_data_for_channel.curve,
         merge_filter_=not apply_non_destructively,
         blend_mode_=blend_mode,
         opacity_=opacity,
@@ -409,6 +396,74 @@ def _apply_curves(
         raise ValueError('failed to obtain curve points from file')
 
 
+class _PresetCache:
+  """Cache of parsed levels and curves presets.
+
+  A preset file is only read and parsed once for all processed items, rather
+  than for each item. A preset is parsed again if the file is modified (i.e.
+  its modification time or size changes).
+  """
+
+  def __init__(self):
+    # key: (file path, GIMP preset parser, Photoshop preset parser)
+    # value: (modification time, size, (trc, parsed data))
+    self._presets = {}
+
+  def get(self, filepath, parse_gimp_preset, parse_photoshop_preset):
+    """Returns a tuple of (TRC, parsed data) for the specified preset file.
+
+    The returned data must not be modified as it is shared between all calls
+    of this method for the same file.
+
+    If the preset cannot be parsed, `ValueError` is raised.
+    """
+    key = (filepath, parse_gimp_preset, parse_photoshop_preset)
+
+    try:
+      file_stat = os.stat(filepath)
+    except OSError:
+      file_stat = None
+
+    if file_stat is not None and key in self._presets:
+      mtime, size, parsed_preset = self._presets[key]
+      if mtime == file_stat.st_mtime_ns and size == file_stat.st_size:
+        return parsed_preset
+
+    parsed_preset = _parse_preset(filepath, parse_gimp_preset, parse_photoshop_preset)
+
+    if file_stat is not None:
+      self._presets[key] = (file_stat.st_mtime_ns, file_stat.st_size, parsed_preset)
+    else:
+      self._presets.pop(key, None)
+
+    return parsed_preset
+
+
+def _parse_preset(filepath, parse_gimp_preset, parse_photoshop_preset):
+  try:
+    with open(filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
+      preset_data = f.readlines()
+  except Exception:
+    file_successfully_read = False
+  else:
+    file_successfully_read = True
+
+  if file_successfully_read:
+    try:
+      return parse_gimp_preset(preset_data)
+    except Exception as e:
+      raise ValueError(_FAILED_TO_READ_DATA_MESSAGE) from e
+  else:
+    with open(filepath, 'rb') as f:
+      try:
+        return parse_photoshop_preset(f)
+      except Exception as e:
+        raise ValueError(_FAILED_TO_READ_DATA_MESSAGE) from e
+
+
+_preset_cache = _PresetCache()
+
+
 def _parse_gimp_levels_preset(data):
   # We create empty levels data with a fixed order of channels. When levels are
   # applied as filters, they are appended. A filter using the VALUE channel
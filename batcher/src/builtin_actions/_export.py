@@ -2,6 +2,7 @@
 
 import logging
 import os
+import stat
 from typing import Callable, Dict, Union, Tuple
 
 import gi
@@ -13,6 +14,7 @@
 from src import builtin_commands_common
 from src import constants
 from src import directory as directory_
+from src import duplicates as duplicates_
 from src import exceptions
 from src import file_formats as file_formats_
 from src import invoker as invoker_
@@ -37,8 +39,10 @@
   'INTERACTIVE_OVERWRITE_MODES',
   'FileFormatModes',
   'ExportModes',
+  'LayerHandlingModes',
   'ExportStatuses',
   'ExportAction',
+  'SharedExportImage',
   'get_export_function',
   'set_up_default_export_action',
 ]
@@ -86,6 +90,23 @@ class ExportStatuses:
   ) = (0, 1, 2, 3)
 
 
+class SharedExportImage:
+  """Image shared by consecutive export actions exporting each item
+  separately, allowing the image to be copied, rotated and merged only once per
+  item.
+
+  `image` and `layer` are ``None`` until the first of the export actions
+  prepares the image. ``is_last_export`` indicates whether the export action
+  currently being applied is the last one sharing the image. The other export
+  actions must not modify the shared image in edit mode.
+  """
+
+  def __init__(self):
+    self.image = None
+    self.layer = None
+    self.is_last_export = False
+
+
 class ExportAction(invoker_.CallableCommand):
 
   # noinspection PyAttributeOutsideInit
@@ -108,6 +129,7 @@ def _initialize(self, batcher: 'src.core.Batcher', **kwargs):
 
     self._item_uniquifier = uniquifier.ItemUniquifier()
     self._file_extension_properties = builtin_actions_utils.FileExtensionProperties('export')
+    self._export_functions = builtin_actions_utils.FileFormatFunctionCache(get_export_function)
     self._processed_parents = set()
     self._default_file_extension = self._file_extension
     self._image_copies = []
@@ -133,7 +155,10 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
     item_to_process = item
     layer_to_process = batcher.current_layer
 
-    if self._export_mode != ExportModes.EACH_ITEM and batcher.process_export:
+    # Only names are processed for a skipped item.
+    process_export = batcher.process_export and not batcher.is_current_item_skipped
+
+    if self._export_mode != ExportModes.EACH_ITEM and process_export:
       if not self._multi_layer_images:
         multi_layer_image = utils_pdb.create_empty_image_copy(batcher.current_image)
         self._multi_layer_images.append(multi_layer_image)
@@ -142,9 +167,23 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
     else:
       multi_layer_image = None
 
-    if batcher.edit_mode and batcher.process_export:
+    if multi_layer_image is None and process_export:
+      shared_export_image = batcher.shared_export_image
+    else:
+      shared_export_image = None
+
+    is_shared_image_prepared = (
+      shared_export_image is not None and shared_export_image.image is not None)
+
+    if is_shared_image_prepared:
+      image_copy = shared_export_image.image
+      layer_to_process = shared_export_image.layer
+    elif batcher.edit_mode and process_export:
       image_copy, layer_to_process = batcher.create_copy(batcher.current_image, layer_to_process)
-      self._image_copies.append(image_copy)
+      # The shared image is removed once all export actions sharing it are
+      # applied.
+      if shared_export_image is None:
+        self._image_copies.append(image_copy)
 
       if layer_to_process is None:
         layer_to_process = batcher.current_layer
@@ -153,7 +192,13 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
     else:
       image_copy = batcher.current_image
 
-    if batcher.process_export and self._rotate_flip_image_based_on_exif_metadata:
+    # There is no image to process if the output is created from the output of
+    # an identical input.
+    should_process_image = process_export and batcher.duplicate_output_filepaths is None
+
+    if (should_process_image
+        and self._rotate_flip_image_based_on_exif_metadata
+        and not is_shared_image_prepared):
       utils_pdb.rotate_or_flip_image_based_on_exif_metadata(image_copy)
 
     if multi_layer_image is None:
@@ -162,7 +207,7 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
       image_to_process = multi_layer_image
 
     if self._export_mode == ExportModes.SINGLE_IMAGE:
-      if batcher.process_export:
+      if process_export:
         layer_to_process = _merge_and_resize_image(batcher, image_copy, layer_to_process)
         layer_to_process = _copy_layer(layer_to_process, image_to_process, item)
 
@@ -176,7 +221,7 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
         else:
           item_to_process.name = item.name
     elif self._export_mode == ExportModes.EACH_TOP_LEVEL_ITEM_OR_FOLDER:
-      if batcher.process_export:
+      if process_export:
         layer_to_process = _merge_and_resize_image(batcher, image_copy, layer_to_process)
         layer_to_process = _copy_layer(layer_to_process, image_to_process, item)
 
@@ -189,10 +234,26 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
       else:
         item_to_process = current_top_level_item
     else:
-      if batcher.process_export and self._layer_handling != LayerHandlingModes.KEEP_LAYERS:
-        layer_to_process = _merge_and_resize_image(batcher, image_copy, layer_to_process)
+      if should_process_image and self._layer_handling != LayerHandlingModes.KEEP_LAYERS:
+        if not is_shared_image_prepared:
+          layer_to_process = _merge_and_resize_image(batcher, image_copy, layer_to_process)
+
+          if shared_export_image is not None:
+            shared_export_image.image = image_copy
+            shared_export_image.layer = layer_to_process
+
         if self._layer_handling == LayerHandlingModes.MERGE_AND_REMOVE_ALPHA:
-          layer_to_process = _flatten_image(image_copy, self._background_color_for_flatten)
+          if (shared_export_image is not None
+              and batcher.edit_mode
+              and not shared_export_image.is_last_export):
+            # Subsequent export actions must still obtain the image with alpha.
+            image_to_process = image_to_process.duplicate()
+            self._image_copies.append(image_to_process)
+
+          layer_to_process = _flatten_image(image_to_process, self._background_color_for_flatten)
+
+          if shared_export_image is not None and not batcher.edit_mode:
+            shared_export_image.layer = layer_to_process
 
     if batcher.process_names:
       item_to_process.save_state(builtin_actions_utils.EXPORT_NAME_ITEM_STATE)
@@ -212,7 +273,7 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
         self._default_file_extension,
         force_default_file_extension=False)
 
-    if batcher.process_export:
+    if process_export:
       if self._export_mode != ExportModes.EACH_ITEM:
         image_to_process.resize_to_layers()
 
@@ -231,6 +292,7 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
         self._file_format_export_options,
         self._default_file_extension,
         self._file_extension_properties,
+        self._export_functions,
         overwrite_chooser,
         self._use_original_modification_date,
         self._logger,
@@ -245,7 +307,7 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
             self._default_file_extension,
             force_default_file_extension=True)
 
-        if batcher.process_export:
+        if process_export:
           chosen_overwrite_mode, _unused = _export_item(
             batcher,
             item_to_process,
@@ -256,6 +318,7 @@ def _process(self, batcher: 'src.core.Batcher', **kwargs):
             self._file_format_export_options,
             self._default_file_extension,
             self._file_extension_properties,
+            self._export_functions,
             overwrite_chooser,
             self._use_original_modification_date,
             self._logger,
@@ -445,6 +508,7 @@ def _export_item(
       file_format_export_options,
       default_file_extension,
       file_extension_properties,
+      export_functions,
       overwrite_chooser,
       use_original_modification_date,
       logger,
@@ -477,21 +541,32 @@ def _export_item(
 
     _make_dirs(item, os.path.dirname(output_filepath), default_file_extension)
 
-    export_status = _export_item_once_wrapper(
-      batcher,
-      _get_run_mode(batcher, file_format_mode, file_extension, file_extension_properties),
-      item,
-      image,
-      layer,
-      output_filepath,
-      file_extension,
-      file_format_mode,
-      file_format_export_options,
-      default_file_extension,
-      file_extension_properties,
-      use_original_modification_date,
-    )
-    
+    if batcher.duplicate_output_filepaths is not None:
+      export_status = _create_output_from_duplicate(
+        batcher,
+        item,
+        output_filepath,
+        file_extension,
+        default_file_extension,
+        use_original_modification_date,
+      )
+    else:
+      export_status = _export_item_once_wrapper(
+        batcher,
+        _get_run_mode(batcher, file_format_mode, file_extension, file_extension_properties),
+        item,
+        image,
+        layer,
+        output_filepath,
+        file_extension,
+        file_format_mode,
+        file_format_export_options,
+        default_file_extension,
+        file_extension_properties,
+        export_functions,
+        use_original_modification_date,
+      )
+
     if export_status == ExportStatuses.FORCE_INTERACTIVE:
       export_status = _export_item_once_wrapper(
         batcher,
@@ -505,8 +580,13 @@ def _export_item(
         file_format_export_options,
         default_file_extension,
         file_extension_properties,
+        export_functions,
         use_original_modification_date,
       )
+
+    if export_status == ExportStatuses.EXPORT_SUCCESSFUL:
+      # noinspection PyProtectedMember
+      batcher._output_filepaths[item].append(output_filepath)
   else:
     logger.info(_('Skipping "{}"').format(output_filepath))
   
@@ -528,6 +608,45 @@ def _make_dirs(item, dirpath, default_file_extension):
       message, builtin_actions_utils.get_item_export_name(item), default_file_extension)
 
 
+def _create_output_from_duplicate(
+      batcher,
+      item,
+      output_filepath,
+      file_extension,
+      default_file_extension,
+      use_original_modification_date,
+):
+  # Output files are created in the same order as the output files of the
+  # identical input were exported.
+  # noinspection PyProtectedMember
+  output_index = len(batcher._output_filepaths[item])
+  duplicate_output_filepaths = batcher.duplicate_output_filepaths
+
+  if (output_index >= len(duplicate_output_filepaths)
+      or (fileext.get_file_extension(duplicate_output_filepaths[output_index]).lower()
+          != file_extension.lower())):
+    raise exceptions.ImageExportError(
+      _('No matching output file of an identical image is available'),
+      builtin_actions_utils.get_item_export_name(item),
+      default_file_extension)
+
+  try:
+    duplicates_.create_file_from_duplicate(
+      duplicate_output_filepaths[output_index], output_filepath, batcher.duplicate_output_mode)
+  except OSError as e:
+    raise exceptions.ImageExportError(
+      str(e), builtin_actions_utils.get_item_export_name(item), default_file_extension)
+
+  # A hard link shares the modification date with the output of the identical
+  # input.
+  if (use_original_modification_date
+      and isinstance(item, itemtree.ImageFileItem)
+      and batcher.duplicate_output_mode != duplicates_.DuplicateOutputModes.HARDLINK):
+    _set_original_modification_date(item.stat, output_filepath)
+
+  return ExportStatuses.EXPORT_SUCCESSFUL
+
+
 def _export_item_once_wrapper(
       batcher,
       run_mode,
@@ -540,6 +659,7 @@ def _export_item_once_wrapper(
       file_format_export_options,
       default_file_extension,
       file_extension_properties,
+      export_functions,
       use_original_modification_date,
 ):
   with batcher.export_context_manager(
@@ -555,6 +675,7 @@ def _export_item_once_wrapper(
       file_format_export_options,
       default_file_extension,
       file_extension_properties,
+      export_functions,
       use_original_modification_date,
     )
   
@@ -582,6 +703,7 @@ def _export_item_once(
       file_format_export_options,
       default_file_extension,
       file_extension_properties,
+      export_functions,
       use_original_modification_date,
 ):
   def _raise_image_export_error(exception):
@@ -597,6 +719,7 @@ def _raise_image_export_error(exception):
       file_extension,
       file_format_mode,
       file_format_export_options,
+      export_functions,
       use_original_modification_date,
     )
   except pypdb.PDBProcedureError as e:
@@ -627,6 +750,7 @@ def _export_image(
       file_extension: str,
       file_format_mode: str,
       file_format_export_options: Dict,
+      export_functions: builtin_actions_utils.FileFormatFunctionCache,
       use_original_modification_date: bool,
 ):
   if not isinstance(filepath, Gio.File):
@@ -634,9 +758,16 @@ def _export_image(
   else:
     image_file = filepath
 
-  export_func, kwargs = get_export_function(
+  export_func, kwargs = export_functions.get(
     file_extension, file_format_mode, file_format_export_options)
 
+  if use_original_modification_date and isinstance(item, itemtree.ImageFileItem):
+    # The file information is obtained before the export in case the original
+    # file is overwritten.
+    orig_filepath_stat = item.stat
+  else:
+    orig_filepath_stat = None
+
   export_func(
     run_mode=run_mode,
     image=image,
@@ -644,15 +775,14 @@ def _export_image(
     options=None,
     **kwargs)
 
-  if use_original_modification_date:
-    _set_original_modification_date(item, filepath)
+  if orig_filepath_stat is not None:
+    _set_original_modification_date(orig_filepath_stat, filepath)
 
   return pdb.last_status
 
 
-def _set_original_modification_date(item, filepath):
-  if isinstance(item, itemtree.ImageFileItem) and os.path.isfile(item.id):
-    orig_filepath_stat = os.stat(item.id)
+def _set_original_modification_date(orig_filepath_stat, filepath):
+  if stat.S_ISREG(orig_filepath_stat.st_mode):
     os.utime(filepath, times=(orig_filepath_stat.st_atime, orig_filepath_stat.st_mtime))
 
 
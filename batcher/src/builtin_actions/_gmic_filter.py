@@ -1,6 +1,16 @@
 """Built-in "G'MIC Filter" action."""
 
+import collections
+
+import gi
+
+gi.require_version('Gegl', '0.4')
+from gi.repository import Gegl
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+
 from src import builtin_commands_common
+from src import utils_pdb
 from src.procedure_groups import *
 
 from src.pypdb import pdb
@@ -8,17 +18,112 @@
 
 __all__ = [
   'gmic_filter',
+  'gmic_filter_for_multiple_images',
 ]
 
 
-def gmic_filter(batcher, layers, command):
+def gmic_filter(batcher, layers, command, batch_size=1):
+  """Applies a G'MIC filter to the specified layers of the current image.
+
+  ``batch_size`` is handled by `core.ImageBatcher`, which applies the filter to
+  multiple images at once via `gmic_filter_for_multiple_images()` if this is
+  the first action and ``batch_size`` is greater than 1.
+  """
+  _apply_gmic_filter(batcher.current_image, layers, command)
+
+
+def gmic_filter_for_multiple_images(images_and_layers, command):
+  """Applies a G'MIC filter to layers of multiple images in a single call to
+  G'MIC.
+
+  ``images_and_layers`` is a list of (image, list of layers) pairs.
+
+  The layers are copied to a temporary image and filtered there. The filtered
+  pixels are then written back to the original layers, which therefore remain
+  the same layers. The filter must process each layer independently of other
+  layers. Group layers are not supported.
+
+  Layers from images with a different base type or precision are filtered in
+  separate calls to G'MIC to avoid a loss of quality.
+  """
+  if not command.strip():
+    return
+
+  layers_per_image_type = collections.defaultdict(list)
+
+  for image, layers in images_and_layers:
+    layers_per_image_type[(image.get_base_type(), image.get_precision())].extend(layers)
+
+  for (base_type, precision), layers in layers_per_image_type.items():
+    if layers:
+      _apply_gmic_filter_to_layer_copies(layers, command, base_type, precision)
+
+
+def _apply_gmic_filter_to_layer_copies(layers, command, base_type, precision):
+  working_image = Gimp.Image.new_with_precision(
+    max(layer.get_width() for layer in layers),
+    max(layer.get_height() for layer in layers),
+    base_type,
+    precision)
+  working_image.undo_freeze()
+
+  try:
+    layer_copies = []
+    for layer in layers:
+      layer_copy = utils_pdb.copy_and_paste_layer(layer, working_image, None, len(layer_copies))
+      layer_copy.set_offsets(0, 0)
+      layer_copies.append(layer_copy)
+
+    _apply_gmic_filter(working_image, layer_copies, command)
+
+    working_layers = working_image.get_layers()
+    if len(working_layers) != len(layers):
+      raise ValueError(
+        _("The G'MIC filter changed the number of layers and cannot be applied to multiple"
+          ' images at once. Set "{}" to 1.').format(_('Number of images per call')))
+
+    for layer, working_layer in zip(layers, working_layers):
+      _copy_pixels(working_layer, layer)
+  finally:
+    working_image.delete()
+
+
+def _copy_pixels(source_layer, layer):
+  width = source_layer.get_width()
+  height = source_layer.get_height()
+
+  if layer.get_width() != width or layer.get_height() != height:
+    layer.resize(width, height, 0, 0)
+
+  if source_layer.has_alpha() and not layer.has_alpha():
+    layer.add_alpha()
+
+  rect = Gegl.Rectangle.new(0, 0, width, height)
+
+  # Writing to the shadow buffer and merging it makes the change undoable like
+  # any other filter applied to the layer.
+  shadow_buffer = layer.get_shadow_buffer()
+  source_layer.get_buffer().copy(rect, Gegl.AbyssPolicy.NONE, shadow_buffer, rect)
+  shadow_buffer.flush()
+
+  layer.merge_shadow(True)
+  layer.update(0, 0, width, height)
+
+
+def _apply_gmic_filter(image, layers, command):
+  # Each call to G'MIC starts the G'MIC plug-in and its interpreter, which may
+  # take considerably more time than applying the filter itself. We therefore
+  # avoid calls that would have no effect.
+  if not layers or not command.strip():
+    return
+
   if len(layers) == 1:
     input_ = 1
   else:
     input_ = 2
 
   pdb.plug_in_gmic_qt(
-    image=batcher.current_image,
+    image=image,
     drawables=layers,
     input=input_,
     output=0,
@@ -67,6 +172,19 @@ def _set_display_name_for_gmic_filter(gmic_command_setting, action):
       'default_value': '',
       'display_name': _('Command'),
     },
+    {
+      'type': 'int',
+      'name': 'batch_size',
+      'default_value': 1,
+      'display_name': _('Number of images per call'),
+      'description': _(
+        "Set this to a value greater than 1 to apply the filter to multiple images"
+        " in a single call to G'MIC, which avoids starting G'MIC for each image."
+        " This only takes effect if this is the first action."
+        " Use only with filters processing each layer independently."
+        " This has no effect in previews and when editing images in GIMP."),
+      'min_value': 1,
+    },
   ],
   'available': lambda _command_dict: 'plug_in_gmic_qt' in pdb,
   'after_add_handler': _on_after_add_gmic_filter_action,
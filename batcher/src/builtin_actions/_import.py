@@ -6,6 +6,7 @@
 gi.require_version('Gimp', '3.0')
 from gi.repository import Gimp
 from gi.repository import Gio
+from gi.repository import GLib
 
 from src import exceptions
 from src import file_formats as file_formats_
@@ -15,6 +16,8 @@
 from src.path import fileext
 from src.pypdb import pdb
 
+from . import _utils as builtin_actions_utils
+
 __all__ = [
   'ImportAction',
 ]
@@ -28,26 +31,58 @@ def _initialize(
         batcher: 'src.core.Batcher',
         image_file: Gio.File,
         file_format_import_options: Optional[Dict] = None,
+        reduced_size: Optional[int] = None,
+        get_scaled_size: Optional[Callable[[int, int], Optional[Tuple[int, int]]]] = None,
   ):
-    pass
+    self._import_functions = builtin_actions_utils.FileFormatFunctionCache(get_import_function)
+    self._thumbnail_import_functions = builtin_actions_utils.FileFormatFunctionCache(
+      get_thumbnail_import_function)
 
   def _process(
         self,
         batcher: 'src.core.Batcher',
         image_file: Gio.File,
         file_format_import_options: Optional[Dict] = None,
+        reduced_size: Optional[int] = None,
+        get_scaled_size: Optional[Callable[[int, int], Optional[Tuple[int, int]]]] = None,
   ):
+    """Loads an image from ``image_file``.
+
+    If ``reduced_size`` is specified, the image is loaded at a reduced size if
+    the file format provides a way to do so (e.g. a thumbnail or an embedded
+    preview), with ``reduced_size`` being the requested size of the larger
+    side. ``get_scaled_size`` must then be a function returning the size the
+    image would be scaled to right after loading given the image width and
+    height, or ``None`` if the image would not be scaled.
+
+    The image loaded at a reduced size is only used if scaling it results in
+    the same size as scaling the image loaded at full size, without scaling the
+    reduced image up. Otherwise, the image is loaded at full size.
+    """
     if not image_file.query_exists():
       raise exceptions.BatcherFileNotFoundError(_('File not found'), image_file.get_path())
 
     if file_format_import_options is None:
       file_format_import_options = {}
 
-    image = _load_image(
-      batcher,
-      image_file,
-      file_format_import_options,
-    )
+    image = None
+
+    if reduced_size is not None and get_scaled_size is not None:
+      image = _load_image_at_reduced_size(
+        batcher,
+        image_file,
+        reduced_size,
+        get_scaled_size,
+        self._thumbnail_import_functions,
+      )
+
+    if image is None:
+      image = _load_image(
+        batcher,
+        image_file,
+        file_format_import_options,
+        self._import_functions,
+      )
 
     if image is not None and batcher.is_preview:
       utils_pdb.rotate_or_flip_image_based_on_exif_metadata(image)
@@ -59,6 +94,7 @@ def _load_image(
       batcher,
       image_file,
       file_format_import_options,
+      import_functions,
 ):
   file_extension = fileext.get_file_extension(batcher.current_item.orig_name.lower())
 
@@ -67,6 +103,7 @@ def _load_image(
       image_file,
       file_extension,
       file_format_import_options,
+      import_functions,
     )
   except pypdb.PDBProcedureError as e:
     if e.status == Gimp.PDBStatusType.CANCEL:
@@ -77,12 +114,87 @@ def _load_image(
     return image
 
 
+def _load_image_at_reduced_size(
+      batcher,
+      image_file,
+      reduced_size,
+      get_scaled_size,
+      thumbnail_import_functions,
+):
+  file_extension = fileext.get_file_extension(batcher.current_item.orig_name.lower())
+
+  thumbnail_import_func, _kwargs = thumbnail_import_functions.get(file_extension)
+  if thumbnail_import_func is None:
+    return None
+
+  try:
+    result = thumbnail_import_func(file=image_file, thumb_size=reduced_size)
+  except pypdb.PDBProcedureError:
+    return None
+
+  if not isinstance(result, list) or len(result) < 3:
+    return None
+
+  image, orig_width, orig_height = result[:3]
+
+  if image is None:
+    return None
+
+  if _is_reduced_image_sufficient(image, orig_width, orig_height, get_scaled_size):
+    if image.get_file() is None:
+      image.set_file(image_file)
+
+    # Images loaded at a reduced size lack metadata, including the Exif
+    # orientation required to rotate or flip the image on export.
+    _set_metadata_from_file(image, image_file)
+
+    return image
+  else:
+    image.delete()
+    return None
+
+
+def _set_metadata_from_file(image, image_file):
+  try:
+    metadata = Gimp.Metadata.load_from_file(image_file)
+  except GLib.Error:
+    # The file format does not support metadata.
+    return
+
+  if metadata is not None:
+    image.set_metadata(metadata)
+
+
+def _is_reduced_image_sufficient(image, orig_width, orig_height, get_scaled_size):
+  width = image.get_width()
+  height = image.get_height()
+
+  if orig_width <= 0 or orig_height <= 0 or width > orig_width or height > orig_height:
+    return False
+
+  # Allow for the reduced size being rounded to whole pixels.
+  if abs(width * orig_height - height * orig_width) > max(orig_width, orig_height):
+    return False
+
+  scaled_size = get_scaled_size(orig_width, orig_height)
+  if scaled_size is None:
+    return False
+
+  scaled_width, scaled_height = scaled_size
+
+  return (
+    width >= scaled_width
+    and height >= scaled_height
+    and get_scaled_size(width, height) == scaled_size)
+
+
 def _import_image(
       image_file,
       file_extension,
       file_format_import_options,
+      import_functions,
 ):
-  import_func, kwargs = get_import_function(file_extension, file_format_import_options)
+  import_func, kwargs = import_functions.get(file_extension, file_format_import_options)
 
   return import_func(
     run_mode=Gimp.RunMode.NONINTERACTIVE,
@@ -113,6 +225,28 @@ def get_import_function(
   return pdb.gimp_file_load, {}
 
 
+def get_thumbnail_import_function(file_extension: str) -> Tuple[Optional[Callable], Dict]:
+  """Returns the procedure loading a reduced-size image (thumbnail) given the
+  file extension, along with empty keyword arguments.
+
+  If the file extension is not recognized or the file format does not provide
+  a thumbnail procedure, ``None`` is returned in place of the procedure.
+  """
+  if file_extension in file_formats_.FILE_FORMATS_DICT:
+    file_format = file_formats_.FILE_FORMATS_DICT[file_extension]
+    if file_format.has_import_proc():
+      import_proc = pdb[file_format.import_procedure_name]
+
+      if (isinstance(import_proc, pypdb.GimpPDBProcedure)
+          and isinstance(import_proc.proc, Gimp.LoadProcedure)):
+        thumbnail_proc_name = import_proc.proc.get_thumbnail_loader()
+
+        if thumbnail_proc_name and thumbnail_proc_name in pdb:
+          return pdb[thumbnail_proc_name], {}
+
+  return None, {}
+
+
 IMPORT_DICT = {
   'name': 'import',
   'function': ImportAction,
@@ -1,5 +1,7 @@
 """Built-in "Insert Overlay (Watermark)" action."""
 
+import collections
+import logging
 import os
 
 import gi
@@ -45,6 +47,9 @@ class ContentType:
 
 class InsertOverlayAction(invoker_.CallableCommand):
 
+  _MAX_NUM_CACHED_IMAGES = 16
+  _MAX_CACHED_IMAGES_SIZE_BYTES = 512 * 1024 * 1024
+
   # noinspection PyAttributeOutsideInit
   def _initialize(self, batcher, **kwargs):
     self._insert_content = ContentType.FILE
@@ -97,7 +102,8 @@ def _initialize(self, batcher, **kwargs):
     self._assign_to_attributes_from_kwargs(kwargs)
 
     self._image_copies = []
-    self._image_copies_for_pattern = []
+    self._image_cache_for_pattern = _ImageCache(
+      self._MAX_NUM_CACHED_IMAGES, self._MAX_CACHED_IMAGES_SIZE_BYTES)
     self._image_file_renamer = renamer_.ItemRenamer(
       self._image_file_pattern,
       fields_raw=dict(renamer_.get_fields(), **renamer_.get_fields(regexes=['image file']))
@@ -108,15 +114,10 @@ def _initialize(self, batcher, **kwargs):
     )
 
     batcher.invoker.add(self._delete_images_on_cleanup, ['cleanup_contents'], [self._image_copies])
-    batcher.invoker.add(
-      self._delete_images_on_cleanup,
-      ['cleanup_contents'],
-      [self._image_copies_for_pattern])
-    # Also delete each loaded image during processing to minimize memory usage.
-    batcher.invoker.add(
-      self._delete_images_on_cleanup,
-      ['after_process_item_contents'],
-      [self._image_copies_for_pattern])
+    # Images loaded via a pattern are kept across items as patterns usually
+    # resolve to a few distinct files. The number of kept images and their
+    # memory usage are bounded by the cache.
+    batcher.invoker.add(self._clear_image_cache_on_cleanup, ['cleanup_contents'])
 
     # noinspection PyUnresolvedReferences
     if (self._insert_content == ContentType.FILE
@@ -164,7 +165,8 @@ def _process(self, batcher, **kwargs):
         image_filepath = self._image_file_renamer.rename(batcher)
         image_file = Gio.file_new_for_path(image_filepath)
         if image_file.get_path() is not None and os.path.exists(image_file.get_path()):
-          image_to_insert = self._load_image(image_file, self._image_copies_for_pattern)
+          image_to_insert = self._image_cache_for_pattern.get(
+            image_file.get_path(), lambda: self._load_image(image_file))
         else:
           raise exceptions.SkipCommand(_('Image file "{}" does not exist.').format(image_filepath))
       else:
@@ -231,13 +233,22 @@ def _delete_images_on_cleanup(_batcher, images):
 
     images.clear()
 
+  def _clear_image_cache_on_cleanup(self, batcher):
+    if not batcher.is_preview and self._image_cache_for_pattern.num_misses > 0:
+      logging.getLogger(constants.LOGGER_NAME).info(
+        _('Insert Overlay (Watermark): {} image(s) loaded, {} time(s) reused').format(
+          self._image_cache_for_pattern.num_misses, self._image_cache_for_pattern.num_hits))
+
+    self._image_cache_for_pattern.clear()
+
   @staticmethod
-  def _load_image(image_file, image_copies):
+  def _load_image(image_file, image_copies=None):
     image_to_insert = pdb.gimp_file_load(
       run_mode=Gimp.RunMode.NONINTERACTIVE,
       file=image_file)
 
-    image_copies.append(image_to_insert)
+    if image_copies is not None:
+      image_copies.append(image_to_insert)
 
     return image_to_insert
 
@@ -788,6 +799,79 @@ def _get_color_tag_name(color_tag, color_tag_tree_model):
   return color_tag_tree_model[int(color_tag)][1]
 
 
+class _ImageCache:
+  """Least recently used cache of images loaded from files.
+
+  An image is identified by its file path, modification time and file size,
+  so that a file modified during processing is loaded again.
+
+  The cache is bounded by the number of images and the estimated memory
+  occupied by the images. Images exceeding the bounds are deleted, starting
+  from the least recently used image. The most recently used image is always
+  kept.
+  """
+
+  def __init__(self, max_num_images, max_size_bytes):
+    self._max_num_images = max_num_images
+    self._max_size_bytes = max_size_bytes
+
+    # key: (file path, modification time, file size); value: (image, size)
+    self._images = collections.OrderedDict()
+    self._size_bytes = 0
+
+    self.num_hits = 0
+    self.num_misses = 0
+
+  def get(self, filepath, load_image_func):
+    """Returns an image loaded from ``filepath``.
+
+    If the image is not cached, ``load_image_func`` is called to load the
+    image. ``load_image_func`` takes no arguments.
+    """
+    file_stat = os.stat(filepath)
+    key = (os.path.abspath(filepath), file_stat.st_mtime_ns, file_stat.st_size)
+
+    if key in self._images:
+      image, _image_size_bytes = self._images[key]
+      if image.is_valid():
+        self._images.move_to_end(key)
+        self.num_hits += 1
+        return image
+      else:
+        self._remove(key)
+
+    self.num_misses += 1
+
+    image = load_image_func()
+    image_size_bytes = self._get_image_size_bytes(image)
+
+    self._images[key] = (image, image_size_bytes)
+    self._size_bytes += image_size_bytes
+
+    while (len(self._images) > 1
+           and (len(self._images) > self._max_num_images
+                or self._size_bytes > self._max_size_bytes)):
+      self._remove(next(iter(self._images)))
+
+    return image
+
+  def clear(self):
+    """Deletes all cached images."""
+    while self._images:
+      self._remove(next(iter(self._images)))
+
+  def _remove(self, key):
+    image, image_size_bytes = self._images.pop(key)
+    self._size_bytes -= image_size_bytes
+
+    utils_pdb.try_delete_image(image)
+
+  @staticmethod
+  def _get_image_size_bytes(image):
+    return sum(
+      layer.get_width() * layer.get_height() * layer.get_bpp() for layer in image.get_layers())
+
+
 INSERT_OVERLAY_FOR_IMAGES_DICT = {
   'name': 'insert_overlay_for_images',
   'function': InsertOverlayAction,
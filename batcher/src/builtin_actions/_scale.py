@@ -19,6 +19,8 @@
   'ScaleModes',
   'ScaleConditions',
   'scale',
+  'get_scaled_size',
+  'get_scaled_size_for_original_size',
 ]
 
 
@@ -71,14 +73,6 @@ def scale(
       scale_condition_width,
       scale_condition_height,
 ):
-  orig_width_pixels = object_to_scale.get_width()
-  if orig_width_pixels == 0:
-    orig_width_pixels = 1
-
-  orig_height_pixels = object_to_scale.get_height()
-  if orig_height_pixels == 0:
-    orig_height_pixels = 1
-
   if set_image_resolution:
     processed_resolution_x = image_resolution['x'] if image_resolution['x'] > 0 else 1.0
     processed_resolution_y = image_resolution['y'] if image_resolution['y'] > 0 else 1.0
@@ -88,6 +82,148 @@ def scale(
     elif isinstance(object_to_scale, Gimp.Item):
       object_to_scale.get_image().set_resolution(processed_resolution_x, processed_resolution_y)
 
+  new_sizes = _get_new_sizes(
+    batcher,
+    object_to_scale,
+    object_to_scale.get_width(),
+    object_to_scale.get_height(),
+    scale_mode,
+    new_width,
+    new_height,
+    scale_condition,
+    scale_condition_width,
+    scale_condition_height,
+  )
+
+  if new_sizes is None:
+    return
+
+  new_width_pixels, new_height_pixels, processed_width_pixels, processed_height_pixels = new_sizes
+
+  Gimp.context_push()
+  Gimp.context_set_interpolation(interpolation)
+
+  if isinstance(object_to_scale, Gimp.Image):
+    object_to_scale.scale(processed_width_pixels, processed_height_pixels)
+  else:
+    object_to_scale.scale(processed_width_pixels, processed_height_pixels, local_origin)
+
+  if scale_mode == ScaleModes.FIT_WITH_PADDING:
+    _fill_with_padding(
+      batcher,
+      object_to_scale,
+      new_width_pixels,
+      new_height_pixels,
+      padding_color,
+      padding_position,
+      padding_position_custom,
+    )
+
+  Gimp.context_pop()
+
+
+def get_scaled_size(
+      batcher,
+      object_to_scale,
+      scale_mode,
+      new_width,
+      new_height,
+      scale_condition,
+      scale_condition_width,
+      scale_condition_height,
+      **_kwargs,
+):
+  """Returns the width and height in pixels ``object_to_scale`` would have
+  after calling `scale()` with the specified arguments, without scaling the
+  object.
+
+  ``None`` is returned if `scale()` would not scale the object due to
+  ``scale_condition``.
+
+  For `ScaleModes.FIT_WITH_PADDING`, the size before adding the padding is
+  returned. The image resolution set by `scale()` is not taken into account,
+  i.e. the current image resolution is used for units other than pixels and
+  percentages.
+
+  Additional keyword arguments accepted by `scale()` are ignored.
+  """
+  new_sizes = _get_new_sizes(
+    batcher,
+    object_to_scale,
+    object_to_scale.get_width(),
+    object_to_scale.get_height(),
+    scale_mode,
+    new_width,
+    new_height,
+    scale_condition,
+    scale_condition_width,
+    scale_condition_height,
+  )
+
+  if new_sizes is not None:
+    return new_sizes[2], new_sizes[3]
+  else:
+    return None
+
+
+def get_scaled_size_for_original_size(
+      batcher,
+      orig_width,
+      orig_height,
+      scale_mode,
+      new_width,
+      new_height,
+      scale_condition,
+      scale_condition_width,
+      scale_condition_height,
+      **_kwargs,
+):
+  """Returns the width and height in pixels an object of the specified
+  original size would have after calling `scale()` with the specified
+  arguments.
+
+  This function behaves the same way as `get_scaled_size()`, except that no
+  object needs to exist. Therefore, ``new_width``, ``new_height`` and, if
+  applicable, ``scale_condition_width`` and ``scale_condition_height`` must not
+  be specified as percentages.
+  """
+  new_sizes = _get_new_sizes(
+    batcher,
+    None,
+    orig_width,
+    orig_height,
+    scale_mode,
+    new_width,
+    new_height,
+    scale_condition,
+    scale_condition_width,
+    scale_condition_height,
+  )
+
+  if new_sizes is not None:
+    return new_sizes[2], new_sizes[3]
+  else:
+    return None
+
+
+def _get_new_sizes(
+      batcher,
+      object_to_scale,
+      orig_width_pixels,
+      orig_height_pixels,
+      scale_mode,
+      new_width,
+      new_height,
+      scale_condition,
+      scale_condition_width,
+      scale_condition_height,
+):
+  if orig_width_pixels == 0:
+    orig_width_pixels = 1
+
+  if orig_height_pixels == 0:
+    orig_height_pixels = 1
+
   if new_width['unit'] == '%':
     percent_object_for_width = object_to_scale
   else:
@@ -136,7 +272,7 @@ def scale(
     )
 
   if not can_scale:
-    return
+    return None
 
   if scale_mode in [ScaleModes.KEEP_ADJUST_WIDTH, ScaleModes.KEEP_ADJUST_HEIGHT]:
     processed_width_pixels, processed_height_pixels = _get_scale_keep_aspect_ratio_values(
@@ -152,32 +288,13 @@ def scale(
     processed_width_pixels = new_width_pixels
     processed_height_pixels = new_height_pixels
 
-  Gimp.context_push()
-  Gimp.context_set_interpolation(interpolation)
-
   if processed_width_pixels == 0:
     processed_width_pixels = 1
 
   if processed_height_pixels == 0:
     processed_height_pixels = 1
 
-  if isinstance(object_to_scale, Gimp.Image):
-    object_to_scale.scale(processed_width_pixels, processed_height_pixels)
-  else:
-    object_to_scale.scale(processed_width_pixels, processed_height_pixels, local_origin)
-
-  if scale_mode == ScaleModes.FIT_WITH_PADDING:
-    _fill_with_padding(
-      batcher,
-      object_to_scale,
-      new_width_pixels,
-      new_height_pixels,
-      padding_color,
-      padding_position,
-      padding_position_custom,
-    )
-
-  Gimp.context_pop()
+  return new_width_pixels, new_height_pixels, processed_width_pixels, processed_height_pixels
 
 
 def _can_scale(
@@ -1,7 +1,7 @@
 """Utility functions used within the `builtin_actions` package."""
 
-from typing import Union
-import collections
+from collections.abc import Hashable
+from typing import Callable, Dict, Tuple, Union
 import math
 import os
 
@@ -368,6 +368,10 @@ class FileExtensionProperties:
   `_FileExtension` instances.
 
   File extension as a key is always converted to lowercase.
+
+  File extensions are processed only when accessed for the first time as
+  checking whether a file format procedure exists for all file formats on each
+  batch run (including each preview update) would be slow.
   """
   def __init__(self, import_or_export):
     if import_or_export not in ['import', 'export']:
@@ -375,21 +379,61 @@ def __init__(self, import_or_export):
 
     self._import_or_export = import_or_export
 
-    self._properties = collections.defaultdict(_FileExtension)
+    self._properties = {}
+
+  def __getitem__(self, key):
+    processed_key = key.lower()
 
-    for file_format in file_formats_.FILE_FORMATS:
-      if self._import_or_export == 'import' and not file_format.has_import_proc():
-        continue
+    if processed_key not in self._properties:
+      self._add_properties(processed_key)
 
-      if self._import_or_export == 'export' and not file_format.has_export_proc():
-        continue
+    return self._properties[processed_key]
 
+  def _add_properties(self, file_extension):
+    file_format = file_formats_.FILE_FORMATS_DICT.get(file_extension, None)
+
+    if (file_format is not None
+        and file_formats_.file_format_procedure_exists(file_extension, self._import_or_export)):
       # This ensures that the file format dialog will be displayed only once per
       # file format if multiple file extensions for the same format are used
       # (e.g. 'jpg', 'jpeg' or 'jpe' for the JPEG format).
       extension_properties = _FileExtension()
-      for file_extension in file_format.file_extensions:
-        self._properties[file_extension.lower()] = extension_properties
+      for format_file_extension in file_format.file_extensions:
+        self._properties.setdefault(format_file_extension.lower(), extension_properties)
 
-  def __getitem__(self, key):
-    return self._properties[key.lower()]
+    if file_extension not in self._properties:
+      self._properties[file_extension] = _FileExtension()
+
+
+class FileFormatFunctionCache:
+  """Cache of file import or export procedures and their keyword arguments
+  (file format options) per file extension.
+
+  Obtaining the procedure requires checking whether it exists and obtaining
+  the keyword arguments requires converting each file format option to a value
+  accepted by the procedure. Doing so for each processed item would be wasteful.
+
+  An instance is meant to be used during a single batch run, during which the
+  file format options are not modified. A new instance is thus created for
+  each batch run, reflecting changes to the options between runs.
+  """
+
+  def __init__(self, get_function: Callable[..., Tuple[Callable, Dict]]):
+    self._get_function = get_function
+
+    self._functions_and_kwargs = {}
+
+  def get(self, file_extension: str, *args) -> Tuple[Callable, Dict]:
+    """Returns a tuple of (procedure, keyword arguments) for the specified file
+    extension, as returned by the function passed to ``__init__()``.
+
+    ``file_extension`` and ``args`` are passed to the function if there is no
+    cached result. Arguments that cannot be hashed (e.g. file format options)
+    are distinguished by their identity.
+    """
+    key = (file_extension, *(arg if isinstance(arg, Hashable) else id(arg) for arg in args))
+
+    if key not in self._functions_and_kwargs:
+      self._functions_and_kwargs[key] = self._get_function(file_extension, *args)
+
+    return self._functions_and_kwargs[key]
@@ -58,13 +58,15 @@
 * ``'after-clear-commands'``: invoked when calling `clear()` after clearing
   commands.
 """
+import json
+import os
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union, Tuple
 
 import gi
 gi.require_version('Gimp', '3.0')
 from gi.repository import Gimp
 
-from src import _gegl_operations_custom_attributes
+from src import constants
 from src import pypdb
 from src import setting as setting_
 from src import settings_from_pdb
@@ -93,6 +95,10 @@
 
 _COMMANDS_AND_INITIAL_COMMAND_DICTS = {}
 
+_GEGL_OPERATIONS_CUSTOM_ATTRIBUTES_FILENAME = '_gegl_operations_custom_attributes.json'
+
+_gegl_operations_custom_attributes = None
+
 
 def create(
       name: str,
@@ -799,7 +805,7 @@ def _get_hard_coded_command_attributes(sanitized_pdb_procedure_name):
 
 
 def _add_hard_coded_gui_type_kwargs(pdb_procedure_name, arguments):
-  custom_attributes_dict = _gegl_operations_custom_attributes.GEGL_OPERATIONS_AND_CUSTOM_ATTRIBUTES
+  custom_attributes_dict = _get_gegl_operations_custom_attributes()
 
   if pdb_procedure_name in custom_attributes_dict:
     attributes = custom_attributes_dict[pdb_procedure_name]
@@ -809,6 +815,22 @@ def _add_hard_coded_gui_type_kwargs(pdb_procedure_name, arguments):
         argument_dict.update(**utils.semi_deep_copy(attributes[argument_dict['name']]))
 
 
+def _get_gegl_operations_custom_attributes():
+  # The custom attributes are loaded on first use only since they are needed
+  # only when creating commands from GEGL operations.
+  global _gegl_operations_custom_attributes
+
+  if _gegl_operations_custom_attributes is None:
+    filepath = os.path.join(
+      os.path.dirname(utils.get_current_module_filepath()),
+      _GEGL_OPERATIONS_CUSTOM_ATTRIBUTES_FILENAME)
+
+    with open(filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
+      _gegl_operations_custom_attributes = json.load(f)
+
+  return _gegl_operations_custom_attributes
+
+
 def reorder(commands: setting_.Group, command_name: str, new_position: int):
   """Modifies the position a command to the new position.
 
@@ -21,9 +21,11 @@
 from src import commands
 from src import constants
 from src import directory as directory_
+from src import duplicates as duplicates_
 from src import exceptions
 from src import invoker as invoker_
 from src import itemtree
+from src import manifest as manifest_
 from src import overwrite
 from src import placeholders
 from src import progress as progress_
@@ -31,6 +33,7 @@
 from src import setting as setting_
 from src import utils
 from src import utils_pdb
+from src.path import fileext
 from src.pypdb import pdb
 
 
@@ -42,6 +45,38 @@
 DEFAULT_EXPORT_ACTION_TAG = 'default_export_action'
 DEFAULT_RENAME_ACTION_TAG = 'default_rename_action'
 
+_ORIENTATION_ACTION_NAMES = (
+  'flip_horizontally_for_images',
+  'flip_vertically_for_images',
+  'rotate_for_images',
+)
+
+_POINTWISE_ACTION_NAMES = (
+  'brightness_contrast',
+  'color_balance',
+  'hue_saturation',
+  'levels',
+  'curves',
+)
+
+_SCALE_ACTION_NAMES = (
+  'scale_for_images',
+  'scale_for_layers',
+)
+
+# Number of clockwise rotations by 90 degrees
+_NUM_ROTATIONS_PER_ANGLE = {
+  builtin_actions.Angles.DEGREES_90: 1,
+  builtin_actions.Angles.DEGREES_180: 2,
+  builtin_actions.Angles.DEGREES_270: 3,
+}
+
+_ROTATION_TYPES = {
+  1: Gimp.RotationType.DEGREES90,
+  2: Gimp.RotationType.DEGREES180,
+  3: Gimp.RotationType.DEGREES270,
+}
+
 
 class Batcher(metaclass=abc.ABCMeta):
   """Abstract class for batch-processing items with a sequence of commands
@@ -74,6 +109,12 @@ def __init__(
         export_context_manager_kwargs: Optional[Dict] = None,
         keep_image_copies: bool = False,
         prompt_to_continue_on_error_func: Optional[Callable] = None,
+        apply_pointwise_actions_after_downscaling: bool = False,
+        import_at_reduced_size: bool = False,
+        manifest_filepath: Optional[str] = None,
+        rebuild_all: bool = False,
+        deduplicate_inputs: bool = False,
+        duplicate_output_mode: str = duplicates_.DuplicateOutputModes.COPY,
   ):
     self._item_tree = item_tree
     self._actions = actions
@@ -99,6 +140,12 @@ def __init__(
     self._export_context_manager_kwargs = export_context_manager_kwargs
     self._keep_image_copies = keep_image_copies
     self._prompt_to_continue_on_error_func = prompt_to_continue_on_error_func
+    self._apply_pointwise_actions_after_downscaling = apply_pointwise_actions_after_downscaling
+    self._import_at_reduced_size = import_at_reduced_size
+    self._manifest_filepath = manifest_filepath
+    self._rebuild_all = rebuild_all
+    self._deduplicate_inputs = deduplicate_inputs
+    self._duplicate_output_mode = duplicate_output_mode
 
     self._current_item = None
     self._current_image = None
@@ -109,17 +156,23 @@ def __init__(
     self._matching_items = None
     self._matching_items_and_parents = None
     self._exported_items = []
+    self._output_filepaths = collections.defaultdict(list)
     self._num_processed_items = 0
     self._num_total_items = 0
 
     self._image_copies = []
     self._orig_images_and_selected_layers = {}
 
+    self._skipped_items = []
     self._skipped_actions = collections.defaultdict(list)
     self._skipped_conditions = collections.defaultdict(list)
     self._failed_actions = collections.defaultdict(list)
     self._failed_conditions = collections.defaultdict(list)
 
+    self._duplicate_output_filepaths = None
+    self._shared_export_image = None
+    self._is_current_item_skipped = False
+
     self._should_stop = False
 
     self._invoker = None
@@ -396,10 +449,19 @@ def exported_items(self) -> List[itemtree.Item]:
     """
     return list(self._exported_items)
 
+  @property
+  def output_filepaths(self) -> Dict[itemtree.Item, List[str]]:
+    """Paths to files successfully exported during processing, per item.
+
+    The item is the one passed to the export, which may differ from the
+    processed item if multiple items are exported to a single image.
+    """
+    return dict(self._output_filepaths)
+
   @property
   def num_processed_items(self) -> int:
     """The number of successfully processed items after the last call to
-    `run()`.
+    `run()`, excluding `skipped_items`.
     """
     return self._num_processed_items
 
@@ -426,6 +488,107 @@ def prompt_to_continue_on_error_func(self):
     """
     return self._prompt_to_continue_on_error_func
 
+  @property
+  def apply_pointwise_actions_after_downscaling(self) -> bool:
+    """If ``True``, color adjustment actions (e.g. Brightness-Contrast, Levels,
+    Curves) immediately preceding a Scale action are applied after the Scale
+    action if the object is scaled down.
+
+    Adjusting colors after scaling down processes fewer pixels and is thus
+    faster. However, the result is only approximately identical to applying the
+    actions in the original order, hence this is ``False`` by default.
+    """
+    return self._apply_pointwise_actions_after_downscaling
+
+  @property
+  def import_at_reduced_size(self) -> bool:
+    """If ``True`` and the first action scales the image down to a size
+    specified in pixels, image files are loaded at a reduced size if the file
+    format allows it (e.g. via a thumbnail or an embedded preview).
+
+    The reduced-size image is only used if scaling it results in the same image
+    size as scaling the full-size image. Otherwise, the image is loaded at full
+    size. Loading images at a reduced size is faster. However, the image may be
+    of lower quality than the scaled full-size image, and may lack metadata,
+    hence this is ``False`` by default.
+
+    This only applies to `ImageBatcher`.
+    """
+    return self._import_at_reduced_size
+
+  @property
+  def manifest_filepath(self) -> Optional[str]:
+    """Path to a file recording processed inputs (see `manifest.Manifest`).
+
+    If not ``None``, inputs are recorded in the file after being processed.
+    Inputs that did not change since the last run, along with the settings
+    (actions, conditions, output folder, etc.) and the output files, are
+    skipped before being loaded. Skipped inputs are available via
+    `skipped_items`.
+
+    Inputs are only skipped if each input is exported to separate files, i.e.
+    not if multiple inputs are exported to a single image.
+
+    Actions processing names are still applied to skipped inputs (see
+    `is_current_item_skipped`).
+
+    This only applies to `ImageBatcher` and is ignored for previews.
+    """
+    return self._manifest_filepath
+
+  @property
+  def rebuild_all(self) -> bool:
+    """If ``True``, all inputs are processed even if they are recorded as
+    unchanged in `manifest_filepath`. The records are updated nevertheless.
+    """
+    return self._rebuild_all
+
+  @property
+  def deduplicate_inputs(self) -> bool:
+    """If ``True``, input files with contents identical to a previously
+    processed input file are not loaded and processed again.
+
+    Instead, only actions affecting names (e.g. renaming) are applied to such
+    an input, and each output file is created from the corresponding output file
+    of the previously processed input (see `duplicate_output_mode`). Output
+    names and conflicting files are handled the same way as for other inputs.
+
+    Inputs are only deduplicated if each input is exported to separate files,
+    i.e. not if multiple inputs are exported to a single image. Actions whose
+    result depends on the input file path (e.g. inserting text containing the
+    image name) should not be used with this option.
+
+    This only applies to `ImageBatcher` and is ignored for previews.
+    """
+    return self._deduplicate_inputs
+
+  @property
+  def duplicate_output_mode(self) -> str:
+    """One of the `duplicates.DuplicateOutputModes` values determining how
+    output files are created for inputs identical to a previously processed
+    input (see `deduplicate_inputs`).
+    """
+    return self._duplicate_output_mode
+
+  @property
+  def duplicate_output_filepaths(self) -> Optional[List[str]]:
+    """Output files of a previously processed input identical to the current
+    input, in the order they were exported.
+
+    If not ``None``, export actions create output files from these files
+    instead of exporting the current image, which is ``None``. This is
+    ``None`` unless `deduplicate_inputs` is ``True``.
+    """
+    return self._duplicate_output_filepaths
+
+  @property
+  def shared_export_image(self) -> Optional[builtin_actions.SharedExportImage]:
+    """Image shared by consecutive export actions currently being applied to
+    `current_item`, or ``None`` if the current export action does not share the
+    image with other export actions.
+    """
+    return self._shared_export_image
+
   @property
   def image_copies(self) -> List[Gimp.Image]:
     """`Gimp.Image` instances as copies of original images.
@@ -444,6 +607,27 @@ def skipped_actions(self) -> Dict[str, List]:
     """
     return dict(self._skipped_actions)
 
+  @property
+  def skipped_items(self) -> List[Tuple[itemtree.Item, str]]:
+    """Items that were skipped entirely, along with the reason.
+
+    Currently, items are skipped if they did not change since the last run
+    (see `manifest_filepath`).
+    """
+    return list(self._skipped_items)
+
+  @property
+  def is_current_item_skipped(self) -> bool:
+    """``True`` if `current_item` is skipped (see `skipped_items`), ``False``
+    otherwise.
+
+    Only actions processing names are applied to a skipped item, and export
+    actions export nothing. Names of subsequent items (e.g. numbers in
+    filenames or names made unique) are thus the same as if the item was
+    processed. `current_image` is ``None`` for a skipped item.
+    """
+    return self._is_current_item_skipped
+
   @property
   def skipped_conditions(self) -> Dict[str, List]:
     """Conditions that were skipped during processing.
@@ -666,17 +850,23 @@ def _prepare_for_processing(self):
     self._matching_items = None
     self._matching_items_and_parents = None
     self._exported_items = []
+    self._output_filepaths = collections.defaultdict(list)
     self._num_processed_items = 0
     self._num_total_items = 0
 
     self._image_copies = []
     self._orig_images_and_selected_layers = {}
 
+    self._skipped_items = []
     self._skipped_actions = collections.defaultdict(list)
     self._skipped_conditions = collections.defaultdict(list)
     self._failed_actions = collections.defaultdict(list)
     self._failed_conditions = collections.defaultdict(list)
 
+    self._duplicate_output_filepaths = None
+    self._shared_export_image = None
+    self._is_current_item_skipped = False
+
     self._invoker = invoker_.Invoker()
 
     self._add_commands()
@@ -698,8 +888,30 @@ def _add_commands(self):
       {group: len(self._invoker.list_commands(group)) for group in self._invoker.list_groups()},
     )
 
-    for action in self._actions:
-      self._add_command(action)
+    actions = list(self._actions)
+
+    # The default export action is grouped with the preceding export actions
+    # so that they can share the exported image.
+    default_export_action = self._create_default_export_action()
+    if default_export_action is not None:
+      actions.append(default_export_action)
+
+    action_groups = _group_consecutive_orientation_actions(actions)
+
+    if self._apply_pointwise_actions_after_downscaling:
+      action_groups = _group_pointwise_actions_before_scale(action_groups)
+
+    action_groups = _group_consecutive_export_actions(action_groups)
+
+    for actions in action_groups:
+      if len(actions) == 1:
+        self._add_command(actions[0])
+      elif _is_scale_action(actions[-1]):
+        self._add_pointwise_actions_before_scale(actions)
+      elif _is_export_action(actions[0]):
+        self._add_export_actions_sharing_image(actions)
+      else:
+        self._add_fused_orientation_actions(actions)
 
     self._add_default_actions(invoker_groups_and_last_positions)
 
@@ -734,7 +946,6 @@ def _add_default_actions(self, invoker_groups_and_last_positions):
       [commands.DEFAULT_ACTIONS_GROUP],
       invoker_groups_and_last_positions[commands.DEFAULT_ACTIONS_GROUP],
     )
-    self._add_default_export_action([commands.DEFAULT_ACTIONS_GROUP])
 
   def _add_name_only_default_actions(self, invoker_groups_and_last_positions):
     self._add_default_rename_action(
@@ -775,6 +986,11 @@ def _add_default_rename_action(self, command_groups, position):
       self._add_command(rename_action, command_groups=command_groups, position=position)
 
   def _add_default_export_action(self, command_groups):
+    export_action = self._create_default_export_action()
+    if export_action is not None:
+      self._add_command(export_action, command_groups=command_groups)
+
+  def _create_default_export_action(self):
     if not self._edit_mode:
       export_action_dict = next(
         iter(
@@ -808,7 +1024,9 @@ def _add_default_export_action(self, command_groups):
       export_action = commands.create_command(export_action_dict)
       export_action.uniquify_name(self._actions)
 
-      self._add_command(export_action, command_groups=command_groups)
+      return export_action
+    else:
+      return None
 
   def _add_command(
         self,
@@ -835,6 +1053,18 @@ def _add_command(
     For the ``position`` parameter, see `invoker.Invoker.add()` for more
     information.
     """
+    processed_function_and_args = self._get_processed_function_and_args(command, tags)
+    if processed_function_and_args is None:
+      return
+
+    processed_function, invoker_args = processed_function_and_args
+
+    if command_groups is None:
+      command_groups = command['command_groups'].value
+
+    self._invoker.add(processed_function, command_groups, invoker_args, position=position)
+
+  def _get_processed_function_and_args(self, command, tags=None):
     if command['origin'].value == 'builtin':
       if commands.TYPE_ACTION in command.tags:
         function_or_class = builtin_actions.BUILTIN_ACTIONS_FUNCTIONS[
@@ -863,7 +1093,7 @@ def _add_command(
 
           raise exceptions.CommandError(message, command, None, None)
         else:
-          return
+          return None
     else:
       raise exceptions.CommandError(
         f'invalid origin {command["origin"].value} for command "{command.name}"',
@@ -872,10 +1102,10 @@ def _add_command(
         None)
 
     if function_or_class is None:
-      return
+      return None
 
     if tags is not None and not any(tag in command.tags for tag in tags):
-      return
+      return None
 
     if (inspect.isclass(function_or_class)
         and issubclass(function_or_class, invoker_.CallableCommand)):
@@ -887,12 +1117,180 @@ def _add_command(
 
     processed_function = self._handle_exceptions_from_command(processed_function, command)
 
-    if command_groups is None:
-      command_groups = command['command_groups'].value
-
     invoker_args = list(command['arguments']) + [function]
 
-    self._invoker.add(processed_function, command_groups, invoker_args, position=position)
+    return processed_function, invoker_args
+
+  def _add_fused_orientation_actions(self, actions):
+    """Adds consecutive actions flipping or rotating the current image by a
+    multiple of 90 degrees as a single command.
+
+    Flipping and rotating by a multiple of 90 degrees are lossless, hence any
+    sequence of such actions can be replaced with at most one flip and one
+    rotation, producing an identical image. If the actions cannot be fused for
+    an item (e.g. if an action is applied to a layer or rotates by a custom
+    angle), the actions are applied one by one as usual.
+
+    The actions are also applied one by one if fusing them fails, so that an
+    error is reported for the action that actually failed.
+    """
+    processed_functions_and_args = [
+      self._get_processed_function_and_args(action) for action in actions]
+
+    def _apply_fused_orientation_actions(batcher):
+      if self._try_apply_fused_orientation(batcher, actions):
+        return
+
+      for processed_function, invoker_args in processed_functions_and_args:
+        processed_function(batcher, *invoker_args)
+
+    self._invoker.add(_apply_fused_orientation_actions, actions[0]['command_groups'].value)
+
+  def _add_pointwise_actions_before_scale(self, actions):
+    """Adds actions adjusting colors pixel by pixel followed by a Scale action as
+    a single command.
+
+    For each item, the Scale action is applied first if it scales the object
+    down, followed by the remaining actions. Otherwise, the actions are applied
+    in the original order.
+    """
+    scale_action = actions[-1]
+
+    processed_functions_and_args = [
+      self._get_processed_function_and_args(action) for action in actions]
+    processed_functions_and_args_after_downscaling = (
+      processed_functions_and_args[-1:] + processed_functions_and_args[:-1])
+
+    is_downscaling = self._handle_exceptions_from_command(self._is_downscaling, scale_action)
+
+    def _apply_pointwise_actions_before_scale(batcher):
+      if is_downscaling(batcher, scale_action):
+        functions_and_args = processed_functions_and_args_after_downscaling
+      else:
+        functions_and_args = processed_functions_and_args
+
+      for processed_function, invoker_args in functions_and_args:
+        processed_function(batcher, *invoker_args)
+
+    self._invoker.add(_apply_pointwise_actions_before_scale, scale_action['command_groups'].value)
+
+    if not self._is_preview:
+      self._logger.info(
+        _('"{}" will be applied after "{}" when scaling down.').format(
+          '", "'.join(action['display_name'].value for action in actions[:-1]),
+          scale_action['display_name'].value))
+
+  def _is_downscaling(self, batcher, scale_action):
+    if not self._is_enabled(scale_action):
+      return False
+
+    _args, kwargs = self._get_command_args_and_kwargs(
+      scale_action, [batcher, *scale_action['arguments']])
+
+    # Padding would be affected by subsequent actions. The new image
+    # resolution may affect the size computed by `get_scaled_size()`.
+    if (kwargs['scale_mode'] == builtin_actions.ScaleModes.FIT_WITH_PADDING
+        or kwargs['set_image_resolution']):
+      return False
+
+    object_to_scale = kwargs['object_to_scale']
+
+    scaled_size = builtin_actions.get_scaled_size(batcher, **kwargs)
+    if scaled_size is None:
+      return False
+
+    scaled_width, scaled_height = scaled_size
+
+    return (
+      scaled_width * scaled_height < object_to_scale.get_width() * object_to_scale.get_height())
+
+  def _add_export_actions_sharing_image(self, actions):
+    """Adds consecutive export actions exporting each item separately as a
+    single command.
+
+    For each item, the image to export is copied (in edit mode), rotated
+    according to its metadata and merged only once, and shared among the export
+    actions (see `builtin_actions.SharedExportImage`). Only the steps specific
+    to each export action, such as flattening and saving the image in a file,
+    are performed for each export action.
+    """
+    processed_functions_and_args = [
+      self._get_processed_function_and_args(action) for action in actions]
+
+    def _apply_export_actions_sharing_image(batcher):
+      self._shared_export_image = builtin_actions.SharedExportImage()
+
+      try:
+        for index, (processed_function, invoker_args) in enumerate(processed_functions_and_args):
+          self._shared_export_image.is_last_export = index == len(processed_functions_and_args) - 1
+          processed_function(batcher, *invoker_args)
+      finally:
+        if self._edit_mode and self._shared_export_image.image is not None:
+          utils_pdb.try_delete_image(self._shared_export_image.image)
+
+        self._shared_export_image = None
+
+    self._invoker.add(_apply_export_actions_sharing_image, actions[0]['command_groups'].value)
+
+  def _try_apply_fused_orientation(self, batcher, actions):
+    try:
+      image_and_orientation = self._get_image_and_orientation_for_fusion(batcher, actions)
+
+      if image_and_orientation is None:
+        return False
+
+      image, orientation = image_and_orientation
+      if image is not None:
+        _apply_orientation(image, orientation)
+    except exceptions.BatcherCancelError:
+      raise
+    except Exception:
+      # `_apply_orientation()` leaves the image intact on failure.
+      return False
+
+    return True
+
+  def _get_image_and_orientation_for_fusion(self, batcher, actions):
+    image = None
+    orientation = (0, False)
+
+    for action in actions:
+      self._set_current_action_and_condition(action)
+
+      if not self._is_enabled(action):
+        continue
+
+      _args, kwargs = self._get_command_args_and_kwargs(action, [batcher, *action['arguments']])
+
+      orig_name = action['orig_name'].value
+
+      if orig_name == 'rotate_for_images':
+        object_ = kwargs['object_to_rotate']
+      else:
+        object_ = kwargs['object_to_flip']
+
+      if not isinstance(object_, Gimp.Image):
+        return None
+
+      if image is None:
+        image = object_
+      elif object_.get_id() != image.get_id():
+        return None
+
+      if orig_name == 'flip_horizontally_for_images':
+        orientation = _get_flipped_orientation(orientation)
+      elif orig_name == 'flip_vertically_for_images':
+        # Flipping vertically is identical to flipping horizontally and
+        # rotating by 180 degrees.
+        orientation = _get_rotated_orientation(_get_flipped_orientation(orientation), 2)
+      else:
+        if kwargs['angle'] not in _NUM_ROTATIONS_PER_ANGLE:
+          return None
+
+        orientation = _get_rotated_orientation(
+          orientation, _NUM_ROTATIONS_PER_ANGLE[kwargs['angle']])
+
+    return image, orientation
 
   def _get_processed_function(self, command):
 
@@ -921,6 +1319,10 @@ def _is_enabled(self, command):
       if not command['enabled'].value:
         return False
 
+    if ((self._duplicate_output_filepaths is not None or self._is_current_item_skipped)
+        and builtin_commands_common.NAME_ONLY_TAG not in command.tags):
+      return False
+
     return True
 
   def _set_current_action_and_condition(self, command):
@@ -1077,6 +1479,8 @@ def _process_items(self):
       if not self._is_preview:
         self._logger.info(processing_message)
 
+      num_skipped_items = len(self._skipped_items)
+
       try:
         self._process_item(item)
       except (exceptions.CommandError, exceptions.BatcherFileLoadError) as e:
@@ -1096,7 +1500,8 @@ def _process_items(self):
         self._logger.error(_('Error: {}: {}').format(item.orig_name, self._get_error_message(e)))
         raise
       else:
-        self._num_processed_items += 1
+        if len(self._skipped_items) == num_skipped_items:
+          self._num_processed_items += 1
       finally:
         self._progress_updater.update_tasks()
 
@@ -1298,27 +1703,199 @@ class ImageBatcher(Batcher):
   def __init__(self, *args, **kwargs):
     self._should_load_image = False
     self._import_action = None
+    self._reduced_size_import_kwargs = {}
+    self._manifest = None
+    self._settings_hash = None
+    self._duplicate_groups = {}
+    self._output_filepaths_per_duplicate_group = {}
+    self._batched_gmic_filter_action = None
+    self._images_loaded_in_batch = {}
+    self._items_filtered_in_batch = set()
 
     super().__init__(*args, **kwargs)
 
   def get_finished_processing_message(self):
-    if self._num_processed_items == self._num_total_items:
-      return _('Done. {} images processed.').format(self._num_processed_items)
+    if self._num_processed_items + len(self._skipped_items) == self._num_total_items:
+      message = _('Done. {} images processed.').format(self._num_processed_items)
     else:
-      return _('Done. {} out of {} images successfully processed.').format(
+      message = _('Done. {} out of {} images successfully processed.').format(
         self._num_processed_items, self._num_total_items)
 
+    if self._skipped_items:
+      message += ' ' + _('{} images skipped as unchanged since the last run.').format(
+        len(self._skipped_items))
+
+    return message
+
   def _prepare_for_processing(self):
+    self._batched_gmic_filter_action = None
+    self._images_loaded_in_batch = {}
+    self._items_filtered_in_batch = set()
+
     super()._prepare_for_processing()
 
     self._import_action = builtin_actions.ImportAction()
 
+    self._reduced_size_import_kwargs = {}
+
+    if self._import_at_reduced_size:
+      scale_action = self._get_leading_scale_action_with_static_size()
+      if scale_action is not None:
+        self._reduced_size_import_kwargs = self._get_reduced_size_import_kwargs(scale_action)
+
+    self._batched_gmic_filter_action = self._get_leading_batched_gmic_filter_action()
+    if self._batched_gmic_filter_action is not None:
+      self._logger.info(
+        _('"{}" will be applied to up to {} images at once.').format(
+          self._batched_gmic_filter_action['display_name'].value,
+          self._batched_gmic_filter_action['arguments/batch_size'].value))
+
+  def _get_first_enabled_action(self):
+    return next((action for action in self._actions if self._is_enabled(action)), None)
+
+  def _get_leading_scale_action_with_static_size(self):
+    first_action = self._get_first_enabled_action()
+
+    if (first_action is None
+        or not _is_scale_action(first_action)
+        or first_action['orig_name'].value != 'scale_for_images'
+        or first_action['arguments/object_to_scale'].value != 'current_image'):
+      return None
+
+    dimension_names = ['new_width', 'new_height']
+
+    scale_condition = first_action['arguments/scale_condition'].value
+    if scale_condition in [
+          builtin_actions.ScaleConditions.SMALLER_THAN_CUSTOM,
+          builtin_actions.ScaleConditions.LARGER_THAN_CUSTOM]:
+      dimension_names.extend(['scale_condition_width', 'scale_condition_height'])
+
+    if any(first_action[f'arguments/{name}'].value['unit'] != 'px' for name in dimension_names):
+      return None
+
+    return first_action
+
+  def _get_leading_batched_gmic_filter_action(self):
+    # Previews and edited images are updated image by image.
+    if self._is_preview or self._edit_mode:
+      return None
+
+    first_action = self._get_first_enabled_action()
+
+    if (first_action is None
+        or first_action['origin'].value != 'builtin'
+        or first_action['orig_name'].value != 'gmic_filter'
+        or first_action['arguments/batch_size'].value <= 1):
+      return None
+
+    return first_action
+
+  def _get_reduced_size_import_kwargs(self, scale_action):
+    scale_kwargs = {
+      name: scale_action[f'arguments/{name}'].value
+      for name in [
+        'scale_mode',
+        'new_width',
+        'new_height',
+        'scale_condition',
+        'scale_condition_width',
+        'scale_condition_height',
+      ]
+    }
+
+    def _get_scaled_size(width, height):
+      return builtin_actions.get_scaled_size_for_original_size(self, width, height, **scale_kwargs)
+
+    return {
+      'reduced_size': max(
+        scale_kwargs['new_width']['pixel_value'], scale_kwargs['new_height']['pixel_value']),
+      'get_scaled_size': _get_scaled_size,
+    }
+
   def _get_initial_current_image(self):
     return self._current_item.raw
 
   def _get_initial_current_layer(self):
     return None
 
+  def _setup_contents(self):
+    super()._setup_contents()
+
+    self._duplicate_groups = {}
+    self._output_filepaths_per_duplicate_group = {}
+
+    if self._should_deduplicate_inputs():
+      self._duplicate_groups = self._get_duplicate_groups()
+
+    if self._should_use_manifest():
+      self._manifest = manifest_.Manifest(self._manifest_filepath)
+      self._manifest.open()
+
+      self._settings_hash = manifest_.get_settings_hash(
+        [self._actions, self._conditions],
+        self._output_directory,
+        self._name_pattern,
+        self._file_extension,
+        self._import_options,
+        self._more_export_options,
+        self._import_at_reduced_size,
+        self._apply_pointwise_actions_after_downscaling,
+      )
+
+  def _should_use_manifest(self):
+    if not self._manifest_filepath or self._is_preview or self._edit_mode:
+      return False
+
+    if not self._is_each_item_exported_separately():
+      self._logger.info(
+        _('Unchanged images cannot be skipped when exporting multiple images to a single image.'))
+      return False
+
+    return True
+
+  def _should_deduplicate_inputs(self):
+    if not self._deduplicate_inputs or self._is_preview or self._edit_mode:
+      return False
+
+    if not self._is_each_item_exported_separately():
+      self._logger.info(
+        _('Identical images cannot be deduplicated when exporting multiple images'
+          ' to a single image.'))
+      return False
+
+    return True
+
+  def _is_each_item_exported_separately(self):
+    export_modes = [
+      self._more_export_options.get('export_mode', builtin_actions.ExportModes.EACH_ITEM)]
+    export_modes.extend(
+      action['arguments/export_mode'].value for action in self._actions
+      if self._is_enabled(action) and 'arguments/export_mode' in action)
+
+    return all(export_mode == builtin_actions.ExportModes.EACH_ITEM for export_mode in export_modes)
+
+  def _get_duplicate_groups(self):
+    items_per_filepath = {
+      item.id: item for item in self._item_tree if isinstance(item, itemtree.ImageFileItem)}
+
+    duplicate_groups = {}
+
+    for group_index, filepaths in enumerate(
+          duplicates_.get_identical_files(items_per_filepath)):
+      for filepath in filepaths:
+        # Output names may depend on the file extension of the input, hence
+        # identical files with different file extensions are not reused.
+        duplicate_groups[items_per_filepath[filepath]] = (
+          group_index, fileext.get_file_extension(filepath).lower())
+
+    num_duplicates = len(duplicate_groups) - len(set(duplicate_groups.values()))
+    if num_duplicates > 0:
+      self._logger.info(
+        _('{} images are identical to other images and will not be processed again.').format(
+          num_duplicates))
+
+    return duplicate_groups
+
   def _add_commands_before_initial_invoker(self):
     super()._add_commands_before_initial_invoker()
 
@@ -1332,15 +1909,120 @@ def _add_commands_before_initial_invoker(self):
       [commands.DEFAULT_ACTIONS_GROUP],
       foreach=True)
 
+  def _is_enabled(self, command):
+    if (command is self._batched_gmic_filter_action
+        and self._current_item in self._items_filtered_in_batch):
+      # The filter was already applied when loading the image.
+      return False
+
+    return super()._is_enabled(command)
+
   def _process_item_with_commands(self):
     self._should_load_image = self._current_image is None
 
+    if self._manifest is not None and self._should_load_image:
+      self._process_item_with_commands_unless_unchanged()
+    else:
+      self._process_item_with_commands_unless_duplicate()
+
+  def _process_item_with_commands_unless_unchanged(self):
+    input_filepath = self._current_item.id
+
+    if not self._rebuild_all and self._manifest.is_up_to_date(input_filepath, self._settings_hash):
+      self._skipped_items.append((self._current_item, _('Unchanged since the last run')))
+      self._logger.info(_('Skipping "{}": unchanged since the last run').format(input_filepath))
+
+      self._process_skipped_item_with_name_only_commands()
+      return
+
+    num_failed_commands = self._get_num_failed_commands()
+
+    try:
+      self._process_item_with_commands_unless_duplicate()
+    except Exception:
+      self._manifest.remove(input_filepath)
+      raise
+    else:
+      if self._get_num_failed_commands() == num_failed_commands:
+        self._manifest.update(
+          input_filepath,
+          self._settings_hash,
+          self._output_filepaths.get(self._current_item, []))
+      else:
+        self._manifest.remove(input_filepath)
+
+  def _process_skipped_item_with_name_only_commands(self):
+    self._is_current_item_skipped = True
+    self._current_image = None
+    self._current_layer = None
+
+    try:
+      super()._process_item_with_commands()
+    finally:
+      self._is_current_item_skipped = False
+
+  def _process_item_with_commands_unless_duplicate(self):
+    duplicate_group = self._duplicate_groups.get(self._current_item)
+
+    if duplicate_group is None or not self._should_load_image:
+      self._process_item_with_commands_and_import()
+      return
+
+    output_filepaths = self._output_filepaths_per_duplicate_group.get(duplicate_group)
+
+    if output_filepaths is not None:
+      self._process_duplicate_item_with_name_only_commands(output_filepaths)
+      return
+
+    num_failed_commands = self._get_num_failed_commands()
+
+    self._process_item_with_commands_and_import()
+
+    # If processing the item fails, the next identical item is processed
+    # instead and its output files are reused.
+    if (self._get_num_failed_commands() == num_failed_commands
+        and self._output_filepaths.get(self._current_item)):
+      self._output_filepaths_per_duplicate_group[duplicate_group] = list(
+        self._output_filepaths[self._current_item])
+
+  def _process_duplicate_item_with_name_only_commands(self, output_filepaths):
+    self._logger.info(
+      _('"{}" is identical to a previously processed image, reusing its output').format(
+        self._current_item.id))
+
+    self._duplicate_output_filepaths = output_filepaths
+    self._current_image = None
+    self._current_layer = None
+
+    try:
+      super()._process_item_with_commands()
+    finally:
+      self._duplicate_output_filepaths = None
+
+  def _get_num_failed_commands(self):
+    return (
+      sum(len(values) for values in self._failed_actions.values())
+      + sum(len(values) for values in self._failed_conditions.values()))
+
+  def _process_item_with_commands_and_import(self):
     if not self._edit_mode or self._is_preview:
-      if self._should_load_image:
+      if (self._batched_gmic_filter_action is not None
+          and self._current_item not in self._images_loaded_in_batch):
+        self._load_images_and_apply_gmic_filter_in_batch()
+
+      image_loaded_in_batch = self._images_loaded_in_batch.pop(self._current_item, None)
+
+      if image_loaded_in_batch is not None:
+        self._current_image = image_loaded_in_batch
+        if self._should_load_image:
+          self._current_item.raw = image_loaded_in_batch
+        self._image_copies.append(image_loaded_in_batch)
+      elif self._should_load_image:
         loaded_image = self._import_action(
           self,
           Gio.file_new_for_path(self._current_item.id),
           **self._import_options,
+          **self._reduced_size_import_kwargs,
         )
         if loaded_image is not None:
           self._current_image = loaded_image
@@ -1364,6 +2046,129 @@ def _process_item_with_commands(self):
       self._current_image = None
       self._current_layer = None
 
+  def _load_images_and_apply_gmic_filter_in_batch(self):
+    """Loads images of the current item and the subsequent items and applies
+    the leading G'MIC Filter action to all of them in a single call to G'MIC.
+
+    Items whose image fails to load or whose layers cannot be filtered this way
+    (e.g. group layers) are processed separately as usual, as are all items if
+    the filter fails to apply.
+    """
+    action = self._batched_gmic_filter_action
+
+    images_and_layers = {}
+
+    for item in self._get_items_to_load_in_batch(action['arguments/batch_size'].value):
+      image = self._load_image_in_batch(item)
+      if image is None:
+        continue
+
+      self._images_loaded_in_batch[item] = image
+
+      layers = self._get_layers_to_filter_in_batch(item, image, action)
+      if layers:
+        images_and_layers[item] = (image, layers)
+
+    # Copying the layers to a separate image is not worth it for a single image.
+    if len(images_and_layers) < 2:
+      return
+
+    try:
+      builtin_actions.gmic_filter_for_multiple_images(
+        list(images_and_layers.values()), action['arguments/command'].value)
+    except Exception as e:
+      self._logger.info(
+        _('Could not apply "{}" to multiple images at once, applying it to each image'
+          ' separately: {}').format(action['display_name'].value, str(e)))
+
+      # The images may have been modified partially and are loaded again.
+      for item in images_and_layers:
+        utils_pdb.try_delete_image(self._images_loaded_in_batch.pop(item))
+    else:
+      self._items_filtered_in_batch.update(images_and_layers)
+
+  def _get_items_to_load_in_batch(self, batch_size):
+    items = []
+    duplicate_groups = set()
+
+    item = self._current_item
+
+    while item is not None and len(items) < batch_size:
+      duplicate_group = self._duplicate_groups.get(item)
+
+      if item == self._current_item or (
+            item not in self._images_loaded_in_batch
+            and not self._is_unchanged(item)
+            and duplicate_group not in self._output_filepaths_per_duplicate_group
+            and duplicate_group not in duplicate_groups):
+        items.append(item)
+
+        if duplicate_group is not None:
+          duplicate_groups.add(duplicate_group)
+
+      item = self._matching_items[item]
+
+    return items
+
+  def _is_unchanged(self, item):
+    return (
+      self._manifest is not None
+      and item.raw is None
+      and not self._rebuild_all
+      and self._manifest.is_up_to_date(item.id, self._settings_hash))
+
+  def _load_image_in_batch(self, item):
+    with self._set_current_item_temporarily(item, item.raw):
+      if item.raw is not None:
+        image_copy, _not_applicable = self.create_copy(item.raw, None)
+        return image_copy
+
+      try:
+        return self._import_action(
+          self,
+          Gio.file_new_for_path(item.id),
+          **self._import_options,
+          **self._reduced_size_import_kwargs,
+        )
+      except exceptions.BatcherCancelError:
+        raise
+      except Exception:
+        # The image is loaded again and the error is reported once the item is
+        # processed.
+        return None
+
+  def _get_layers_to_filter_in_batch(self, item, image, action):
+    with self._set_current_item_temporarily(item, image):
+      try:
+        _args, kwargs = self._get_command_args_and_kwargs(action, [self, *action['arguments']])
+      except Exception:
+        # Any error is reported once the action is applied to the item.
+        return None
+
+    layers = kwargs['layers']
+
+    if not layers or any(layer is None or layer.is_group_layer() for layer in layers):
+      return None
+
+    return layers
+
+  @contextlib.contextmanager
+  def _set_current_item_temporarily(self, item, image):
+    orig_current_item = self._current_item
+    orig_current_image = self._current_image
+    orig_current_layer = self._current_layer
+
+    self._current_item = item
+    self._current_image = image
+    self._current_layer = self._get_current_layer(image)
+
+    try:
+      yield
+    finally:
+      self._current_item = orig_current_item
+      self._current_image = orig_current_image
+      self._current_layer = orig_current_layer
+
   @staticmethod
   def _get_current_layer(image):
     if image is None or not image.is_valid():
@@ -1401,6 +2206,16 @@ def _do_cleanup_contents(self, exception_occurred):
 
     self._should_load_image = False
 
+    for image in self._images_loaded_in_batch.values():
+      utils_pdb.try_delete_image(image)
+
+    self._images_loaded_in_batch = {}
+    self._items_filtered_in_batch = set()
+
+    if self._manifest is not None:
+      self._manifest.close()
+      self._manifest = None
+
 
 class LayerBatcher(Batcher):
   """Class for batch-processing layers in the specified image with a sequence of
@@ -1583,3 +2398,159 @@ def _preserve_layer_locks_between_commands(layer_batcher):
         item.raw.set_lock_position(lock_position)
       if lock_alpha:
         item.raw.set_lock_alpha(lock_alpha)
+
+
+def _group_consecutive_orientation_actions(actions):
+  """Yields lists of consecutive actions that can be fused via
+  `Batcher._add_fused_orientation_actions()`. Other actions are yielded as
+  single-element lists.
+  """
+  orientation_actions = []
+
+  for action in actions:
+    if _is_orientation_action(action):
+      if (orientation_actions
+          and action['command_groups'].value != orientation_actions[0]['command_groups'].value):
+        yield orientation_actions
+        orientation_actions = []
+
+      orientation_actions.append(action)
+    else:
+      if orientation_actions:
+        yield orientation_actions
+        orientation_actions = []
+
+      yield [action]
+
+  if orientation_actions:
+    yield orientation_actions
+
+
+def _group_pointwise_actions_before_scale(action_groups):
+  """Yields lists of consecutive actions that can be reordered via
+  `Batcher._add_pointwise_actions_before_scale()`. Other action groups from
+  ``action_groups`` are yielded unmodified.
+  """
+  pointwise_actions = []
+
+  for actions in action_groups:
+    if len(actions) == 1 and _is_pointwise_action(actions[0]):
+      if (pointwise_actions
+          and actions[0]['command_groups'].value != pointwise_actions[0]['command_groups'].value):
+        yield from ([action] for action in pointwise_actions)
+        pointwise_actions = []
+
+      pointwise_actions.append(actions[0])
+    elif (len(actions) == 1
+          and _is_scale_action(actions[0])
+          and pointwise_actions
+          and actions[0]['command_groups'].value == pointwise_actions[0]['command_groups'].value):
+      yield pointwise_actions + actions
+      pointwise_actions = []
+    else:
+      yield from ([action] for action in pointwise_actions)
+      pointwise_actions = []
+
+      yield actions
+
+  yield from ([action] for action in pointwise_actions)
+
+
+def _group_consecutive_export_actions(action_groups):
+  """Yields lists of consecutive export actions that can share the exported
+  image via `Batcher._add_export_actions_sharing_image()`. Other action groups
+  from ``action_groups`` are yielded unmodified.
+  """
+  export_actions = []
+
+  for actions in action_groups:
+    if len(actions) == 1 and _can_export_action_share_image(actions[0]):
+      if export_actions and not _can_export_actions_share_image(export_actions[0], actions[0]):
+        yield export_actions
+        export_actions = []
+
+      export_actions.append(actions[0])
+    else:
+      if export_actions:
+        yield export_actions
+        export_actions = []
+
+      yield actions
+
+  if export_actions:
+    yield export_actions
+
+
+def _can_export_action_share_image(action):
+  return (
+    _is_export_action(action)
+    and action['arguments/export_mode'].value == builtin_actions.ExportModes.EACH_ITEM
+    and action['arguments/layer_handling'].value != builtin_actions.LayerHandlingModes.KEEP_LAYERS)
+
+
+def _can_export_actions_share_image(action, other_action):
+  return (
+    action['command_groups'].value == other_action['command_groups'].value
+    and (action['arguments/rotate_flip_image_based_on_exif_metadata'].value
+         == other_action['arguments/rotate_flip_image_based_on_exif_metadata'].value))
+
+
+def _is_pointwise_action(action):
+  return (
+    action['origin'].value == 'builtin'
+    and commands.TYPE_ACTION in action.tags
+    and action['orig_name'].value in _POINTWISE_ACTION_NAMES)
+
+
+def _is_scale_action(action):
+  return (
+    action['origin'].value == 'builtin'
+    and commands.TYPE_ACTION in action.tags
+    and action['orig_name'].value in _SCALE_ACTION_NAMES)
+
+
+def _is_export_action(action):
+  return (
+    action['origin'].value == 'builtin'
+    and commands.TYPE_ACTION in action.tags
+    and action['orig_name'].value.startswith('export_for_'))
+
+
+def _is_orientation_action(action):
+  return (
+    action['origin'].value == 'builtin'
+    and commands.TYPE_ACTION in action.tags
+    and action['orig_name'].value in _ORIENTATION_ACTION_NAMES)
+
+
+def _get_flipped_orientation(orientation):
+  # An orientation is a tuple of (number of clockwise rotations by 90 degrees,
+  # whether the image is flipped horizontally), where the flip is applied
+  # before the rotation. Flipping horizontally after a rotation is identical to
+  # flipping first and rotating in the opposite direction.
+  num_rotations, flipped = orientation
+
+  return (-num_rotations) % 4, not flipped
+
+
+def _get_rotated_orientation(orientation, num_rotations):
+  return (orientation[0] + num_rotations) % 4, orientation[1]
+
+
+def _apply_orientation(image, orientation):
+  num_rotations, flipped = orientation
+
+  if flipped and num_rotations == 2:
+    image.flip(Gimp.OrientationType.VERTICAL)
+  else:
+    if flipped:
+      image.flip(Gimp.OrientationType.HORIZONTAL)
+
+    if num_rotations:
+      try:
+        image.rotate(_ROTATION_TYPES[num_rotations])
+      except Exception:
+        # Flipping again restores the original image.
+        if flipped:
+          image.flip(Gimp.OrientationType.HORIZONTAL)
+        raise
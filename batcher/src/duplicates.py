@@ -0,0 +1,153 @@
+"""Detection of input files with identical contents and creation of output
+files from outputs of identical inputs.
+"""
+
+import collections
+from collections.abc import Iterable
+import errno
+import hashlib
+import os
+import shutil
+from typing import List
+
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
+
+class DuplicateOutputModes:
+  DUPLICATE_OUTPUT_MODES = (
+    COPY,
+    HARDLINK,
+    REFLINK,
+  ) = (
+    'copy',
+    'hardlink',
+    'reflink',
+  )
+
+
+DUPLICATE_OUTPUT_MODES_LIST = [
+  (DuplicateOutputModes.COPY, _('Copy')),
+  (DuplicateOutputModes.HARDLINK, _('Hard link')),
+  (DuplicateOutputModes.REFLINK, _('Reflink (copy-on-write copy)')),
+]
+
+_PARTIAL_HASH_SIZE = 64 * 1024
+_CHUNK_SIZE = 1024 * 1024
+
+# `FICLONE` from `linux/fs.h`.
+_FICLONE = 0x40049409
+
+
+def get_identical_files(filepaths: Iterable[str]) -> List[List[str]]:
+  """Returns groups of files with identical contents from ``filepaths``.
+
+  Each group contains at least two files. Files within each group and the
+  groups themselves are ordered according to ``filepaths``.
+
+  Files are first grouped by size, then by a hash of their first bytes and
+  finally by a hash of their entire contents, so that files of unique size are
+  not read at all. Files that cannot be read are ignored.
+  """
+  filepaths = list(filepaths)
+  filepath_indexes = {filepath: index for index, filepath in enumerate(filepaths)}
+
+  filepaths_per_size = collections.defaultdict(list)
+
+  for filepath in filepaths:
+    try:
+      filepaths_per_size[os.path.getsize(filepath)].append(filepath)
+    except OSError:
+      pass
+
+  groups = [group for group in filepaths_per_size.values() if len(group) > 1]
+
+  for hash_func in [_get_partial_hash, _get_hash]:
+    groups = [
+      subgroup for group in groups for subgroup in _group_by(group, hash_func)
+      if len(subgroup) > 1]
+
+  return sorted(groups, key=lambda group: filepath_indexes[group[0]])
+
+
+def _group_by(filepaths, hash_func):
+  filepaths_per_hash = collections.defaultdict(list)
+
+  for filepath in filepaths:
+    try:
+      filepaths_per_hash[hash_func(filepath)].append(filepath)
+    except OSError:
+      pass
+
+  return list(filepaths_per_hash.values())
+
+
+def _get_partial_hash(filepath):
+  with open(filepath, 'rb') as f:
+    return hashlib.blake2b(f.read(_PARTIAL_HASH_SIZE)).digest()
+
+
+def _get_hash(filepath):
+  hash_ = hashlib.blake2b()
+
+  with open(filepath, 'rb') as f:
+    for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+      hash_.update(chunk)
+
+  return hash_.digest()
+
+
+def create_file_from_duplicate(source_filepath: str, filepath: str, mode: str):
+  """Creates a file at ``filepath`` with the contents of ``source_filepath``.
+
+  ``mode`` is one of the `DuplicateOutputModes` values. If a hard link or a
+  reflink cannot be created (e.g. if the files are on different file systems or
+  the file system does not support reflinks), the file is copied instead.
+
+  An existing file at ``filepath`` is replaced.
+
+  Raises:
+    OSError: The file could not be created.
+  """
+  if os.path.exists(filepath):
+    if os.path.samefile(source_filepath, filepath):
+      return
+
+    os.remove(filepath)
+
+  if mode == DuplicateOutputModes.HARDLINK:
+    try:
+      os.link(source_filepath, filepath)
+    except OSError:
+      pass
+    else:
+      return
+  elif mode == DuplicateOutputModes.REFLINK:
+    if _reflink(source_filepath, filepath):
+      return
+
+  shutil.copyfile(source_filepath, filepath)
+
+
+def _reflink(source_filepath, filepath):
+  if fcntl is None:
+    return False
+
+  with open(source_filepath, 'rb') as source_file, open(filepath, 'wb') as file_:
+    try:
+      fcntl.ioctl(file_.fileno(), _FICLONE, source_file.fileno())
+    except OSError as e:
+      if e.errno in [
+            errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.EBADF, errno.ENOSYS]:
+        success = False
+      else:
+        raise
+    else:
+      success = True
+
+  if not success:
+    os.remove(filepath)
+
+  return success
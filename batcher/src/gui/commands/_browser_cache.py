@@ -0,0 +1,202 @@
+"""Persistent cache of commands created from PDB procedures and GEGL
+operations, displayed in the command browser.
+
+Creating commands from all available procedures requires querying the
+arguments of each procedure, which takes a significant amount of time. The
+cache allows filling the command browser without querying the procedures.
+
+The cache is keyed by the GIMP version, the plug-in version and the user
+interface language, and contains a fingerprint of the available procedures and
+the plug-in registry. If the key does not match, the cache is discarded. If only
+the fingerprint does not match, the cached commands can still be displayed, but
+should be revalidated.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import gi
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+from gi.repository import GLib
+
+from config import CONFIG
+from src import constants
+from src import setting as setting_
+from src import utils
+from src import utils_pdb
+
+
+_CACHE_FORMAT_VERSION = 1
+
+_CACHE_FILENAME = 'command_browser_cache.json'
+
+_PLUGIN_REGISTRY_FILENAME = 'pluginrc'
+
+
+def get_cache_filepath() -> str:
+  """Returns the path to the file storing the cache."""
+  return os.path.join(GLib.get_user_cache_dir(), CONFIG.PLUGIN_NAME, _CACHE_FILENAME)
+
+
+def get_cache_key() -> Dict[str, Any]:
+  """Returns a dictionary identifying whether the cached commands can be used.
+
+  Commands are language-dependent (display names and descriptions are
+  translated) and depend on the plug-in version (commands may be created
+  differently across versions).
+  """
+  return {
+    'format_version': _CACHE_FORMAT_VERSION,
+    'gimp_version': list(utils_pdb.get_gimp_version()),
+    'plugin_version': CONFIG.PLUGIN_VERSION,
+    'languages': list(GLib.get_language_names()),
+  }
+
+
+def get_fingerprint(procedure_names: Iterable[str]) -> str:
+  """Returns a string identifying the state of the specified procedures.
+
+  The fingerprint changes if a procedure is added or removed, or if the
+  plug-in registry is updated by GIMP (e.g. when a plug-in is installed or
+  upgraded).
+  """
+  hash_ = hashlib.sha1()
+
+  for name in sorted(procedure_names):
+    hash_.update(name.encode(constants.TEXT_FILE_ENCODING))
+    hash_.update(b'\0')
+
+  try:
+    plugin_registry_stat = os.stat(os.path.join(Gimp.directory(), _PLUGIN_REGISTRY_FILENAME))
+  except OSError:
+    pass
+  else:
+    hash_.update(f'{plugin_registry_stat.st_mtime_ns}:{plugin_registry_stat.st_size}'.encode())
+
+  return hash_.hexdigest()
+
+
+def load(
+      filepath: str,
+      cache_key: Dict[str, Any],
+      fingerprint: str,
+) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+  """Loads cached entries from the specified file.
+
+  A tuple of (entries, up-to-date) is returned. Entries are a dictionary of
+  (procedure name, entry) pairs. Each entry is a dictionary containing
+  ``'category'`` and ``'command_dict'`` (in the form returned by
+  `command_dict_to_raw()`). Up-to-date is ``True`` if ``fingerprint`` matches
+  the fingerprint stored in the cache, ``False`` otherwise.
+
+  If the file does not exist, is not valid or ``cache_key`` does not match the
+  key stored in the file, no entries are returned.
+  """
+  try:
+    with open(filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
+      data = json.load(f)
+  except (OSError, ValueError):
+    return {}, False
+
+  if not isinstance(data, dict) or data.get('key') != cache_key:
+    return {}, False
+
+  entries = data.get('entries')
+  if not isinstance(entries, dict):
+    return {}, False
+
+  return entries, data.get('fingerprint') == fingerprint
+
+
+def save(
+      filepath: str,
+      cache_key: Dict[str, Any],
+      fingerprint: str,
+      entries: Dict[str, Dict[str, Any]],
+) -> bool:
+  """Saves the specified entries to a file.
+
+  The file is written atomically, i.e. the file is never left partially
+  written.
+
+  ``True`` is returned if the cache was saved successfully, ``False``
+  otherwise. Failing to save the cache is not considered an error as the cache
+  is only used to speed up filling the command browser.
+  """
+  data = {
+    'key': cache_key,
+    'fingerprint': fingerprint,
+    'entries': entries,
+  }
+
+  dirpath = os.path.dirname(filepath)
+  temp_filepath = os.path.join(dirpath, f'.{os.path.basename(filepath)}.{os.getpid()}.tmp')
+
+  try:
+    os.makedirs(dirpath, exist_ok=True)
+
+    with open(temp_filepath, 'w', encoding=constants.TEXT_FILE_ENCODING) as f:
+      json.dump(data, f, separators=(',', ':'))
+
+    os.replace(temp_filepath, filepath)
+  except Exception:
+    try:
+      os.remove(temp_filepath)
+    except OSError:
+      pass
+
+    return False
+  else:
+    return True
+
+
+def command_dict_to_raw(command_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+  """Returns a copy of ``command_dict`` that can be serialized to JSON.
+
+  Arguments are converted the same way as when saving settings, i.e. via
+  `setting.Setting.to_dict()`.
+
+  If ``command_dict`` cannot be converted (e.g. an argument has a default value
+  that cannot be serialized), ``None`` is returned.
+  """
+  raw_command_dict = {key: value for key, value in command_dict.items() if key != 'arguments'}
+
+  raw_arguments = []
+
+  try:
+    arguments_group = setting_.Group(
+      'arguments',
+      setting_attributes={
+        'pdb_type': None,
+      })
+
+    arguments_group.add(utils.semi_deep_copy(command_dict.get('arguments', [])))
+
+    for setting in arguments_group:
+      setting_dict = setting.to_dict()
+      setting_dict.pop('value', None)
+      raw_arguments.append(setting_dict)
+
+    raw_command_dict['arguments'] = raw_arguments
+
+    json.dumps(raw_command_dict)
+  except Exception:
+    return None
+
+  return raw_command_dict
+
+
+def command_dict_from_raw(raw_command_dict: Dict[str, Any]) -> Dict[str, Any]:
+  """Returns a command dictionary from the output of `command_dict_to_raw()`.
+
+  The returned dictionary can be passed to `commands.create_command()`.
+  """
+  command_dict = utils.semi_deep_copy(raw_command_dict)
+
+  for argument_dict in command_dict['arguments']:
+    argument_dict['type'] = setting_.SETTING_TYPES[argument_dict['type']]
+
+  return command_dict
@@ -3,6 +3,7 @@
 The list includes GIMP PDB procedures.
 """
 
+import itertools
 from typing import Dict, Optional
 
 import gi
@@ -18,6 +19,7 @@
 from gi.repository import Gtk
 from gi.repository import Pango
 
+from . import _browser_cache as browser_cache_
 from . import editor as command_editor_
 
 from src import commands as commands_
@@ -48,6 +50,7 @@ def __init__(
     self.tree_iter = tree_iter
 
     self.command_rows = []
+    self.num_command_rows_visible_via_search = 0
 
 
 class _CommandBrowserItemTypes:
@@ -85,6 +88,102 @@ def __init__(
     self.tree_iter = tree_iter
 
 
+class _CommandSearchIndex:
+  """Index allowing to quickly find rows whose name, internal name or
+  description contain a search query.
+
+  For each searched attribute, the index maps substrings of `_NGRAM_LENGTH`
+  characters (n-grams) to rows containing them. Rows matching a query are found
+  by intersecting rows containing each n-gram of the query and then checking
+  that the query is contained in the attribute. Queries shorter than
+  `_NGRAM_LENGTH` match most rows anyway, hence they are checked against each
+  row without using n-grams.
+
+  The index for an attribute is built the first time the attribute is
+  searched.
+  """
+
+  _NGRAM_LENGTH = 3
+
+  def __init__(self, rows, process_text_func):
+    self._rows = rows
+    self._process_text_func = process_text_func
+
+    self._texts = {}
+    self._ngrams = {}
+
+  def search(self, query, attribute_names):
+    """Returns a set of rows whose attributes contain ``query``.
+
+    ``query`` must already be processed by the function passed to
+    `__init__()`.
+    """
+    matching_rows = set()
+
+    for attribute_name in attribute_names:
+      matching_rows.update(self._search_attribute(query, attribute_name))
+
+    return matching_rows
+
+  def update(self, row):
+    """Updates the index after the attributes of ``row`` were modified."""
+    for attribute_name in self._texts:
+      self._remove_row(row, attribute_name)
+      self._add_row(row, attribute_name)
+
+  def _search_attribute(self, query, attribute_name):
+    if attribute_name not in self._texts:
+      self._build_index(attribute_name)
+
+    texts = self._texts[attribute_name]
+
+    if len(query) < self._NGRAM_LENGTH:
+      return [row for row, text in texts.items() if query in text]
+
+    ngrams = self._ngrams[attribute_name]
+
+    rows_per_ngram = sorted(
+      (ngrams.get(ngram, ()) for ngram in self._get_ngrams(query)), key=len)
+
+    candidate_rows = set(rows_per_ngram[0]).intersection(*rows_per_ngram[1:])
+
+    return [row for row in candidate_rows if query in texts[row]]
+
+  def _build_index(self, attribute_name):
+    self._texts[attribute_name] = {}
+    self._ngrams[attribute_name] = {}
+
+    for row in self._rows:
+      self._add_row(row, attribute_name)
+
+  def _add_row(self, row, attribute_name):
+    text = self._process_text_func(getattr(row, attribute_name))
+
+    self._texts[attribute_name][row] = text
+
+    ngrams = self._ngrams[attribute_name]
+
+    for ngram in self._get_ngrams(text):
+      if ngram not in ngrams:
+        ngrams[ngram] = set()
+
+      ngrams[ngram].add(row)
+
+  def _remove_row(self, row, attribute_name):
+    text = self._texts[attribute_name].pop(row, None)
+    if text is None:
+      return
+
+    ngrams = self._ngrams[attribute_name]
+
+    for ngram in self._get_ngrams(text):
+      ngrams[ngram].discard(row)
+
+  @classmethod
+  def _get_ngrams(cls, text):
+    return {text[i:i + cls._NGRAM_LENGTH] for i in range(len(text) - cls._NGRAM_LENGTH + 1)}
+
+
 class CommandBrowser(GObject.GObject):
 
   _DIALOG_SIZE = 840, 450
@@ -101,6 +200,8 @@ class CommandBrowser(GObject.GObject):
 
   _SEARCH_QUERY_CHANGED_TIMEOUT_MILLISECONDS = 100
 
+  _NUM_COMMANDS_TO_REVALIDATE_PER_IDLE_CALL = 20
+
   _COLUMNS = (
     _COLUMN_COMMAND_NAME,
     _COLUMN_COMMAND_VISIBLE,
@@ -136,6 +237,9 @@ def __init__(self, title=None, parent=None, *args, **kwargs):
 
     self._command_rows = []
     self._command_rows_and_indexes = {}
+    self._command_rows_visible_via_search = set()
+
+    self._search_index = _CommandSearchIndex(self._command_rows, self._process_text_for_search)
 
     self._contents_filled = False
 
@@ -195,29 +299,6 @@ def fill_contents_if_empty(self):
 
     self._contents_filled = True
 
-    def is_file_load_procedure(name_):
-      return (name_.startswith('file-')
-              and (name_.endswith('-load') or name_.endswith('-load-thumb')))
-
-    def is_file_export_procedure(name_):
-      return (name_.startswith('file-')
-              and (name_.endswith('-export')
-                   or name_.endswith('-export-internal')
-                   or name_.endswith('-export-multi')))
-
-    def is_procedure_compatible_with_batch_processing(name_):
-      return name_ not in [
-        # Opens a new image even in non-interactive run mode and is redundant
-        'script-fu-unsharp-mask',
-      ]
-
-    def is_procedure_gimp_plugin(procedure_):
-      return (
-        isinstance(procedure_, pypdb.GimpPDBProcedure)
-        and procedure_.proc.get_proc_type() in [
-          Gimp.PDBProcType.PLUGIN, Gimp.PDBProcType.PERSISTENT, Gimp.PDBProcType.TEMPORARY]
-      )
-
     for category_name, category in self._command_categories.items():
       command_row = _CommandRow(
         type_=_CommandBrowserItemTypes.PARENT,
@@ -238,78 +319,62 @@ def is_procedure_gimp_plugin(procedure_):
 
       self._command_rows.append(command_row)
 
-    pdb_procedures = [pdb[name] for name in pdb.list_all_gegl_operations()]
+    procedure_names = list(pdb.list_all_gegl_operations())
 
-    pdb_procedures.extend(
-      pdb[name]
+    procedure_names.extend(
+      name
       for name in pdb.list_all_gimp_pdb_procedures()
-      if (not is_file_load_procedure(name)
-          and not is_file_export_procedure(name)
-          and is_procedure_compatible_with_batch_processing(name))
+      if (not self._is_file_load_procedure(name)
+          and not self._is_file_export_procedure(name)
+          and self._is_procedure_compatible_with_batch_processing(name))
     )
 
-    duplicate_gegl_operations = pdb.get_duplicate_gegl_operations()
+    cache_filepath = browser_cache_.get_cache_filepath()
+    cache_key = browser_cache_.get_cache_key()
+    fingerprint = browser_cache_.get_fingerprint(procedure_names)
 
-    command_dicts = [
-      commands_.get_command_dict_from_pdb_procedure(procedure) for procedure in pdb_procedures]
+    cached_entries, is_cache_up_to_date = browser_cache_.load(
+      cache_filepath, cache_key, fingerprint)
 
-    for procedure, command_dict in zip(pdb_procedures, command_dicts):
-      # We are sanitizing the command name as it can contain characters not
-      # allowed in `setting.Setting`. We therefore prefer 'function'
-      # if it is a string as that is kept unprocessed.
-      if isinstance(command_dict['function'], str):
-        procedure_name = command_dict['function']
-      else:
-        procedure_name = command_dict['name']
-
-      if isinstance(procedure, pypdb.GeglProcedure):
-        if procedure_name not in duplicate_gegl_operations:
-          category_name = 'filters'
-        else:
-          category_name = 'other'
-      elif procedure_name.startswith('file-'):
-        category_name = 'other'
-      elif procedure_name.startswith('plug-in-') or is_procedure_gimp_plugin(procedure):
-        if self._has_plugin_procedure_image_or_drawable_arguments(command_dict):
-          category_name = 'plug_ins'
-        else:
-          category_name = 'other'
-      else:
-        category_name = 'gimp_procedures'
-
-      if command_dict['display_name'] != procedure_name:
-        display_name = command_dict['display_name']
-      else:
-        display_name = None
+    cache_entries = {}
+    is_cache_modified = False
+    command_rows_to_revalidate = []
 
-      # This prevents certain procedures from triggering undesired behavior
-      #  (e.g. displaying a layer copy as a new image).
-      command_dict['enabled'] = False
+    for name in procedure_names:
+      cached_entry = cached_entries.get(name)
 
-      category = self._command_categories[category_name]
+      if cached_entry is not None:
+        command_dict = browser_cache_.command_dict_from_raw(cached_entry['command_dict'])
+        category_name = cached_entry['category']
 
-      command_row = _CommandRow(
-        type_=_CommandBrowserItemTypes.COMMAND,
-        category=category,
-        internal_name=procedure_name,
-        name=display_name if display_name is not None else procedure_name,
-        description=command_dict.get('description', ''),
-        command_dict=command_dict,
-        command_editor_widget=None,
-        visible=category.expanded,
+        cache_entries[name] = cached_entry
+      else:
+        command_dict, category_name = self._get_command_dict_and_category_name(name)
+
+        raw_command_dict = browser_cache_.command_dict_to_raw(command_dict)
+        if raw_command_dict is not None:
+          cache_entries[name] = {'category': category_name, 'command_dict': raw_command_dict}
+          is_cache_modified = True
+
+      command_row = self._add_command_row(command_dict, category_name)
+
+      if cached_entry is not None and not is_cache_up_to_date:
+        command_rows_to_revalidate.append(command_row)
+
+    if command_rows_to_revalidate:
+      # Cached commands are displayed immediately and replaced in the
+      # background if they changed, e.g. if a plug-in was upgraded. The cache is
+      # saved once all commands are revalidated.
+      GLib.idle_add(
+        self._revalidate_cached_commands,
+        iter(command_rows_to_revalidate),
+        cache_entries,
+        cache_filepath,
+        cache_key,
+        fingerprint,
       )
-
-      tree_iter = self._tree_model.append([
-          GLib.markup_escape_text(command_row.name),
-          command_row.visible,
-          None,
-          command_row,
-      ])
-
-      command_row.tree_iter = tree_iter
-
-      self._command_rows.append(command_row)
-      category.command_rows.append(command_row)
+    elif not is_cache_up_to_date or is_cache_modified:
+      browser_cache_.save(cache_filepath, cache_key, fingerprint, cache_entries)
 
     self._sort_command_rows()
 
@@ -322,6 +387,163 @@ def is_procedure_gimp_plugin(procedure_):
 
     self._select_first_visible_command()
 
+  @staticmethod
+  def _is_file_load_procedure(name):
+    return (name.startswith('file-')
+            and (name.endswith('-load') or name.endswith('-load-thumb')))
+
+  @staticmethod
+  def _is_file_export_procedure(name):
+    return (name.startswith('file-')
+            and (name.endswith('-export')
+                 or name.endswith('-export-internal')
+                 or name.endswith('-export-multi')))
+
+  @staticmethod
+  def _is_procedure_compatible_with_batch_processing(name):
+    return name not in [
+      # Opens a new image even in non-interactive run mode and is redundant
+      'script-fu-unsharp-mask',
+    ]
+
+  @staticmethod
+  def _is_procedure_gimp_plugin(procedure):
+    return (
+      isinstance(procedure, pypdb.GimpPDBProcedure)
+      and procedure.proc.get_proc_type() in [
+        Gimp.PDBProcType.PLUGIN, Gimp.PDBProcType.PERSISTENT, Gimp.PDBProcType.TEMPORARY]
+    )
+
+  def _get_command_dict_and_category_name(self, name):
+    procedure = pdb[name]
+
+    command_dict = commands_.get_command_dict_from_pdb_procedure(procedure)
+
+    procedure_name = self._get_procedure_name(command_dict)
+
+    if isinstance(procedure, pypdb.GeglProcedure):
+      if procedure_name not in pdb.get_duplicate_gegl_operations():
+        category_name = 'filters'
+      else:
+        category_name = 'other'
+    elif procedure_name.startswith('file-'):
+      category_name = 'other'
+    elif procedure_name.startswith('plug-in-') or self._is_procedure_gimp_plugin(procedure):
+      if self._has_plugin_procedure_image_or_drawable_arguments(command_dict):
+        category_name = 'plug_ins'
+      else:
+        category_name = 'other'
+    else:
+      category_name = 'gimp_procedures'
+
+    return command_dict, category_name
+
+  @staticmethod
+  def _get_procedure_name(command_dict):
+    # We are sanitizing the command name as it can contain characters not
+    # allowed in `setting.Setting`. We therefore prefer 'function'
+    # if it is a string as that is kept unprocessed.
+    if isinstance(command_dict['function'], str):
+      return command_dict['function']
+    else:
+      return command_dict['name']
+
+  @staticmethod
+  def _get_command_row_name_and_description(command_dict):
+    procedure_name = CommandBrowser._get_procedure_name(command_dict)
+
+    if command_dict['display_name'] != procedure_name:
+      name = command_dict['display_name']
+    else:
+      name = procedure_name
+
+    return name, command_dict.get('description', '')
+
+  def _add_command_row(self, command_dict, category_name):
+    # This prevents certain procedures from triggering undesired behavior
+    #  (e.g. displaying a layer copy as a new image).
+    command_dict['enabled'] = False
+
+    category = self._command_categories[category_name]
+
+    name, description = self._get_command_row_name_and_description(command_dict)
+
+    command_row = _CommandRow(
+      type_=_CommandBrowserItemTypes.COMMAND,
+      category=category,
+      internal_name=self._get_procedure_name(command_dict),
+      name=name,
+      description=description,
+      command_dict=command_dict,
+      command_editor_widget=None,
+      visible=category.expanded,
+    )
+
+    tree_iter = self._tree_model.append([
+        GLib.markup_escape_text(command_row.name),
+        command_row.visible,
+        None,
+        command_row,
+    ])
+
+    command_row.tree_iter = tree_iter
+
+    self._command_rows.append(command_row)
+    category.command_rows.append(command_row)
+
+    self._command_rows_visible_via_search.add(command_row)
+    category.num_command_rows_visible_via_search += 1
+
+    return command_row
+
+  def _revalidate_cached_commands(
+        self, command_rows, cache_entries, cache_filepath, cache_key, fingerprint):
+    num_revalidated_commands = 0
+
+    for command_row in itertools.islice(
+          command_rows, self._NUM_COMMANDS_TO_REVALIDATE_PER_IDLE_CALL):
+      num_revalidated_commands += 1
+
+      name = command_row.internal_name
+
+      command_dict, category_name = self._get_command_dict_and_category_name(name)
+      raw_command_dict = browser_cache_.command_dict_to_raw(command_dict)
+
+      if raw_command_dict is not None:
+        cache_entry = {'category': category_name, 'command_dict': raw_command_dict}
+      else:
+        cache_entry = None
+
+      if cache_entries.get(name) == cache_entry:
+        continue
+
+      if cache_entry is not None:
+        cache_entries[name] = cache_entry
+      else:
+        cache_entries.pop(name, None)
+
+      # Rows whose commands are already displayed are left intact to preserve
+      # any values modified by the user. Rows changing their category are
+      # displayed under the new category the next time the browser is filled.
+      if command_row.command_editor_widget is None and command_row.category.name == category_name:
+        command_dict['enabled'] = False
+        command_row.command_dict = command_dict
+        command_row.name, command_row.description = (
+          self._get_command_row_name_and_description(command_dict))
+
+        self._tree_model.set_value(
+          command_row.tree_iter,
+          self._COLUMN_COMMAND_NAME[0],
+          GLib.markup_escape_text(command_row.name))
+
+        self._search_index.update(command_row)
+
+    if num_revalidated_commands < self._NUM_COMMANDS_TO_REVALIDATE_PER_IDLE_CALL:
+      browser_cache_.save(cache_filepath, cache_key, fingerprint, cache_entries)
+      return False
+    else:
+      return True
+
   def _select_first_visible_command(self):
     def _is_visible_command(command_row):
       return command_row.type_ == _CommandBrowserItemTypes.COMMAND and command_row.visible
@@ -686,48 +908,58 @@ def _update_visibility_and_category_expanded_state(self, *_args, origin='search'
       self._tree_view_selection_changed_event_handler_id,
     )
 
-    search_queries = self._get_search_queries()
-
     tree_model, selected_iter = self._tree_view.get_selection().get_selected()
-    selected_command_row = None
+
+    if selected_iter is not None:
+      selected_command_row = tree_model[selected_iter][self._COLUMN_COMMAND_ROW[0]]
+    else:
+      selected_command_row = None
 
     if origin == 'search':
-      if selected_iter is not None:
-        selected_command_row = tree_model[selected_iter][self._COLUMN_COMMAND_ROW[0]]
-        selected_visible_via_search = self._get_row_visibility_based_on_search(
-          search_queries, selected_command_row)
+      matching_rows = self._get_rows_matching_search()
+
+      # Only rows whose visibility changed are updated, so that the cost of
+      # a search is proportional to the number of matching rows rather than
+      # to the number of all rows.
+      command_rows_to_update = self._update_command_rows_visible_via_search(matching_rows)
+
+      if selected_command_row is not None:
+        selected_visible_via_search = matching_rows is None or selected_command_row in matching_rows
 
         should_select_different_command = (
           not (selected_visible_via_search and selected_command_row.category.expanded))
       else:
         should_select_different_command = True
     else:
+      command_rows_to_update = [
+        command_row for command_row in self._command_rows
+        if command_row.type_ == _CommandBrowserItemTypes.COMMAND]
+
       should_select_different_command = False
 
     row_to_select = None
 
-    if selected_command_row is not None:
-      start_index = self._command_rows_and_indexes[selected_command_row]
+    if should_select_different_command:
+      command_row_to_select = self._get_next_command_row_visible_via_search(selected_command_row)
 
-      for command_row in self._command_rows[start_index:]:
-        row_to_select = self._update_row_and_category_properties(
-          command_row,
-          origin,
-          search_queries,
-          should_select_different_command,
-          row_to_select,
-        )
-    else:
-      start_index = None
+      if command_row_to_select is not None:
+        row_to_select = self._tree_model[command_row_to_select.tree_iter]
 
-    for command_row in self._command_rows[:start_index]:
-      row_to_select = self._update_row_and_category_properties(
-        command_row,
-        origin,
-        search_queries,
-        should_select_different_command,
-        row_to_select,
-      )
+        category = command_row_to_select.category
+
+        if not category.expanded:
+          _current_icon_name, new_icon_name = self._get_icon_names_based_on_expanded_state(
+            category)
+          self._tree_model.set_value(
+            category.tree_iter, self._COLUMN_ICON_NAME_PARENT[0], new_icon_name)
+
+          category.expanded = True
+
+          command_rows_to_update = itertools.chain(
+            command_rows_to_update, category.command_rows)
+
+    for command_row in command_rows_to_update:
+      self._update_command_row_visibility(command_row)
 
     self._set_category_visibility()
 
@@ -744,67 +976,75 @@ def _update_visibility_and_category_expanded_state(self, *_args, origin='search'
     # changed or not.
     self._tree_view.get_selection().emit('changed')
 
-  def _update_row_and_category_properties(
-        self,
-        command_row,
-        origin,
-        search_queries,
-        should_select_different_command,
-        row_to_select,
-  ):
-    row = self._tree_model[command_row.tree_iter]
+  def _get_rows_matching_search(self):
+    """Returns a set of rows matching the current search query, or ``None`` if
+    all rows match.
+    """
+    search_queries = self._get_search_queries()
 
-    if command_row.type_ == _CommandBrowserItemTypes.PARENT:
-      return row_to_select
+    attribute_names = []
+    if self._menu_item_by_name.get_active():
+      attribute_names.append('name')
+    if self._menu_item_by_internal_name.get_active():
+      attribute_names.append('internal_name')
+    if self._menu_item_by_description.get_active():
+      attribute_names.append('description')
 
-    if origin == 'search':
-      visible_via_search = self._get_row_visibility_based_on_search(search_queries, command_row)
-      command_row.visible_via_search = visible_via_search
-    else:
-      visible_via_search = command_row.visible_via_search
+    if not search_queries or not attribute_names:
+      return None
 
-    if visible_via_search:
-      if should_select_different_command and row_to_select is None:
-        if origin == 'search':
-          row_to_select = row
+    matching_rows = set()
 
-          if not command_row.category.expanded:
-            _current_icon_name, new_icon_name = self._get_icon_names_based_on_expanded_state(
-              command_row.category)
-            self._tree_model.set_value(
-              command_row.category.tree_iter, self._COLUMN_ICON_NAME_PARENT[0], new_icon_name)
+    for search_query in search_queries:
+      matching_rows.update(self._search_index.search(search_query, attribute_names))
 
-            command_row.category.expanded = True
-        else:
-          if command_row.category.expanded:
-            row_to_select = row
+    return matching_rows
 
-    command_row.visible = visible_via_search and command_row.category.expanded
+  def _update_command_rows_visible_via_search(self, matching_rows):
+    if matching_rows is None:
+      command_rows_visible_via_search = set(
+        command_row for command_row in self._command_rows
+        if command_row.type_ == _CommandBrowserItemTypes.COMMAND)
+    else:
+      command_rows_visible_via_search = set(
+        command_row for command_row in matching_rows
+        if command_row.type_ == _CommandBrowserItemTypes.COMMAND)
 
-    row[self._COLUMN_COMMAND_VISIBLE[0]] = command_row.visible
+    changed_command_rows = command_rows_visible_via_search ^ self._command_rows_visible_via_search
 
-    return row_to_select
+    for command_row in changed_command_rows:
+      command_row.visible_via_search = command_row in command_rows_visible_via_search
 
-  def _get_row_visibility_based_on_search(self, search_queries, command_row):
-    if not search_queries:
-      return True
+      if command_row.visible_via_search:
+        command_row.category.num_command_rows_visible_via_search += 1
+      else:
+        command_row.category.num_command_rows_visible_via_search -= 1
 
-    enabled_search_criteria = []
-    if self._menu_item_by_name.get_active():
-      enabled_search_criteria.append(self._process_text_for_search(command_row.name))
-    if self._menu_item_by_internal_name.get_active():
-      enabled_search_criteria.append(self._process_text_for_search(command_row.internal_name))
-    if self._menu_item_by_description.get_active():
-      enabled_search_criteria.append(self._process_text_for_search(command_row.description))
+    self._command_rows_visible_via_search = command_rows_visible_via_search
 
-    if enabled_search_criteria:
-      visible = False
-      for search_query in search_queries:
-        visible = visible or any(search_query in text for text in enabled_search_criteria)
+    return changed_command_rows
 
-      return visible
+  def _get_next_command_row_visible_via_search(self, selected_command_row):
+    if selected_command_row is not None:
+      start_index = self._command_rows_and_indexes[selected_command_row]
     else:
-      return True
+      start_index = 0
+
+    num_command_rows = len(self._command_rows)
+
+    return min(
+      self._command_rows_visible_via_search,
+      key=lambda command_row: (
+        (self._command_rows_and_indexes[command_row] - start_index) % num_command_rows),
+      default=None,
+    )
+
+  def _update_command_row_visibility(self, command_row):
+    visible = command_row.visible_via_search and command_row.category.expanded
+
+    if visible != command_row.visible:
+      command_row.visible = visible
+      self._tree_model.set_value(command_row.tree_iter, self._COLUMN_COMMAND_VISIBLE[0], visible)
 
   def _get_search_queries(self):
     query_str = self._process_text_for_search(self._entry_search.get_text())
@@ -817,9 +1057,7 @@ def _process_text_for_search(text):
 
   def _set_category_visibility(self):
     for category in self._command_categories.values():
-      num_command_rows_visible_via_search_per_category = [
-        command_row.visible_via_search for command_row in category.command_rows].count(True)
-      category.visible = num_command_rows_visible_via_search_per_category > 0
+      category.visible = category.num_command_rows_visible_via_search > 0
       self._tree_model.set_value(
         category.tree_iter, self._COLUMN_COMMAND_VISIBLE[0], category.visible)
 
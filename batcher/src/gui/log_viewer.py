@@ -5,6 +5,7 @@
 import gi
 gi.require_version('GimpUi', '3.0')
 from gi.repository import GimpUi
+from gi.repository import GLib
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
@@ -21,11 +22,16 @@ class LogViewer:
 
   _MAX_MESSAGE_LINES = 20_000
 
+  _ADD_MESSAGES_INTERVAL_MILLISECONDS = 1000 // 30
+
   def __init__(self, parent, display_message_func=None):
     self._parent = parent
     self._display_message_func = (
       display_message_func if display_message_func is not None else utils.empty_func)
 
+    self._pending_messages = []
+    self._add_pending_messages_timeout_id = None
+
     self._scrolled_window = Gtk.ScrolledWindow(
       width_request=self._CONTENTS_MIN_WIDTH,
       height_request=self._CONTENTS_MIN_HEIGHT,
@@ -77,7 +83,36 @@ def widget(self):
     return self._dialog
 
   def add_message(self, message):
-    self._text_buffer.insert(self._text_buffer.get_end_iter(), message, -1)
+    """Adds a message to the end of the log.
+
+    Messages are not displayed immediately, but added in batches periodically
+    since adding each message separately is slow if many messages are logged
+    in a short amount of time. Call `flush()` to display pending messages
+    immediately.
+    """
+    self._pending_messages.append(message)
+
+    if self._add_pending_messages_timeout_id is None:
+      self._add_pending_messages_timeout_id = GLib.timeout_add(
+        self._ADD_MESSAGES_INTERVAL_MILLISECONDS, self._add_pending_messages)
+
+  def flush(self):
+    """Displays all pending messages added via `add_message()`."""
+    if self._add_pending_messages_timeout_id is not None:
+      GLib.source_remove(self._add_pending_messages_timeout_id)
+
+    self._add_pending_messages()
+
+  def _add_pending_messages(self):
+    self._add_pending_messages_timeout_id = None
+
+    if not self._pending_messages:
+      return False
+
+    self._text_buffer.insert(
+      self._text_buffer.get_end_iter(), ''.join(self._pending_messages), -1)
+
+    self._pending_messages = []
 
     num_lines = self._text_buffer.get_line_count()
 
@@ -86,6 +121,8 @@ def add_message(self, message):
         self._text_buffer.get_iter_at_line(0),
         self._text_buffer.get_iter_at_line(num_lines - self._MAX_MESSAGE_LINES))
 
+    return False
+
   def _on_text_view_size_allocate(self, _text_view, _allocation):
     self._text_view.scroll_to_iter(
       self._text_buffer.get_end_iter(),
@@ -136,6 +173,8 @@ def _on_save_logs_dialog_response(self, file_dialog, response_id):
     file_dialog.destroy()
 
     if filepath:
+      self.flush()
+
       with open(filepath, 'w', encoding=constants.TEXT_FILE_ENCODING) as file:
         file.write(
           self._text_buffer.get_text(
@@ -263,12 +263,14 @@ def _handle_gui_in_export(run_mode, _image, _layer, _output_filepath, window):
   if should_manipulate_window:
     window_position = window.get_position()
     window.hide()
+
+    while Gtk.events_pending():
+      Gtk.main_iteration()
   else:
+    # Pending events are processed by the progress updater at a limited rate,
+    # hence there is no need to process them on each export.
     window_position = None
 
-  while Gtk.events_pending():
-    Gtk.main_iteration()
-
   try:
     yield
   finally:
@@ -276,5 +278,5 @@ def _handle_gui_in_export(run_mode, _image, _layer, _output_filepath, window):
       window.move(*window_position)
       window.show()
 
-    while Gtk.events_pending():
-      Gtk.main_iteration()
+      while Gtk.events_pending():
+        Gtk.main_iteration()
@@ -643,13 +643,21 @@ def _on_menu_item_sort_by_new_name_activate(self, _menu_item):
     self._sort_items(lambda item: self._get_name_key(item, 'name', case_sensitive))
 
   def _on_menu_item_sort_by_modification_date_activate(self, _menu_item):
-    self._sort_items(lambda item: self._get_file_specific_key(item, 'st_mtime'))
+    self._sort_items_by_file_specific_key('st_mtime')
 
   def _on_menu_item_sort_by_creation_date_activate(self, _menu_item):
-    self._sort_items(lambda item: self._get_file_specific_key(item, 'st_birthtime'))
+    self._sort_items_by_file_specific_key('st_birthtime')
 
   def _on_menu_item_sort_by_file_size_activate(self, _menu_item):
-    self._sort_items(lambda item: self._get_file_specific_key(item, 'st_size'))
+    self._sort_items_by_file_specific_key('st_size')
+
+  def _sort_items_by_file_specific_key(self, attribute):
+    item_tree = self._name_preview.batcher.item_tree
+
+    if isinstance(item_tree, itemtree.ImageFileTree):
+      item_tree.prefetch_stats()
+
+    self._sort_items(lambda item: self._get_file_specific_key(item, attribute))
 
   def _sort_items(self, key):
     folders_first = self._menu_item_folders_first.get_active()
@@ -676,9 +684,9 @@ def _get_name_key(item, attribute, case_sensitive):
 
   @staticmethod
   def _get_file_specific_key(item, attribute):
-    try:
-      return getattr(os.stat(item.id), attribute)
-    except Exception:
+    if isinstance(item, itemtree.ImageFileItem) and item.stat is not None:
+      return getattr(item.stat, attribute, -1)
+    else:
       return -1
 
   def _on_name_preview_key_press_event(self, _tree_view, event):
@@ -751,27 +759,27 @@ def _on_name_preview_key_press_event(self, _tree_view, event):
     return False
 
   def _add_items_to_name_preview(self, paths):
-    can_add = self._check_files_and_warn_if_needed(paths)
-    if can_add:
-      self._name_preview.add_items(paths)
+    # Files are counted while the items are being added so that folders are
+    # traversed only once.
+    self._name_preview.add_items(
+      paths, add_item_callback=self._get_add_item_callback_to_warn_if_needed())
 
-  def _check_files_and_warn_if_needed(self, paths):
+  def _get_add_item_callback_to_warn_if_needed(self):
     warned_on_count_first_threshold = False
     warned_on_count_second_threshold = False
-    can_continue = True
+    path_count = 0
 
     def _warn_on_adding_top_level_folder(dirpath_):
-      nonlocal can_continue
-
       if len(pathlib.Path(dirpath_).parts) <= 2:
-        can_continue = self._warn_on_adding_items(
+        return self._warn_on_adding_items(
           _('You are about to add a top-level folder named "{}".'
             ' Are you sure you want to continue?').format(dirpath_))
+      else:
+        return True
 
     def _warn_on_exceeding_file_count_thresholds(path_count_):
       nonlocal warned_on_count_first_threshold
       nonlocal warned_on_count_second_threshold
-      nonlocal can_continue
 
       if not warned_on_count_first_threshold and path_count_ > self._FILE_COUNT_FIRST_THRESHOLD:
         warned_on_count_first_threshold = True
@@ -781,7 +789,7 @@ def _warn_on_exceeding_file_count_thresholds(path_count_):
             self._FILE_COUNT_FIRST_THRESHOLD))
 
         if not can_continue:
-          return
+          return False
 
       if not warned_on_count_second_threshold and path_count_ > self._FILE_COUNT_SECOND_THRESHOLD:
         warned_on_count_second_threshold = True
@@ -793,44 +801,24 @@ def _warn_on_exceeding_file_count_thresholds(path_count_):
             self._FILE_COUNT_SECOND_THRESHOLD))
 
         if not can_continue:
-          return
-
-    filepaths = []
-    dirpaths = []
-    for path in paths:
-      if os.path.isdir(path):
-        dirpaths.append(path)
-      else:
-        filepaths.append(path)
-
-    path_count = len(filepaths)
-
-    _warn_on_exceeding_file_count_thresholds(path_count)
-
-    if warned_on_count_first_threshold and not can_continue:
-      return False
-
-    if warned_on_count_second_threshold:
-      return can_continue
-
-    for dirpath in dirpaths:
-      _warn_on_adding_top_level_folder(dirpath)
-
-      if not can_continue:
-        return False
+          return False
 
-      for _root_dirpath, _dirnames, filenames in os.walk(dirpath):
-        path_count += len(filenames)
+      return True
 
-        _warn_on_exceeding_file_count_thresholds(path_count)
+    def _add_item_callback(item):
+      nonlocal path_count
 
-        if warned_on_count_first_threshold and not can_continue:
-          return False
+      if item.type == itemtree.TYPE_FOLDER:
+        if not item.parents and not warned_on_count_second_threshold:
+          return _warn_on_adding_top_level_folder(item.id)
+        else:
+          return True
+      else:
+        path_count += 1
 
-        if warned_on_count_second_threshold:
-          return can_continue
+        return _warn_on_exceeding_file_count_thresholds(path_count)
 
-    return True
+    return _add_item_callback
 
   def _warn_on_adding_items(self, message_markup):
     response_id = messages_.display_alert_message(
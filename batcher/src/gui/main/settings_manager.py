@@ -109,7 +109,7 @@ def save_settings(self, filepath=None):
     if filepath is None:
       save_result = self._settings.save()
     else:
-      source = setting_.sources.JsonFileSource(CONFIG.PROCEDURE_GROUP, filepath)
+      source = setting_.sources.CachedJsonFileSource(CONFIG.PROCEDURE_GROUP, filepath)
       save_result = self._settings.save({'persistent': source})
 
     if setting_.Persistor.FAIL in save_result.statuses_per_source.values():
@@ -200,7 +200,7 @@ def _save_settings_to_default_location(self):
       self._display_message_func(_('Settings successfully saved.'))
 
   def _load_settings_from_file(self, filepath):
-    source = setting_.sources.JsonFileSource(CONFIG.PROCEDURE_GROUP, filepath)
+    source = setting_.sources.CachedJsonFileSource(CONFIG.PROCEDURE_GROUP, filepath)
 
     commands_.clear(self._settings['main/actions'], add_initial_commands=False)
     commands_.clear(self._settings['main/conditions'], add_initial_commands=False)
@@ -59,7 +59,6 @@ class NamePreview(preview_base_.Preview):
     _COLUMN_ICON_ITEM_VISIBLE,
     _COLUMN_ICON_COLOR_TAG,
     _COLUMN_ICON_COLOR_TAG_VISIBLE,
-    _COLUMN_ITEM_NAME,
     _COLUMN_ITEM_KEY,
     _COLUMN_ITEM_ID,
   ) = (
@@ -67,9 +66,8 @@ class NamePreview(preview_base_.Preview):
     [1, GObject.TYPE_BOOLEAN],
     [2, GdkPixbuf.Pixbuf],
     [3, GObject.TYPE_BOOLEAN],
-    [4, GObject.TYPE_STRING],
-    [5, GObject.TYPE_PYOBJECT],
-    [6, GObject.TYPE_STRING],
+    [4, GObject.TYPE_PYOBJECT],
+    [5, GObject.TYPE_STRING],
   )
 
   _ICON_XPAD = 2
@@ -102,12 +100,23 @@ def __init__(
 
     self._tagged_items = set()
     
+    # Rows are only created for children of folders that are expanded or were
+    # expanded at least once. Collapsed folders whose children have not been
+    # added yet contain a single placeholder row so that the folders can be
+    # expanded.
+    #
     # key: `Item.key`
     # value: `Gtk.TreeIter` instance
     self._tree_iters = collections.defaultdict(utils.return_none_func)
+    # key: `Item.key` of a folder
+    # value: `Gtk.TreeIter` instance of the placeholder row
+    self._placeholder_tree_iters = {}
     # key: tuple of `Item.key` representing parents of an item
     # value: dict of (`Item.key`, None) pairs having the same parents (the key)
-    self._cached_parent_and_item_keys = {}
+    self._parent_and_item_keys = {}
+    # Same as `_parent_and_item_keys`, but only containing parents whose
+    # children have rows in the tree view.
+    self._materialized_parent_and_item_keys = {}
 
     self._row_expand_collapse_interactive = True
     self._clearing_preview = False
@@ -170,6 +179,8 @@ def clear(self):
     self._clearing_preview = True
     self._tree_model.clear()
     self._tree_iters.clear()
+    self._placeholder_tree_iters.clear()
+    self._materialized_parent_and_item_keys = {}
     self._clearing_preview = False
 
   def set_sensitive(self, sensitive):
@@ -243,10 +254,15 @@ def get_item_from_path(self, tree_path):
   def set_show_original_name(self, show_original_name):
     self._show_original_name = show_original_name
 
-  def add_items(self, objects):
-    added_items = self._batcher.item_tree.add(objects)
+  def add_items(self, objects, add_item_callback=None):
+    """Adds the specified objects to the item tree.
 
-    self.emit('preview-added-items', added_items)
+    See `itemtree.ItemTree.add()` for information about ``add_item_callback``.
+    """
+    added_items = self._batcher.item_tree.add(objects, add_item_callback=add_item_callback)
+
+    if added_items:
+      self.emit('preview-added-items', added_items)
 
   def reorder_item(self, item_key, reference_item, insertion_mode):
     item = self._batcher.item_tree[item_key]
@@ -317,9 +333,10 @@ def _init_gui(self):
     
     cell_renderer_item_name = Gtk.CellRendererText()
     column.pack_start(cell_renderer_item_name, False)
-    column.set_attributes(
-      cell_renderer_item_name,
-      text=self._COLUMN_ITEM_NAME[0])
+    # Item names are obtained only when rows are displayed (or measured) rather
+    # than stored in the model, which would require updating all rows on each
+    # preview update.
+    column.set_cell_data_func(cell_renderer_item_name, self._set_item_name_cell_data)
     
     self._tree_view.append_column(column)
     
@@ -332,6 +349,7 @@ def _init_gui(self):
     self.pack_start(self._scrolled_window, True, True, 0)
     
     self._tree_view.connect('row-collapsed', self._on_tree_view_row_collapsed)
+    self._tree_view.connect('test-expand-row', self._on_tree_view_test_expand_row)
     self._tree_view.connect('row-expanded', self._on_tree_view_row_expanded)
     self._tree_view.get_selection().connect('changed', self._on_tree_selection_changed)
   
@@ -375,6 +393,14 @@ def _get_color_tag_pixbuf(self, color_tag):
     else:
       return None
 
+  def _set_item_name_cell_data(self, _column, cell_renderer, _tree_model, tree_iter, _data):
+    item_key = self._get_key_from_tree_iter(tree_iter)
+
+    if item_key is not None and item_key in self._batcher.item_tree:
+      cell_renderer.set_property('text', self._get_item_name(self._batcher.item_tree[item_key]))
+    else:
+      cell_renderer.set_property('text', '')
+
   def _on_tree_view_row_collapsed(self, _tree_view, _tree_iter, tree_path):
     if self._row_expand_collapse_interactive:
       self._collapsed_items.add(self._get_key_from_tree_iter(self._tree_model.get_iter(tree_path)))
@@ -382,6 +408,20 @@ def _on_tree_view_row_collapsed(self, _tree_view, _tree_iter, tree_path):
 
       self.emit('preview-collapsed-items-changed')
   
+  def _on_tree_view_test_expand_row(self, _tree_view, tree_iter, _tree_path):
+    if self._row_expand_collapse_interactive:
+      item_key = self._get_key_from_tree_iter(tree_iter)
+
+      if item_key in self._placeholder_tree_iters and item_key in self._batcher.item_tree:
+        self._row_select_interactive = False
+
+        self._materialize_children(self._batcher.item_tree[item_key])
+
+        self._row_select_interactive = True
+
+    # Returning `False` allows the row to be expanded.
+    return False
+
   def _on_tree_view_row_expanded(self, _tree_view, tree_iter, tree_path):
     if self._row_expand_collapse_interactive:
       item_key = self._get_key_from_tree_iter(tree_iter)
@@ -406,9 +446,11 @@ def _on_tree_selection_changed(self, _tree_selection):
 
   def _get_keys_from_current_selection(self):
     _unused, tree_paths = self._tree_view.get_selection().get_selected_rows()
-    return [
+    item_keys = [
       self._get_key_from_tree_iter(self._tree_model.get_iter(tree_path))
       for tree_path in tree_paths]
+    # Placeholder rows have no key.
+    return [item_key for item_key in item_keys if item_key is not None]
   
   def _get_key_from_tree_iter(self, tree_iter):
     return self._tree_model.get_value(tree_iter, column=self._COLUMN_ITEM_KEY[0])
@@ -457,21 +499,27 @@ def _process_items(self, full_update=False):
   def _sync_new_items_with_tree_view(self):
     self._row_select_interactive = False
 
-    new_parent_and_item_keys = self._get_parent_and_item_keys()
+    self._remove_no_longer_valid_collapsed_items()
+
+    self._parent_and_item_keys = self._get_parent_and_item_keys()
+
+    new_parent_and_item_keys = self._get_parent_and_item_keys_to_materialize(
+      self._parent_and_item_keys)
 
-    # Remove no longer existing folders or items moved to a different parent.
+    # Remove no longer existing folders, items moved to a different parent or
+    # items whose parents are no longer displayed.
     # We are iterating in reverse so that we remove the innermost child iters
     # first. Iterating from the top would result in crashes when attempting
     # to remove a child iter whose parent was already removed.
     for original_parent_keys, original_item_keys in reversed(
-          self._cached_parent_and_item_keys.items()):
+          self._materialized_parent_and_item_keys.items()):
       if original_parent_keys not in new_parent_and_item_keys:
         for key in original_item_keys:
           self._remove_item_if_exists(key)
 
     # Remove no longer existing items.
     for new_parent_keys, new_item_keys in reversed(new_parent_and_item_keys.items()):
-      original_item_keys = self._cached_parent_and_item_keys.get(new_parent_keys, None)
+      original_item_keys = self._materialized_parent_and_item_keys.get(new_parent_keys, None)
       if original_item_keys:
         item_keys_to_remove = [key for key in original_item_keys if key not in new_item_keys]
         for item_key in item_keys_to_remove:
@@ -483,19 +531,17 @@ def _sync_new_items_with_tree_view(self):
     # We need to iterate in the normal order here so that we insert parents
     # first and then correctly insert children under the newly created parents.
     for new_parent_keys, new_item_keys in new_parent_and_item_keys.items():
-      original_item_keys = self._cached_parent_and_item_keys.get(new_parent_keys, {})
+      if new_parent_keys:
+        self._remove_placeholder_if_exists(new_parent_keys[-1])
+
+      original_item_keys = self._materialized_parent_and_item_keys.get(new_parent_keys, {})
       original_item_keys_list = list(original_item_keys)
 
-      # Update existing items and add new items.
+      # Add new items. Existing items need not be updated as item names are
+      # obtained only when the rows are displayed.
       for item_key in new_item_keys:
-        item = self._batcher.item_tree[item_key]
-
-        if item_key in original_item_keys:
-          iter_from_item = self._tree_iters[item_key]
-
-          self._update_item(iter_from_item, item)
-        else:
-          self._insert_item(item, None, 'before')
+        if item_key not in original_item_keys:
+          self._insert_item(self._batcher.item_tree[item_key], None, 'before')
           original_item_keys_list.append(item_key)
 
       # Move items to the correct order. We are attempting to minimize the
@@ -522,10 +568,81 @@ def _sync_new_items_with_tree_view(self):
 
         self._move_item_within_parent(iter_from_item, reference_iter, 'after')
 
-    self._cached_parent_and_item_keys = new_parent_and_item_keys
+    # Add placeholders to displayed folders whose children are not displayed
+    # and remove placeholders from folders no longer having children.
+    folder_keys_with_placeholders = set()
+    for parent_keys in self._parent_and_item_keys:
+      if parent_keys and parent_keys not in new_parent_and_item_keys:
+        folder_keys_with_placeholders.add(parent_keys[-1])
+        self._add_placeholder_if_not_exists(parent_keys[-1])
+
+    for folder_key in list(self._placeholder_tree_iters):
+      if folder_key not in folder_keys_with_placeholders:
+        self._remove_placeholder_if_exists(folder_key)
+
+    self._materialized_parent_and_item_keys = new_parent_and_item_keys
 
     self._row_select_interactive = True
 
+  def _get_parent_and_item_keys_to_materialize(self, parent_and_item_keys):
+    """Returns a subset of ``parent_and_item_keys`` containing only parents
+    whose children should have rows in the tree view.
+
+    Children are displayed for top-level items and for folders that are
+    displayed and are either not collapsed or had their children displayed
+    before.
+    """
+    parent_and_item_keys_to_materialize = {}
+
+    # Parents are guaranteed to precede their children in
+    # `parent_and_item_keys`, see `_get_parent_and_item_keys()`.
+    for parent_keys, item_keys in parent_and_item_keys.items():
+      if (not parent_keys
+          or (parent_keys[:-1] in parent_and_item_keys_to_materialize
+              and (parent_keys in self._materialized_parent_and_item_keys
+                   or parent_keys[-1] not in self._collapsed_items))):
+        parent_and_item_keys_to_materialize[parent_keys] = item_keys
+
+    return parent_and_item_keys_to_materialize
+
+  def _materialize_children(self, folder_item):
+    """Adds rows for children of the specified folder, replacing its
+    placeholder row.
+
+    Rows are also added recursively for child folders that are not collapsed.
+    """
+    parent_keys = tuple(parent.key for parent in folder_item.parents) + (folder_item.key,)
+    item_keys = self._parent_and_item_keys.get(parent_keys, {})
+
+    self._remove_placeholder_if_exists(folder_item.key)
+
+    for item_key in item_keys:
+      self._insert_item(self._batcher.item_tree[item_key], None, 'before')
+
+    self._materialized_parent_and_item_keys[parent_keys] = dict(item_keys)
+
+    for item_key in item_keys:
+      item = self._batcher.item_tree[item_key]
+      if parent_keys + (item_key,) in self._parent_and_item_keys:
+        if item_key not in self._collapsed_items:
+          self._materialize_children(item)
+        else:
+          self._add_placeholder_if_not_exists(item_key)
+
+  def _add_placeholder_if_not_exists(self, folder_key):
+    if folder_key in self._placeholder_tree_iters or folder_key not in self._tree_iters:
+      return
+
+    self._placeholder_tree_iters[folder_key] = self._tree_model.append(
+      self._tree_iters[folder_key],
+      [None, False, None, False, None, ''])
+
+  def _remove_placeholder_if_exists(self, folder_key):
+    placeholder_tree_iter = self._placeholder_tree_iters.pop(folder_key, None)
+
+    if placeholder_tree_iter is not None:
+      self._tree_model.remove(placeholder_tree_iter)
+
   @staticmethod
   def _find_longest_increasing_subsequence(values):
     if not values:
@@ -610,7 +727,6 @@ def _insert_item(self, item, reference_iter, insertion_mode):
         item_icon_name is not None,
         color_tag_icon,
         color_tag_icon is not None,
-        self._get_item_name(item),
         item.key,
         str(item.id),
       ],
@@ -686,12 +802,6 @@ def _get_item_name(self, item):
     else:
       return item.orig_name
 
-  def _update_item(self, tree_iter, item):
-    self._tree_model.set_value(
-      tree_iter,
-      self._COLUMN_ITEM_NAME[0],
-      self._get_item_name(item))
-
   def _move_item_within_parent(self, tree_iter, reference_iter, insertion_mode):
     if insertion_mode == 'before':
       self._tree_model.move_before(tree_iter, reference_iter)
@@ -701,6 +811,8 @@ def _move_item_within_parent(self, tree_iter, reference_iter, insertion_mode):
       raise ValueError(f'insertion mode {insertion_mode} is not valid')
 
   def _remove_item_if_exists(self, item_key):
+    self._remove_placeholder_if_exists(item_key)
+
     iter_to_remove = self._tree_iters.pop(item_key, None)
 
     if iter_to_remove is not None:
@@ -1,5 +1,6 @@
 """GTK progress bar updater."""
 
+import time
 from typing import Optional
 
 import gi
@@ -10,16 +11,67 @@
 
 
 class GtkProgressUpdater(progress_.ProgressUpdater):
-  
+  """Class updating a GTK progress bar.
+
+  Updating the progress bar requires processing pending GTK events, which
+  can take more time than processing an item itself. The progress bar is
+  therefore updated at most `MAX_UPDATES_PER_SECOND` times per second, except
+  when all tasks are finished or the progress is reset. Updates in between
+  are coalesced, i.e. only the most recent fraction and text are displayed.
+
+  Processing GTK events also allows the user to e.g. stop the processing. The
+  events are processed with each displayed update.
+  """
+
+  MAX_UPDATES_PER_SECOND = 30
+
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+
+    self._fraction = None
+    self._text = None
+    self._last_update_time = None
+
+  def reset(self):
+    super().reset()
+
+    self.flush()
+
+  def flush(self):
+    """Displays the most recent fraction and text in the progress bar
+    regardless of the time elapsed since the last update.
+    """
+    self._update(force=True)
+
   def _fill_progress_bar(self):
-    self.progress_bar.set_fraction(self._num_finished_tasks / self.num_total_tasks)
-    self._force_update()
-  
+    self._fraction = self._num_finished_tasks / self.num_total_tasks
+    self._update(force=self._num_finished_tasks >= self.num_total_tasks)
+
   def _set_text_progress_bar(self, text: Optional[str]):
-    self.progress_bar.set_show_text(bool(text))
-    self.progress_bar.set_text(text)
+    self._text = text
+    self._update()
+
+  def _update(self, force=False):
+    current_time = time.monotonic()
+
+    if (not force
+        and self._last_update_time is not None
+        and current_time - self._last_update_time < 1 / self.MAX_UPDATES_PER_SECOND):
+      return
+
+    self._last_update_time = current_time
+
+    if self._fraction is not None:
+      self.progress_bar.set_fraction(self._fraction)
+      self._fraction = None
+
+    if self._text is not None:
+      self.progress_bar.set_show_text(bool(self._text))
+      self.progress_bar.set_text(self._text)
+      self._text = None
+
     self._force_update()
-  
+
   @staticmethod
   def _force_update():
     # This is necessary for the GTK progress bar to be updated properly.
@@ -6,6 +6,7 @@
 from collections.abc import Iterable
 import contextlib
 import itertools
+import sys
 from typing import Any, Callable, Dict, Generator, List, Optional, Union
 
 
@@ -45,6 +46,9 @@ def __init__(self):
     
     # key: command ID; value: `_CommandItem` instance
     self._command_items = {}
+
+    # key: command group; value: `_GroupSnapshot` instance
+    self._group_snapshots = {}
   
   def add(
         self,
@@ -199,29 +203,19 @@ def invoke(
     """
     
     def _invoke_command(command, command_args, command_kwargs):
-      args = _get_args(command_args)
-      kwargs = dict(command_kwargs, **additional_kwargs)
-      return command(*args, **kwargs)
+      if additional_kwargs:
+        return command(*_get_args(command_args), **dict(command_kwargs, **additional_kwargs))
+      else:
+        return command(*_get_args(command_args), **command_kwargs)
 
     def _get_args(command_args):
       if additional_args_position is None:
-        return tuple(command_args) + tuple(additional_args)
+        return (*command_args, *additional_args)
       else:
         args = list(command_args)
         args[additional_args_position:additional_args_position] = additional_args
-        return tuple(args)
+        return args
     
-    def _invoke_command_with_foreach_commands(item_, group_):
-      with contextlib.ExitStack() as stack:
-        for foreach_item in self._foreach_commands[group_]:
-          try:
-            stack.enter_context(_invoke_command(*foreach_item.command))
-          except Exception as e:
-            raise TypeError(
-              f'for-each command {foreach_item.command[0]} is not a context manager') from e
-
-        return _invoke_command(*item_.command)
-
     def _invoke_invoker(invoker, group_):
       invoker.invoke([group_], additional_args, additional_kwargs, additional_args_position)
     
@@ -232,17 +226,22 @@ def _invoke_invoker(invoker, group_):
       if group not in self._commands:
         self._init_group(group)
       
-      # A command could be removed during invocation, hence create a list and
-      # later check for validity.
-      items = list(self._commands[group])
+      # A command could be removed during invocation, hence iterate over a
+      # snapshot of commands and later check for validity.
+      items = self._get_group_snapshot(group).command_items
       
       for item in items:
-        if item not in self._commands[group]:
+        if group not in item.groups:
           continue
         
         if item.command_type != self._TYPE_INVOKER:
-          if self._foreach_commands[group]:
-            _invoke_command_with_foreach_commands(item, group)
+          # For-each commands could be modified during invocation, hence obtain
+          # the current snapshot.
+          invoke_with_foreach_commands = (
+            self._get_group_snapshot(group).invoke_with_foreach_commands)
+
+          if invoke_with_foreach_commands is not None:
+            invoke_with_foreach_commands(_invoke_command, item)
           else:
             _invoke_command(*item.command)
         else:
@@ -447,6 +446,8 @@ def reorder(self, command_id: int, position: int, group: Optional[str] = None):
       position = max(len(command_lists[group]) + position + 1, 0)
     
     command_lists[group].insert(position, command_item)
+
+    self._invalidate_group_snapshot(group)
   
   def remove(
         self,
@@ -509,6 +510,8 @@ def remove_groups(self, groups: Union[None, str, List[str]] = None):
       
       del self._commands[group]
       del self._foreach_commands[group]
+
+      self._invalidate_group_snapshot(group)
   
   def _init_group(self, group):
     if group not in self._commands:
@@ -594,6 +597,8 @@ def _add_command(
 
     command_functions_dict[group][command] += 1
 
+    self._invalidate_group_snapshot(group)
+
   def _add_invoker(self, command_id, invoker, group, position):
     self._init_group(group)
     
@@ -606,6 +611,8 @@ def _add_invoker(self, command_id, invoker, group, position):
       self._commands[group].insert(position, command_item)
     
     self._invokers[group][invoker] += 1
+
+    self._invalidate_group_snapshot(group)
   
   def _get_command_id(self):
     return next(self._command_id_counter)
@@ -635,6 +642,8 @@ def _remove_command(self, command_id, group, command_lists, command_functions):
       del command_functions[group][command_item.command_function]
     
     self._remove_command_item(command_id, group)
+
+    self._invalidate_group_snapshot(group)
   
   def _remove_command_item(self, command_id, group):
     self._command_items[command_id].groups.remove(group)
@@ -642,6 +651,16 @@ def _remove_command_item(self, command_id, group):
     if not self._command_items[command_id].groups:
       del self._command_items[command_id]
   
+  def _get_group_snapshot(self, group):
+    if group not in self._group_snapshots:
+      self._group_snapshots[group] = _GroupSnapshot(
+        self._commands[group], self._foreach_commands[group])
+
+    return self._group_snapshots[group]
+
+  def _invalidate_group_snapshot(self, group):
+    self._group_snapshots.pop(group, None)
+
   def _process_groups_arg(self, groups):
     if groups is None or groups == 'default':
       return ['default']
@@ -727,6 +746,64 @@ def _process(self, *args, **kwargs):
     pass
 
 
+class _GroupSnapshot:
+  """Immutable copy of commands and for-each commands in a group.
+
+  A snapshot is created on the first invocation of a group and is discarded
+  whenever commands in the group are added, removed or reordered. This avoids
+  copying the commands and composing for-each commands on each invocation.
+  """
+
+  def __init__(self, command_items, foreach_command_items):
+    self.command_items = tuple(command_items)
+    self.foreach_command_items = tuple(foreach_command_items)
+
+    if self.foreach_command_items:
+      self.invoke_with_foreach_commands = self._compose_foreach_commands(
+        self.foreach_command_items)
+    else:
+      self.invoke_with_foreach_commands = None
+
+  @classmethod
+  def _compose_foreach_commands(cls, foreach_command_items):
+    def _invoke(invoke_command_func, item):
+      return invoke_command_func(*item.command)
+
+    # The first for-each command is entered first and exited last.
+    for foreach_item in reversed(foreach_command_items):
+      _invoke = cls._wrap_with_foreach_command(_invoke, foreach_item)
+
+    return _invoke
+
+  @staticmethod
+  def _wrap_with_foreach_command(invoke_func, foreach_item):
+    # This replicates the behavior of the `with` statement. We cannot use the
+    # statement directly as only errors on entering the context manager must
+    # be reported as invalid for-each commands.
+    def _invoke_with_foreach_command(invoke_command_func, item):
+      try:
+        context_manager = invoke_command_func(*foreach_item.command)
+        exit_func = type(context_manager).__exit__
+        type(context_manager).__enter__(context_manager)
+      except Exception as e:
+        raise TypeError(
+          f'for-each command {foreach_item.command[0]} is not a context manager') from e
+
+      try:
+        result = invoke_func(invoke_command_func, item)
+      except BaseException:
+        if not exit_func(context_manager, *sys.exc_info()):
+          raise
+
+        return None
+      else:
+        exit_func(context_manager, None, None, None)
+
+        return result
+
+    return _invoke_with_foreach_command
+
+
 class _CommandItem:
   
   def __init__(self, command, command_id, groups, command_type, command_function):
@@ -11,6 +11,7 @@
 import abc
 import collections
 from collections.abc import Iterable, Iterator
+import concurrent.futures
 import pathlib
 import os
 from typing import Any, Callable, Dict, Generator, List, Optional, Union
@@ -315,6 +316,9 @@ def __init__(self, *args, **kwargs):
 
     self._raw = None
 
+    self._stat = None
+    self._is_stat_obtained = False
+
   @property
   def raw(self) -> Union[Gimp.Image, None]:
     """`Gimp.Image` object, if loaded from the file path given by the `id`
@@ -340,6 +344,36 @@ def id(self) -> str:
     """
     return self._id
 
+  @property
+  def stat(self) -> Union[os.stat_result, None]:
+    """Result of `os.stat()` for the file path given by the `id` property, or
+    ``None`` if the file cannot be accessed (e.g. it no longer exists).
+
+    The result is obtained on the first access and then cached so that the file
+    system is not accessed repeatedly, e.g. when sorting items or preserving
+    the modification date of exported files. The cached result is discarded by
+    `reset_stat()`, which is invoked for all items in `ImageFileTree.refresh()`.
+    """
+    if not self._is_stat_obtained:
+      self._set_stat(self._get_stat())
+
+    return self._stat
+
+  def reset_stat(self):
+    """Discards the cached result of `stat`."""
+    self._stat = None
+    self._is_stat_obtained = False
+
+  def _get_stat(self) -> Union[os.stat_result, None]:
+    try:
+      return os.stat(self.id)
+    except OSError:
+      return None
+
+  def _set_stat(self, stat: Union[os.stat_result, None]):
+    self._stat = stat
+    self._is_stat_obtained = True
+
   def _list_child_objects(self) -> List[str]:
     item_path = os.path.abspath(self.id)
 
@@ -534,6 +568,7 @@ def add(
         insert_after_item: Optional[Item] = None,
         with_folders: bool = True,
         expand_folders: bool = True,
+        add_item_callback: Optional[Callable[[Item], bool]] = None,
   ) -> List[Item]:
     """Adds the specified objects as `Item` instances to the tree.
 
@@ -554,10 +589,19 @@ def add(
         If ``True``, all children of objects acting as folders will be added
         as `Item`s. If ``False``, only the folder itself will be added. This
         parameter has no effect if ``with_folders`` is ``False``.
+      add_item_callback:
+        If not ``None``, a function invoked for each `Item` being added (i.e.
+        not for items already existing in the tree). For folders, the function
+        is invoked before their children are obtained. The function accepts
+        the `Item` as its only argument and must return ``True`` to continue
+        or ``False`` to stop adding items, in which case the tree is left
+        unmodified. This allows e.g. asking the user for confirmation after a
+        number of items were encountered, without traversing folders twice.
 
     Returns:
       List of added `Item`s. If attempting to add objects that were already
-      added previously, these will not be returned.
+      added previously, these will not be returned. If adding items was stopped
+      by ``add_item_callback``, an empty list is returned.
 
     Raises:
       ValueError:
@@ -607,28 +651,38 @@ def add(
     for object_ in objects:
       self._insert_item(object_, child_items, list(parents_for_child_initial), with_folders)
 
-    item_tree = child_items
+    # A deque is used as folders may contain a large number of items, in which
+    # case inserting to and removing from the beginning of a list would be slow.
+    item_tree = collections.deque(child_items)
     added_items = []
 
     while item_tree:
-      item = item_tree.pop(0)
+      item = item_tree.popleft()
 
-      if item.type == TYPE_FOLDER:
-        item = self._add_item_to_itemtree(item, added_items)
+      num_added_items = len(added_items)
 
-        if expand_folders:
-          parents_for_child = list(item.parents)
-          parents_for_child.append(item)
-          child_items = []
+      item = self._add_item_to_itemtree(item, added_items)
 
-          # noinspection PyProtectedMember
-          for object_ in item._list_child_objects():
-            self._insert_item(object_, child_items, list(parents_for_child), with_folders)
+      if (add_item_callback is not None
+          and len(added_items) > num_added_items
+          and not add_item_callback(item)):
+        # Items are linked to adjacent items only after all items are added,
+        # hence removing them from the tree is sufficient.
+        for added_item in added_items:
+          del self._items[added_item.key]
 
-          for child_item in reversed(child_items):
-            item_tree.insert(0, child_item)
-      else:
-        item = self._add_item_to_itemtree(item, added_items)
+        return []
+
+      if item.type == TYPE_FOLDER and expand_folders:
+        parents_for_child = list(item.parents)
+        parents_for_child.append(item)
+        child_items = []
+
+        # noinspection PyProtectedMember
+        for object_ in item._list_child_objects():
+          self._insert_item(object_, child_items, list(parents_for_child), with_folders)
+
+        item_tree.extendleft(reversed(child_items))
 
     for i in range(1, len(added_items) - 1):
       # noinspection PyProtectedMember
@@ -1159,18 +1213,50 @@ class ImageFileTree(ItemTree):
   non-existent files are handled depends on the client code.
   """
 
+  _MIN_NUM_ITEMS_TO_PREFETCH_STATS_IN_PARALLEL = 32
+  _MAX_NUM_THREADS_TO_PREFETCH_STATS = 16
+
   def refresh(self):
-    """Resets attributes in all items and removes saved states from all items.
+    """Resets attributes in all items and removes saved states and cached
+    file information (`ImageFileItem.stat`) from all items.
 
     This method does not remove files or folders that no longer exist.
     """
     for item in self.iter_all():
       item.reset()
+      item.reset_stat()
       # noinspection PyProtectedMember
       item._saved_states.clear()
       # noinspection PyProtectedMember
       item._saved_named_states.clear()
 
+  def prefetch_stats(self, items: Optional[Iterable[ImageFileItem]] = None):
+    """Obtains `ImageFileItem.stat` in advance for the specified items, or for
+    all items in the tree if ``items`` is ``None``.
+
+    Items whose `ImageFileItem.stat` was already obtained are skipped. For a
+    larger number of items, the file system is accessed from multiple threads,
+    which speeds up obtaining the information from network file systems.
+    """
+    if items is None:
+      items = self.iter_all()
+
+    # noinspection PyProtectedMember
+    items_to_prefetch = [item for item in items if not item._is_stat_obtained]
+
+    if len(items_to_prefetch) < self._MIN_NUM_ITEMS_TO_PREFETCH_STATS_IN_PARALLEL:
+      # noinspection PyProtectedMember
+      stats = [item._get_stat() for item in items_to_prefetch]
+    else:
+      with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._MAX_NUM_THREADS_TO_PREFETCH_STATS) as executor:
+        # noinspection PyProtectedMember
+        stats = list(executor.map(ImageFileItem._get_stat, items_to_prefetch))
+
+    for item, stat in zip(items_to_prefetch, stats):
+      # noinspection PyProtectedMember
+      item._set_stat(stat)
+
   def _insert_item(self, object_, child_items, parents_for_child=None, with_folders=True):
     if parents_for_child is None:
       parents_for_child = []
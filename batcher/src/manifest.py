@@ -0,0 +1,202 @@
+"""Record of input files processed in previous batch runs, allowing to skip
+inputs that have not changed since.
+"""
+
+from collections.abc import Iterable
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, List, Optional, Tuple, Union
+
+from gi.repository import Gio
+
+from src import directory as directory_
+from src import setting as setting_
+
+
+class Manifest:
+  """Persistent record of input files processed in previous batch runs.
+
+  For each input file, the manifest stores the file size and modification
+  time, a hash of the settings the file was processed with (see
+  `get_settings_hash()`), and the size and modification time of each output
+  file. An input file is considered up to date if none of these changed since
+  the last time the input file was processed.
+
+  The manifest is stored as an SQLite database in a single file.
+  """
+
+  _NUM_UPDATES_PER_COMMIT = 100
+
+  def __init__(self, filepath: str):
+    self._filepath = filepath
+
+    self._connection = None
+    self._num_uncommitted_updates = 0
+
+  @property
+  def filepath(self) -> str:
+    """Path to the file storing the manifest."""
+    return self._filepath
+
+  def open(self):
+    """Opens the file storing the manifest, creating it if it does not exist.
+
+    Raises:
+      sqlite3.Error:
+        The file could not be opened or is not a valid manifest.
+    """
+    dirpath = os.path.dirname(self._filepath)
+    if dirpath:
+      os.makedirs(dirpath, exist_ok=True)
+
+    self._connection = sqlite3.connect(self._filepath)
+    self._connection.execute(
+      'CREATE TABLE IF NOT EXISTS inputs ('
+      ' filepath TEXT PRIMARY KEY,'
+      ' size INTEGER NOT NULL,'
+      ' mtime_ns INTEGER NOT NULL,'
+      ' settings_hash TEXT NOT NULL,'
+      ' outputs TEXT NOT NULL'
+      ')')
+    self._connection.commit()
+
+  def close(self):
+    """Saves pending changes and closes the file storing the manifest."""
+    if self._connection is None:
+      return
+
+    self._connection.commit()
+    self._connection.close()
+
+    self._connection = None
+    self._num_uncommitted_updates = 0
+
+  def __enter__(self):
+    self.open()
+
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  def is_up_to_date(self, input_filepath: str, settings_hash: str) -> bool:
+    """Returns ``True`` if ``input_filepath`` was processed with settings
+    matching ``settings_hash`` and neither the input file nor any of its output
+    files changed since, ``False`` otherwise.
+    """
+    row = self._connection.execute(
+      'SELECT size, mtime_ns, settings_hash, outputs FROM inputs WHERE filepath = ?',
+      (input_filepath,),
+    ).fetchone()
+
+    if row is None:
+      return False
+
+    size, mtime_ns, stored_settings_hash, outputs = row
+
+    if stored_settings_hash != settings_hash:
+      return False
+
+    if _get_file_size_and_mtime(input_filepath) != (size, mtime_ns):
+      return False
+
+    for output_filepath, output_size, output_mtime_ns in json.loads(outputs):
+      if _get_file_size_and_mtime(output_filepath) != (output_size, output_mtime_ns):
+        return False
+
+    return True
+
+  def update(self, input_filepath: str, settings_hash: str, output_filepaths: List[str]):
+    """Records ``input_filepath`` as processed with settings matching
+    ``settings_hash``, producing ``output_filepaths``.
+
+    The current size and modification time of the input and output files are
+    recorded. If any of the files does not exist, ``input_filepath`` is removed
+    from the manifest instead.
+    """
+    input_size_and_mtime = _get_file_size_and_mtime(input_filepath)
+    output_sizes_and_mtimes = [
+      _get_file_size_and_mtime(output_filepath) for output_filepath in output_filepaths]
+
+    if input_size_and_mtime is None or None in output_sizes_and_mtimes:
+      self.remove(input_filepath)
+      return
+
+    outputs = [
+      [output_filepath, *output_size_and_mtime]
+      for output_filepath, output_size_and_mtime in zip(output_filepaths, output_sizes_and_mtimes)]
+
+    self._connection.execute(
+      'INSERT OR REPLACE INTO inputs (filepath, size, mtime_ns, settings_hash, outputs)'
+      ' VALUES (?, ?, ?, ?, ?)',
+      (input_filepath, *input_size_and_mtime, settings_hash, json.dumps(outputs)),
+    )
+
+    self._commit_periodically()
+
+  def remove(self, input_filepath: str):
+    """Removes ``input_filepath`` from the manifest if it exists."""
+    self._connection.execute('DELETE FROM inputs WHERE filepath = ?', (input_filepath,))
+
+    self._commit_periodically()
+
+  def _commit_periodically(self):
+    # Committing after each update would slow down processing of many small
+    # files considerably.
+    self._num_uncommitted_updates += 1
+
+    if self._num_uncommitted_updates >= self._NUM_UPDATES_PER_COMMIT:
+      self._connection.commit()
+      self._num_uncommitted_updates = 0
+
+
+def get_settings_hash(
+      settings: Iterable[Union[setting_.Setting, setting_.Group]],
+      *values: Any,
+) -> str:
+  """Returns a hash of the specified settings and groups (e.g. actions and
+  conditions) and any additional values affecting the output (e.g. the output
+  folder).
+
+  Settings and groups are hashed in the same form as they are saved. Values
+  that cannot be converted to a form independent of the current plug-in run
+  result in a different hash on each run, i.e. inputs are never considered up
+  to date.
+  """
+  source = setting_.SimpleInMemorySource()
+  source.write(list(settings))
+
+  data = [source.data, [_get_data_for_hash(value) for value in values]]
+
+  return hashlib.sha256(
+    json.dumps(data, sort_keys=True, default=repr).encode('utf-8')).hexdigest()
+
+
+def _get_data_for_hash(value):
+  if isinstance(value, setting_.Setting):
+    return value.to_dict()
+  elif isinstance(value, setting_.Group):
+    source = setting_.SimpleInMemorySource()
+    source.write([value])
+    return source.data
+  elif isinstance(value, directory_.Directory):
+    return [value.type_, value.value]
+  elif isinstance(value, Gio.File):
+    return value.get_uri()
+  elif isinstance(value, dict):
+    return {str(key): _get_data_for_hash(item_value) for key, item_value in value.items()}
+  elif isinstance(value, (list, tuple)):
+    return [_get_data_for_hash(item_value) for item_value in value]
+  else:
+    return value
+
+
+def _get_file_size_and_mtime(filepath: str) -> Optional[Tuple[int, int]]:
+  try:
+    file_stat = os.stat(filepath)
+  except OSError:
+    return None
+  else:
+    return file_stat.st_size, file_stat.st_mtime_ns
@@ -8,6 +8,7 @@
 from src import builtin_actions
 from src import builtin_conditions
 from src import commands as commands_
+from src import duplicates as duplicates_
 from src import setting as setting_
 # Despite being unused, `setting_additional` must be imported so that the
 # setting and GUI classes defined there are properly registered (via respective
@@ -103,6 +104,66 @@ def create_settings_for_convert():
       'gui_type': None,
       'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
     },
+    {
+      'type': 'file',
+      'name': 'manifest_file',
+      'default_value': None,
+      'action': Gimp.FileChooserAction.SAVE,
+      'none_ok': True,
+      'display_name': _(
+        'File recording processed input files to skip unchanged files in subsequent runs'
+        ' (optional; non-interactive run mode only)'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'bool',
+      'name': 'rebuild_all',
+      'default_value': False,
+      'display_name': _(
+        'Process all input files, including unchanged files recorded in the manifest file'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'bool',
+      'name': 'deduplicate_inputs',
+      'default_value': False,
+      'display_name': _(
+        'Process input files with identical contents only once'
+        ' and create output files of the remaining files from the processed file'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'choice',
+      'name': 'duplicate_output_mode',
+      'default_value': duplicates_.DuplicateOutputModes.COPY,
+      'items': utils.semi_deep_copy(duplicates_.DUPLICATE_OUTPUT_MODES_LIST),
+      'display_name': _('How to create output files of input files with identical contents'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'bool',
+      'name': 'import_at_reduced_size',
+      'default_value': False,
+      'display_name': _(
+        'Load images at a reduced size if the first action scales images down'
+        ' and the file format allows it (faster)'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'bool',
+      'name': 'apply_pointwise_actions_after_downscaling',
+      'default_value': False,
+      'display_name': _(
+        'Apply color adjustments preceding a Scale action after the action when scaling down'
+        ' (faster, output may slightly differ)'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
     {
       'type': 'string',
       'name': 'plugin_version',
@@ -205,6 +266,81 @@ def create_settings_for_convert():
   return settings
 
 
+def create_settings_for_convert_watch():
+  settings = setting_.Group(name='watch')
+
+  settings.add([
+    {
+      'type': 'double',
+      'name': 'poll_interval',
+      'default_value': 2.0,
+      'min_value': 0.0,
+      'display_name': _('Maximum time in seconds between scans of the watched folders'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'double',
+      'name': 'settle_time',
+      'default_value': 1.0,
+      'min_value': 0.0,
+      'display_name': _(
+        'Time in seconds a new or modified file must remain unchanged before being processed'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'int',
+      'name': 'max_batch_size',
+      'default_value': 100,
+      'min_value': 1,
+      'display_name': _('Maximum number of files processed in a single batch'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'int',
+      'name': 'max_queued_files',
+      'default_value': 1000,
+      'min_value': 1,
+      'display_name': _('Maximum number of files waiting to be processed'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'file',
+      'name': 'stop_file',
+      'default_value': None,
+      'action': Gimp.FileChooserAction.SAVE,
+      'none_ok': True,
+      'display_name': _('File whose creation stops watching the folders (optional)'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'double',
+      'name': 'stats_interval',
+      'default_value': 60.0,
+      'min_value': 0.0,
+      'display_name': _(
+        'Interval in seconds at which processing statistics are logged'
+        ' (set to 0 to log statistics only when stopped)'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+    {
+      'type': 'bool',
+      'name': 'process_existing_files',
+      'default_value': True,
+      'display_name': _('Process files already present in the watched folders'),
+      'gui_type': None,
+      'tags': ['ignore_reset', 'ignore_load', 'ignore_save'],
+    },
+  ])
+
+  return settings
+
+
 def create_settings_for_export_images():
   settings = setting_.create_groups({
     'name': 'all_settings',
@@ -336,6 +336,65 @@ def set_quit_func(func: Optional[Callable] = None):
   _QUIT_FUNC = func
 
 
+def run_persistent(
+      procedure: Gimp.Procedure,
+      proc_names: Iterable[str],
+      temp_proc_name_suffix: str = '-persistent',
+      idle_func: Optional[Callable] = None,
+):
+  """Keeps the plug-in running and handles calls to temporary copies of the
+  specified registered procedures within the current plug-in process.
+
+  Call this function from a procedure registered with ``pdb_procedure_type``
+  set to `Gimp.PDBProcType.PERSISTENT`. The function returns once the
+  temporary procedure named ``<procedure name>-quit`` is called. The plug-in
+  process is also terminated when GIMP quits.
+
+  A temporary procedure is installed for each of ``proc_names``, named
+  ``<procedure name><temp_proc_name_suffix>`` and accepting the same arguments
+  as the original procedure. As the plug-in process is not restarted for each
+  call, module-level state (e.g. imported modules or caches) is preserved
+  between calls.
+
+  ``idle_func``, if specified, is called without arguments before waiting for
+  each subsequent call, e.g. to prepare data for the next call.
+  """
+  plugin_instance = procedure.get_plug_in()
+
+  for proc_name in proc_names:
+    plugin_instance.add_temp_procedure(
+      _do_create_procedure(
+        plugin_instance, proc_name, temp_proc_name=f'{proc_name}{temp_proc_name_suffix}'))
+
+  is_running = True
+
+  def _quit(_procedure, _config, _data):
+    nonlocal is_running
+    is_running = False
+
+  quit_procedure = Gimp.Procedure.new(
+    plugin_instance,
+    f'{procedure.get_name()}-quit',
+    Gimp.PDBProcType.TEMPORARY,
+    _get_procedure_wrapper(_quit, Gimp.Procedure, False, False),
+    None,
+  )
+  quit_procedure.set_documentation(
+    f'Stops handling calls in the plug-in process started by "{procedure.get_name()}"', '')
+  quit_procedure.set_attribution(
+    procedure.get_authors(), procedure.get_copyright(), procedure.get_date())
+
+  plugin_instance.add_temp_procedure(quit_procedure)
+
+  plugin_instance.persistent_ready()
+
+  while is_running:
+    if idle_func is not None:
+      idle_func()
+
+    plugin_instance.persistent_process(0)
+
+
 def main():
   """Initializes and runs the plug-in.
 
@@ -378,12 +437,23 @@ def _do_query_procedures(_plugin_instance):
   return list(_PROCEDURE_NAMES_AND_DATA)
 
 
-def _do_create_procedure(plugin_instance, proc_name):
+def _do_create_procedure(plugin_instance, proc_name, temp_proc_name=None):
   if proc_name in _PROCEDURE_NAMES_AND_DATA:
     proc_dict = _PROCEDURE_NAMES_AND_DATA[proc_name]
   else:
     return None
 
+  if temp_proc_name is not None:
+    # Temporary copies of procedures are not displayed in menus so that menu
+    # entries are not duplicated.
+    proc_dict = dict(
+      proc_dict,
+      pdb_procedure_type=Gimp.PDBProcType.TEMPORARY,
+      menu_label=None,
+      menu_path=None,
+    )
+    proc_name = temp_proc_name
+
   if not inspect.isclass(proc_dict['procedure_type']):
     raise TypeError(f"{proc_dict['procedure_type']} is not a valid class type")
 
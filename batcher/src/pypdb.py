@@ -83,7 +83,7 @@ def __contains__(self, name: Optional[str]) -> bool:
 
     canonical_name = self.python_name_to_canonical_name(name)
 
-    if canonical_name not in self._proc_cache or name not in self._proc_cache:
+    if canonical_name not in self._proc_cache and name not in self._proc_cache:
       try:
         proc, proc_name = self._create_proc(canonical_name, name)
       except AttributeError:
@@ -480,6 +480,8 @@ def __init__(self, pypdb_instance, name):
     self._details = self._get_details(name)
     self._properties = {prop.name: prop for prop in self._get_properties()}
 
+    self._properties_from_config = None
+
     super().__init__(pypdb_instance, name)
 
   def __call__(self, *args, **kwargs):
@@ -532,7 +534,12 @@ def __call__(self, *args, **kwargs):
 
     config = drawable_filter.get_config()
 
-    properties_from_config = {prop.name: prop for prop in config.list_properties()}
+    # Configs of filters for the same GEGL operation have the same properties,
+    # hence they only need to be obtained once.
+    if self._properties_from_config is None:
+      self._properties_from_config = {prop.name: prop for prop in config.list_properties()}
+
+    properties_from_config = self._properties_from_config
 
     for arg_name, arg_value in processed_kwargs.items():
       if arg_name not in self._properties:
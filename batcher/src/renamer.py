@@ -186,6 +186,8 @@ def __init__(
     # key: field value
     # value: dict of (parent or None, number generator) pairs
     self._global_number_generators = collections.defaultdict(dict)
+
+    self._num_items_per_parent = None
   
   @staticmethod
   def generate_number(
@@ -250,12 +252,7 @@ def _get_number(self, renamer, batcher, item, field_value, *args):
 
       if initial_number == 0 and not ascending:
         if reset_numbering_on_parent:
-          if parent_item is not None:
-            initial_number = len([
-              item_ for item_ in tree_items
-              if item_.depth == parent_item.depth + 1 and item_.parent == parent_item])
-          else:
-            initial_number = len([item_ for item_ in tree_items if item_.depth == 0])
+          initial_number = self._get_num_items_per_parent(tree_items)[parent]
         else:
           initial_number = len(tree_items)
       
@@ -264,6 +261,87 @@ def _get_number(self, renamer, batcher, item, field_value, *args):
     
     return next(self._global_number_generators[field_value][parent])
 
+  def _get_num_items_per_parent(self, tree_items):
+    # The number of items is computed for all parents at once as iterating
+    # over all items for each parent would be slow for a large number of items.
+    if self._num_items_per_parent is None:
+      self._num_items_per_parent = collections.Counter(
+        item.parent.key if item.parent is not None else None for item in tree_items)
+
+    return self._num_items_per_parent
+
+
+class PathField(Field):
+
+  def __init__(
+        self,
+        regex: str,
+        item_substitute_func: Callable,
+        display_name: str,
+        str_to_insert: str,
+        examples_lines: List[List[str]],
+        procedure_groups: List[str],
+  ):
+    super().__init__(
+      regex,
+      self._get_path,
+      display_name,
+      str_to_insert,
+      examples_lines,
+      procedure_groups,
+    )
+
+    self._item_substitute_func = item_substitute_func
+
+    # key: (parent, separator, wrapper)
+    # value: (parent name, path of the parent's parent, path of the parent)
+    self._parent_paths = {}
+
+  def _get_path(
+        self,
+        renamer,
+        batcher,
+        item,
+        field_value,
+        separator='-',
+        wrapper=None,
+        file_extension_strip_mode='',
+  ):
+    path_component_token = '%c'
+
+    if wrapper is None:
+      wrapper = '{}'
+    else:
+      if path_component_token in wrapper:
+        wrapper = wrapper.replace(path_component_token, '{}')
+      else:
+        wrapper = '{}'
+
+    item_name = self._item_substitute_func(
+      renamer, batcher, item, field_value, file_extension_strip_mode)
+
+    return self._get_parent_path(item, separator, wrapper) + wrapper.format(item_name)
+
+  def _get_parent_path(self, item, separator, wrapper):
+    # Items sharing the same parents reuse the already formatted path of their
+    # parents. The path of a parent is formatted again only if the name of the
+    # parent or any of its parents changed (e.g. if folders are renamed).
+    path = ''
+
+    for parent in item.parents:
+      key = (parent, separator, wrapper)
+      parent_path_info = self._parent_paths.get(key)
+
+      if (parent_path_info is None
+          or parent_path_info[0] != parent.name
+          or parent_path_info[1] is not path):
+        parent_path_info = (parent.name, path, f'{path}{wrapper.format(parent.name)}{separator}')
+        self._parent_paths[key] = parent_path_info
+
+      path = parent_path_info[2]
+
+    return path
+
 
 class _PercentTemplate(string.Template):
   
@@ -345,75 +423,6 @@ def _get_layer_name(
   return fileext.get_filename_root(item.name)
 
 
-def _get_item_path(
-      item_substitute_func,
-      renamer,
-      batcher,
-      item,
-      field_value,
-      separator='-',
-      wrapper=None,
-      file_extension_strip_mode='',
-):
-  path_component_token = '%c'
-  
-  if wrapper is None:
-    wrapper = '{}'
-  else:
-    if path_component_token in wrapper:
-      wrapper = wrapper.replace(path_component_token, '{}')
-    else:
-      wrapper = '{}'
-  
-  path_components = [parent.name for parent in item.parents]
-  path_components += [
-    item_substitute_func(renamer, batcher, item, field_value, file_extension_strip_mode)]
-  
-  return separator.join(wrapper.format(path_component) for path_component in path_components)
-
-
-def _get_image_path(
-      renamer,
-      image_batcher,
-      item,
-      field_value,
-      separator='-',
-      wrapper=None,
-      file_extension_strip_mode='',
-):
-  return _get_item_path(
-    _get_image_name_for_image_batcher,
-    renamer,
-    image_batcher,
-    item,
-    field_value,
-    separator=separator,
-    wrapper=wrapper,
-    file_extension_strip_mode=file_extension_strip_mode,
-  )
-
-
-def _get_layer_path(
-      renamer,
-      layer_batcher,
-      item,
-      field_value,
-      separator='-',
-      wrapper=None,
-      file_extension_strip_mode='',
-):
-  return _get_item_path(
-    _get_layer_name,
-    renamer,
-    layer_batcher,
-    item,
-    field_value,
-    separator=separator,
-    wrapper=wrapper,
-    file_extension_strip_mode=file_extension_strip_mode,
-  )
-
-
 def _get_image_file(
       _renamer,
       batcher,
@@ -708,9 +717,9 @@ def _get_image_filepath(batcher):
     'procedure_groups': [CONVERT_GROUP, EDIT_AND_SAVE_IMAGES_GROUP, EXPORT_IMAGES_GROUP],
   },
   {
-    'type': Field,
+    'type': PathField,
     'regex': 'image path',
-    'substitute_func': _get_image_path,
+    'item_substitute_func': _get_image_name_for_image_batcher,
     'display_name': _('Image path'),
     'str_to_insert': '[image path]',
     'examples_lines': [
@@ -767,9 +776,9 @@ def _get_image_filepath(batcher):
     'procedure_groups': [EXPORT_LAYERS_GROUP, EDIT_LAYERS_GROUP],
   },
   {
-    'type': Field,
+    'type': PathField,
     'regex': 'layer path',
-    'substitute_func': _get_layer_path,
+    'item_substitute_func': _get_layer_name,
     'display_name': _('Layer path'),
     'str_to_insert': '[layer path]',
     'examples_lines': [
@@ -256,10 +256,12 @@ def _save(cls, settings_or_groups, setting_sources, modify_data_func):
     statuses_per_source = {}
     messages_per_source = {}
     
+    # Writing is deferred until all sources are processed so that sources
+    # sharing the same storage (e.g. the same file) write their data at once.
     for _unused, sources in setting_sources.items():
       for source in sources:
         try:
-          source.write(settings_or_groups, modify_data_func=modify_data_func)
+          source.write(settings_or_groups, modify_data_func=modify_data_func, flush=False)
         except _sources_errors.SourceError as e:
           statuses_per_source[source] = cls.FAIL
           messages_per_source[source] = str(e)
@@ -267,6 +269,14 @@ def _save(cls, settings_or_groups, setting_sources, modify_data_func):
           statuses_per_source[source] = cls.SUCCESS
           messages_per_source[source] = ''
     
+    for source, status in statuses_per_source.items():
+      if status == cls.SUCCESS:
+        try:
+          source.flush()
+        except _sources_errors.SourceError as e:
+          statuses_per_source[source] = cls.FAIL
+          messages_per_source[source] = str(e)
+    
     return statuses_per_source, messages_per_source
   
   @classmethod
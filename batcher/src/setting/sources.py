@@ -2,10 +2,12 @@
 
 import abc
 from collections.abc import Iterable
+import copy
 import json
 import os
 import pickle
 from typing import Any, Callable, Dict, List, Optional, Union
+import zlib
 
 import gi
 gi.require_version('Gimp', '3.0')
@@ -25,6 +27,7 @@
   'Source',
   'GimpParasiteSource',
   'JsonFileSource',
+  'CachedJsonFileSource',
   'SimpleInMemorySource',
 ]
 
@@ -314,6 +317,7 @@ def write(
         self,
         settings_or_groups: Iterable[Union[settings_.Setting, group_.Group]],
         modify_data_func: Optional[Callable] = None,
+        flush: bool = True,
   ):
     """Writes attributes of the specified settings and groups to the source.
 
@@ -331,6 +335,11 @@ def write(
     write as its only input parameter and returns modified data,
     or ``SourceModifyDataError`` on failure.
 
+    If ``flush`` is ``False``, sources supporting deferred writing keep the data
+    in memory until `flush()` is called. This allows writing data of multiple
+    sources sharing the same storage at once. Other sources ignore this
+    parameter.
+
     Raises:
       SourceInvalidFormatError:
         Existing data in the source have an invalid format. This could happen if
@@ -339,6 +348,8 @@ def write(
         Modification of data prior to writing to source within
         ``modify_data_func`` failed, or ``modify_data_func`` is not a valid
         function (callable).
+      SourceWriteError:
+        Writing data to the source failed.
     """
     data = self.read_data_from_source()
     if data is None:
@@ -350,6 +361,9 @@ def write(
 
     self.write_data_to_source(processed_data)
 
+    if flush:
+      self.flush()
+
   def _update_data(self, settings_or_groups, data):
     for setting_or_group in settings_or_groups:
       immediate_parent_of_setting_or_group = self._create_all_parent_groups_if_they_do_not_exist(
@@ -520,6 +534,17 @@ def _modify_data(data, modify_data_func):
     else:
       return data
 
+  def flush(self):
+    """Writes data whose writing was deferred to the source.
+
+    This method has no effect for sources writing data immediately.
+
+    Raises:
+      SourceWriteError:
+        Writing data to the source failed.
+    """
+    pass
+
   @abc.abstractmethod
   def clear(self):
     """Removes all settings from the source.
@@ -574,8 +599,16 @@ class GimpParasiteSource(Source):
   retained after ending a GIMP session.
 
   The ``parasiterc`` file maintained by GIMP is used as the persistent source.
+
+  Settings are stored as pickled data compressed via ``zlib``, prepended by a
+  header identifying the format and its version. Data stored as plain pickled
+  data (without the header) are still loaded and are converted to the
+  compressed format on the next write.
   """
 
+  _DATA_HEADER = b'BATCHER_ZLIB'
+  _DATA_FORMAT_VERSION = 1
+
   def __init__(self, name: str):
     super().__init__(name)
 
@@ -602,7 +635,7 @@ def read_data_from_source(self):
 
     parasite_data = utils.signed_bytes_to_bytes(parasite.get_data())
     try:
-      data = pickle.loads(parasite_data)
+      data = pickle.loads(self._decode_data(parasite_data))
     except Exception:
       raise SourceInvalidFormatError
 
@@ -613,7 +646,27 @@ def write_data_to_source(self, data):
       Gimp.Parasite.new(
         self.name,
         Gimp.PARASITE_PERSISTENT,
-        utils.bytes_to_signed_bytes(pickle.dumps(data))))
+        utils.bytes_to_signed_bytes(self._encode_data(pickle.dumps(data)))))
+
+  @classmethod
+  def _encode_data(cls, raw_data):
+    return (
+      cls._DATA_HEADER
+      + bytes([cls._DATA_FORMAT_VERSION])
+      + zlib.compress(raw_data))
+
+  @classmethod
+  def _decode_data(cls, data):
+    if not data.startswith(cls._DATA_HEADER):
+      # Data saved in the legacy format (plain pickled data).
+      return data
+
+    format_version = data[len(cls._DATA_HEADER)]
+    if format_version > cls._DATA_FORMAT_VERSION:
+      raise SourceInvalidFormatError(
+        f'unsupported format version of data in source: {format_version}')
+
+    return zlib.decompress(data[len(cls._DATA_HEADER) + 1:])
 
 
 class JsonFileSource(Source):
@@ -707,6 +760,190 @@ def write_all_data(self, all_data: Dict[str, Any]):
       raise SourceWriteError from e
 
 
+class CachedJsonFileSource(JsonFileSource):
+  """Class reading and writing settings to a JSON file, keeping the parsed file
+  contents in memory.
+
+  The file contents are parsed only if the file was modified (i.e. its
+  modification time or size changed) since it was last read or written by any
+  instance of this class. Instances pointing to the same file thus share the
+  parsed contents.
+
+  The file is written atomically, i.e. the contents are first written to a
+  temporary file which then replaces the original file.
+
+  If ``compact`` is ``True``, the file is written without indentation and
+  extra whitespace.
+
+  Writing data can be deferred via the ``flush`` parameter in `write()`, in
+  which case the file is written once on `flush()` for all instances pointing to
+  the same file.
+  """
+
+  _cached_file_contents = {}
+
+  def __init__(self, name: str, filepath: str, compact: bool = False):
+    super().__init__(name, filepath)
+
+    self._compact = compact
+
+    self._write_deferred = False
+
+  @property
+  def compact(self) -> bool:
+    """If ``True``, the file is written without indentation and extra
+    whitespace.
+    """
+    return self._compact
+
+  def write(
+        self,
+        settings_or_groups: Iterable[Union[settings_.Setting, group_.Group]],
+        modify_data_func: Optional[Callable] = None,
+        flush: bool = True,
+  ):
+    self._write_deferred = True
+
+    try:
+      super().write(settings_or_groups, modify_data_func=modify_data_func, flush=flush)
+    finally:
+      self._write_deferred = False
+
+  def flush(self):
+    file_contents = self._cached_file_contents.get(self._get_cache_key())
+
+    if file_contents is not None and file_contents.pending_write:
+      try:
+        self.write_all_data(file_contents.all_data)
+      except Exception:
+        # Unsaved data must not be returned instead of the file contents.
+        self._cached_file_contents.pop(self._get_cache_key(), None)
+        raise
+
+  def has_data(self) -> Union[bool, str]:
+    try:
+      all_data = self._get_all_data()
+    except SourceError:
+      return 'invalid_format'
+    else:
+      return all_data is not None and self.name in all_data
+
+  def read_data_from_source(self):
+    all_data = self._get_all_data()
+    if all_data is not None and self.name in all_data:
+      # `Source.write()` modifies the returned data in place, hence the copy.
+      return copy.deepcopy(all_data[self.name])
+    else:
+      return None
+
+  def write_data_to_source(self, data):
+    all_data = self.read_all_data()
+    if all_data is None:
+      all_data = {}
+
+    all_data[self.name] = data
+
+    if self._write_deferred:
+      file_contents = self._cached_file_contents.get(self._get_cache_key())
+      if file_contents is None:
+        file_contents = _CachedFileContents(None, None, all_data)
+        self._cached_file_contents[self._get_cache_key()] = file_contents
+      else:
+        file_contents.all_data = all_data
+
+      file_contents.pending_write = True
+    else:
+      self.write_all_data(all_data)
+
+  def read_all_data(self) -> Union[Dict[str, Any], None]:
+    """Reads the contents of the entire file into a dictionary of
+    (source name, contents) pairs.
+
+    The file is parsed only if it was modified since it was last read or
+    written. Data whose writing was deferred are returned as well.
+
+    If the `filepath` property does not point to a valid file and there are no
+    data whose writing was deferred, ``None`` is returned.
+    """
+    all_data = self._get_all_data()
+    if all_data is not None:
+      return dict(all_data)
+    else:
+      return None
+
+  def write_all_data(self, all_data: Dict[str, Any]):
+    """Writes ``all_data`` into the file atomically, overwriting the entire file
+    contents.
+
+    ``all_data`` is a dictionary of (source name, contents) pairs.
+    """
+    dirpath = os.path.dirname(self._filepath)
+    temp_filepath = os.path.join(
+      dirpath, f'.{os.path.basename(self._filepath)}.{os.getpid()}.tmp')
+
+    try:
+      with open(temp_filepath, 'w', encoding=constants.TEXT_FILE_ENCODING) as f:
+        if self._compact:
+          json.dump(all_data, f, separators=(',', ':'))
+        else:
+          json.dump(all_data, f, indent=4)
+
+      os.replace(temp_filepath, self._filepath)
+
+      file_stat = os.stat(self._filepath)
+    except Exception as e:
+      if os.path.isfile(temp_filepath):
+        try:
+          os.remove(temp_filepath)
+        except OSError:
+          pass
+
+      raise SourceWriteError from e
+
+    self._cached_file_contents[self._get_cache_key()] = _CachedFileContents(
+      file_stat.st_mtime_ns, file_stat.st_size, all_data)
+
+  def _get_all_data(self):
+    cache_key = self._get_cache_key()
+    file_contents = self._cached_file_contents.get(cache_key)
+
+    if file_contents is not None and file_contents.pending_write:
+      return file_contents.all_data
+
+    try:
+      file_stat = os.stat(self._filepath)
+    except OSError:
+      self._cached_file_contents.pop(cache_key, None)
+      return None
+
+    if (file_contents is not None
+        and file_contents.mtime_ns == file_stat.st_mtime_ns
+        and file_contents.size == file_stat.st_size):
+      return file_contents.all_data
+
+    all_data = super().read_all_data()
+
+    if all_data is not None:
+      self._cached_file_contents[cache_key] = _CachedFileContents(
+        file_stat.st_mtime_ns, file_stat.st_size, all_data)
+    else:
+      self._cached_file_contents.pop(cache_key, None)
+
+    return all_data
+
+  def _get_cache_key(self):
+    return os.path.abspath(self._filepath)
+
+
+class _CachedFileContents:
+
+  def __init__(self, mtime_ns: Optional[int], size: Optional[int], all_data: Dict[str, Any]):
+    self.mtime_ns = mtime_ns
+    self.size = size
+    self.all_data = all_data
+    self.pending_write = False
+
+
 class SimpleInMemorySource(Source):
   """Class reading and writing settings to the memory.
 
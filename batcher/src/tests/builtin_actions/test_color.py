@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+from src.builtin_actions import _color as color_
+
+
+class TestPresetCache(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+    self.filepath = os.path.join(self.temp_dir.name, 'preset')
+    self._write_preset('(trc linear)\n')
+
+    self.parse_gimp_preset = mock.Mock(side_effect=lambda data: ('linear', list(data)))
+    self.parse_photoshop_preset = mock.Mock()
+
+    self.cache = color_._PresetCache()
+
+  def test_get_parses_file_once(self):
+    parsed_preset = self.cache.get(
+      self.filepath, self.parse_gimp_preset, self.parse_photoshop_preset)
+
+    self.assertEqual(parsed_preset, ('linear', ['(trc linear)\n']))
+    self.assertIs(
+      self.cache.get(self.filepath, self.parse_gimp_preset, self.parse_photoshop_preset),
+      parsed_preset)
+
+    self.assertEqual(self.parse_gimp_preset.call_count, 1)
+
+  def test_get_parses_file_again_if_modified(self):
+    self.cache.get(self.filepath, self.parse_gimp_preset, self.parse_photoshop_preset)
+
+    self._write_preset('(trc perceptual)\n(channel value)\n')
+
+    self.assertEqual(
+      self.cache.get(self.filepath, self.parse_gimp_preset, self.parse_photoshop_preset),
+      ('linear', ['(trc perceptual)\n', '(channel value)\n']))
+
+    self.assertEqual(self.parse_gimp_preset.call_count, 2)
+
+  def test_get_parses_file_per_parser(self):
+    other_parse_gimp_preset = mock.Mock(return_value=('linear', {}))
+
+    self.cache.get(self.filepath, self.parse_gimp_preset, self.parse_photoshop_preset)
+    self.cache.get(self.filepath, other_parse_gimp_preset, self.parse_photoshop_preset)
+
+    self.assertEqual(self.parse_gimp_preset.call_count, 1)
+    self.assertEqual(other_parse_gimp_preset.call_count, 1)
+
+  def test_get_invalid_preset_raises_error(self):
+    self.parse_gimp_preset.side_effect = error = ValueError('invalid preset')
+
+    with self.assertRaises(ValueError) as context:
+      self.cache.get(self.filepath, self.parse_gimp_preset, self.parse_photoshop_preset)
+
+    self.assertIs(context.exception.__cause__, error)
+
+  def _write_preset(self, contents):
+    with open(self.filepath, 'w') as f:
+      f.write(contents)
@@ -0,0 +1,161 @@
+import unittest
+import unittest.mock as mock
+
+import parameterized
+
+from src import builtin_actions
+
+
+class TestGmicFilter(unittest.TestCase):
+
+  def setUp(self):
+    self.batcher = mock.Mock()
+    self.command = 'fx_sharpen_details 1,5'
+
+  @parameterized.parameterized.expand([
+    ('single_layer', ['layer'], 1),
+    ('multiple_layers', ['layer', 'layer2', 'layer3'], 2),
+  ])
+  @mock.patch('src.builtin_actions._gmic_filter.pdb')
+  def test_gmic_filter(self, _test_case_suffix, layers, expected_input, mock_pdb):
+    builtin_actions.gmic_filter(self.batcher, layers, self.command)
+
+    mock_pdb.plug_in_gmic_qt.assert_called_once_with(
+      image=self.batcher.current_image,
+      drawables=layers,
+      input=expected_input,
+      output=0,
+      command=self.command,
+    )
+
+  @parameterized.parameterized.expand([
+    ('no_layers', [], 'fx_sharpen_details 1,5'),
+    ('empty_command', ['layer'], ''),
+    ('command_with_whitespace_only', ['layer'], '  \n'),
+  ])
+  @mock.patch('src.builtin_actions._gmic_filter.pdb')
+  def test_gmic_filter_is_not_called(self, _test_case_suffix, layers, command, mock_pdb):
+    builtin_actions.gmic_filter(self.batcher, layers, command)
+
+    mock_pdb.plug_in_gmic_qt.assert_not_called()
+
+
+@mock.patch('src.builtin_actions._gmic_filter.utils_pdb')
+@mock.patch('src.builtin_actions._gmic_filter.Gegl')
+@mock.patch('src.builtin_actions._gmic_filter.Gimp')
+@mock.patch('src.builtin_actions._gmic_filter.pdb')
+class TestGmicFilterForMultipleImages(unittest.TestCase):
+
+  def setUp(self):
+    self.command = 'fx_sharpen_details 1,5'
+
+    images = [_create_image('RGB', 'u8'), _create_image('RGB', 'u8')]
+
+    self.images_and_layers = [
+      (images[0], [_create_layer(1, images[0]), _create_layer(2, images[0])]),
+      (images[1], [_create_layer(3, images[1])]),
+    ]
+
+    self.layers = [layer for _image, layers in self.images_and_layers for layer in layers]
+
+  def test_gmic_filter_is_called_once_for_all_images(
+        self, mock_pdb, mock_gimp, mock_gegl, mock_utils_pdb):
+    working_image = mock_gimp.Image.new_with_precision.return_value
+    layer_copies = [mock.Mock() for _layer in self.layers]
+    filtered_layers = [_create_layer(index, working_image) for index in range(len(self.layers))]
+
+    mock_utils_pdb.copy_and_paste_layer.side_effect = layer_copies
+    working_image.get_layers.return_value = filtered_layers
+
+    builtin_actions.gmic_filter_for_multiple_images(self.images_and_layers, self.command)
+
+    mock_pdb.plug_in_gmic_qt.assert_called_once_with(
+      image=working_image,
+      drawables=layer_copies,
+      input=2,
+      output=0,
+      command=self.command,
+    )
+
+    rect = mock_gegl.Rectangle.new.return_value
+
+    for layer, filtered_layer in zip(self.layers, filtered_layers):
+      filtered_layer.get_buffer().copy.assert_called_once_with(
+        rect, mock_gegl.AbyssPolicy.NONE, layer.get_shadow_buffer(), rect)
+      layer.merge_shadow.assert_called_once_with(True)
+      layer.resize.assert_not_called()
+      layer.get_image().remove_layer.assert_not_called()
+
+    working_image.delete.assert_called_once_with()
+
+  def test_layer_resized_by_filter_is_resized(
+        self, mock_pdb, mock_gimp, mock_gegl, mock_utils_pdb):
+    working_image = mock_gimp.Image.new_with_precision.return_value
+    filtered_layers = [_create_layer(index, working_image) for index in range(len(self.layers))]
+    filtered_layers[2].get_width.return_value = 200
+    filtered_layers[2].get_height.return_value = 150
+
+    working_image.get_layers.return_value = filtered_layers
+
+    builtin_actions.gmic_filter_for_multiple_images(self.images_and_layers, self.command)
+
+    self.layers[0].resize.assert_not_called()
+    self.layers[2].resize.assert_called_once_with(200, 150, 0, 0)
+    self.layers[2].update.assert_called_once_with(0, 0, 200, 150)
+
+  def test_images_with_different_precision_are_filtered_separately(
+        self, mock_pdb, mock_gimp, mock_gegl, mock_utils_pdb):
+    self.images_and_layers[1][0].get_precision.return_value = 'u16'
+
+    working_images = [mock.Mock(), mock.Mock()]
+    working_images[0].get_layers.return_value = [
+      _create_layer(4, working_images[0]), _create_layer(5, working_images[0])]
+    working_images[1].get_layers.return_value = [_create_layer(6, working_images[1])]
+
+    mock_gimp.Image.new_with_precision.side_effect = working_images
+
+    builtin_actions.gmic_filter_for_multiple_images(self.images_and_layers, self.command)
+
+    self.assertEqual(mock_pdb.plug_in_gmic_qt.call_count, 2)
+
+    for layer in self.layers:
+      layer.merge_shadow.assert_called_once_with(True)
+
+  def test_changed_number_of_layers_raises_error(
+        self, mock_pdb, mock_gimp, mock_gegl, mock_utils_pdb):
+    working_image = mock_gimp.Image.new_with_precision.return_value
+    working_image.get_layers.return_value = [_create_layer(4, working_image)]
+
+    with self.assertRaises(ValueError):
+      builtin_actions.gmic_filter_for_multiple_images(self.images_and_layers, self.command)
+
+    for layer in self.layers:
+      layer.merge_shadow.assert_not_called()
+
+    working_image.delete.assert_called_once_with()
+
+  def test_empty_command(self, mock_pdb, mock_gimp, mock_gegl, mock_utils_pdb):
+    builtin_actions.gmic_filter_for_multiple_images(self.images_and_layers, ' ')
+
+    mock_pdb.plug_in_gmic_qt.assert_not_called()
+    mock_gimp.Image.new_with_precision.assert_not_called()
+
+
+def _create_image(base_type, precision):
+  image = mock.Mock()
+  image.get_base_type.return_value = base_type
+  image.get_precision.return_value = precision
+
+  return image
+
+
+def _create_layer(id_, image):
+  layer = mock.Mock()
+  layer.get_image.return_value = image
+  layer.get_id.return_value = id_
+  layer.get_name.return_value = f'Layer {id_}'
+  layer.get_width.return_value = 100
+  layer.get_height.return_value = 50
+  layer.has_alpha.return_value = True
+
+  return layer
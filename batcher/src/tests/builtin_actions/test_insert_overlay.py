@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+from src.builtin_actions import _insert_overlay as insert_overlay_
+
+
+@mock.patch('src.builtin_actions._insert_overlay.utils_pdb')
+class TestImageCache(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+    self.filepaths = []
+    for name in ['a', 'b', 'c']:
+      filepath = os.path.join(self.temp_dir.name, name)
+      self._write_file(filepath, 'image')
+      self.filepaths.append(filepath)
+
+    self.cache = insert_overlay_._ImageCache(max_num_images=2, max_size_bytes=1000)
+
+  def test_get_loads_image_once(self, mock_utils_pdb):
+    image = _create_image()
+    load_image_func = mock.Mock(return_value=image)
+
+    self.assertIs(self.cache.get(self.filepaths[0], load_image_func), image)
+    self.assertIs(self.cache.get(self.filepaths[0], load_image_func), image)
+
+    self.assertEqual(load_image_func.call_count, 1)
+    self.assertEqual(self.cache.num_hits, 1)
+    self.assertEqual(self.cache.num_misses, 1)
+    mock_utils_pdb.try_delete_image.assert_not_called()
+
+  def test_get_evicts_least_recently_used_image_by_count(self, mock_utils_pdb):
+    images = [_create_image() for _filepath in self.filepaths]
+
+    self.cache.get(self.filepaths[0], lambda: images[0])
+    self.cache.get(self.filepaths[1], lambda: images[1])
+    # This makes the second image the least recently used.
+    self.cache.get(self.filepaths[0], lambda: None)
+    self.cache.get(self.filepaths[2], lambda: images[2])
+
+    mock_utils_pdb.try_delete_image.assert_called_once_with(images[1])
+
+    self.assertIs(self.cache.get(self.filepaths[0], lambda: None), images[0])
+    self.assertIs(self.cache.get(self.filepaths[2], lambda: None), images[2])
+
+  def test_get_evicts_least_recently_used_image_by_size(self, mock_utils_pdb):
+    images = [_create_image(width=150), _create_image(width=150)]
+
+    self.cache.get(self.filepaths[0], lambda: images[0])
+    self.cache.get(self.filepaths[1], lambda: images[1])
+
+    mock_utils_pdb.try_delete_image.assert_called_once_with(images[0])
+
+  def test_get_keeps_most_recently_used_image_exceeding_size(self, mock_utils_pdb):
+    image = _create_image(width=300)
+
+    self.assertIs(self.cache.get(self.filepaths[0], lambda: image), image)
+    self.assertIs(self.cache.get(self.filepaths[0], lambda: None), image)
+
+    mock_utils_pdb.try_delete_image.assert_not_called()
+
+  def test_get_reloads_image_if_file_is_modified(self, mock_utils_pdb):
+    images = [_create_image(), _create_image()]
+
+    self.cache.get(self.filepaths[0], lambda: images[0])
+
+    self._write_file(self.filepaths[0], 'modified image')
+
+    self.assertIs(self.cache.get(self.filepaths[0], lambda: images[1]), images[1])
+    self.assertEqual(self.cache.num_misses, 2)
+
+  def test_get_reloads_image_if_modification_time_changes(self, mock_utils_pdb):
+    images = [_create_image(), _create_image()]
+
+    self.cache.get(self.filepaths[0], lambda: images[0])
+
+    file_stat = os.stat(self.filepaths[0])
+    os.utime(self.filepaths[0], ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+
+    self.assertIs(self.cache.get(self.filepaths[0], lambda: images[1]), images[1])
+
+  def test_get_reloads_image_if_no_longer_valid(self, mock_utils_pdb):
+    images = [_create_image(), _create_image()]
+
+    self.cache.get(self.filepaths[0], lambda: images[0])
+
+    images[0].is_valid.return_value = False
+
+    self.assertIs(self.cache.get(self.filepaths[0], lambda: images[1]), images[1])
+    mock_utils_pdb.try_delete_image.assert_called_once_with(images[0])
+
+    # The discarded image no longer counts towards the number of images.
+    self.cache.get(self.filepaths[1], _create_image)
+    self.assertEqual(mock_utils_pdb.try_delete_image.call_count, 1)
+
+  def test_clear(self, mock_utils_pdb):
+    images = [_create_image(), _create_image()]
+
+    self.cache.get(self.filepaths[0], lambda: images[0])
+    self.cache.get(self.filepaths[1], lambda: images[1])
+
+    self.cache.clear()
+
+    self.assertListEqual(
+      mock_utils_pdb.try_delete_image.call_args_list, [mock.call(images[0]), mock.call(images[1])])
+
+    new_image = _create_image()
+    self.assertIs(self.cache.get(self.filepaths[0], lambda: new_image), new_image)
+
+  @staticmethod
+  def _write_file(filepath, contents):
+    with open(filepath, 'w') as f:
+      f.write(contents)
+
+
+def _create_image(width=1, height=1, bpp=4):
+  layer = mock.Mock()
+  layer.get_width.return_value = width
+  layer.get_height.return_value = height
+  layer.get_bpp.return_value = bpp
+
+  image = mock.Mock()
+  image.is_valid.return_value = True
+  image.get_layers.return_value = [layer]
+
+  return image
@@ -0,0 +1,35 @@
+import unittest
+import unittest.mock as mock
+
+from src.builtin_actions import _utils as builtin_actions_utils
+
+
+class TestFileFormatFunctionCache(unittest.TestCase):
+
+  def setUp(self):
+    self.get_function = mock.Mock(side_effect=lambda *args: (mock.Mock(), {}))
+    self.cache = builtin_actions_utils.FileFormatFunctionCache(self.get_function)
+
+    self.file_format_options = {'png': []}
+
+  def test_get_obtains_function_once_per_file_extension(self):
+    png_function_and_kwargs = self.cache.get('png', self.file_format_options)
+    jpg_function_and_kwargs = self.cache.get('jpg', self.file_format_options)
+
+    self.assertIs(self.cache.get('png', self.file_format_options), png_function_and_kwargs)
+    self.assertIs(self.cache.get('jpg', self.file_format_options), jpg_function_and_kwargs)
+    self.assertIsNot(png_function_and_kwargs, jpg_function_and_kwargs)
+
+    self.assertEqual(self.get_function.call_count, 2)
+
+  def test_get_with_different_arguments(self):
+    png_function_and_kwargs = self.cache.get('png', 'use_explicit_values', self.file_format_options)
+
+    self.assertIsNot(
+      self.cache.get('png', 'use_native_plugin_dialog', self.file_format_options),
+      png_function_and_kwargs)
+    self.assertIsNot(
+      self.cache.get('png', 'use_explicit_values', {'png': []}),
+      png_function_and_kwargs)
+
+    self.assertEqual(self.get_function.call_count, 3)
@@ -1,7 +1,13 @@
 import io
+import json
+import os
+import pickle
+import tempfile
 import unittest
 import unittest.mock as mock
+import zlib
 
+from src import utils
 from src.setting import group as group_
 from src.setting import settings as settings_
 from src.setting import sources as sources_
@@ -867,6 +873,59 @@ def test_write_read(self, _mock_gimp_module):
   def test_read_source_not_found(self, _mock_gimp_module):
     with self.assertRaises(sources_.SourceNotFoundError):
       self.source.read([self.settings])
+
+  def test_write_stores_compressed_data_with_header(self, mock_gimp_module):
+    self.source.write([self.settings])
+
+    parasite_data = utils.signed_bytes_to_bytes(
+      mock_gimp_module.get_parasite(self.source_name).get_data())
+
+    self.assertTrue(parasite_data.startswith(sources_.GimpParasiteSource._DATA_HEADER))
+    self.assertEqual(
+      pickle.loads(sources_.GimpParasiteSource._decode_data(parasite_data)),
+      self.source.read_data_from_source())
+
+  def test_read_data_in_legacy_format(self, mock_gimp_module):
+    self.settings['file_extension'].set_value('jpg')
+
+    legacy_source = sources_.SimpleInMemorySource()
+    legacy_source.write([self.settings])
+
+    mock_gimp_module.attach_parasite(
+      stubs_gimp.Parasite.new(
+        self.source_name,
+        0,
+        utils.bytes_to_signed_bytes(pickle.dumps(legacy_source.data))))
+
+    self.settings['file_extension'].reset()
+
+    self.source.read([self.settings])
+
+    self.assertEqual(self.settings['file_extension'].value, 'jpg')
+
+  def test_read_data_with_unsupported_format_version(self, mock_gimp_module):
+    mock_gimp_module.attach_parasite(
+      stubs_gimp.Parasite.new(
+        self.source_name,
+        0,
+        utils.bytes_to_signed_bytes(
+          sources_.GimpParasiteSource._DATA_HEADER
+          + bytes([sources_.GimpParasiteSource._DATA_FORMAT_VERSION + 1])
+          + zlib.compress(pickle.dumps([])))))
+
+    with self.assertRaises(sources_.SourceInvalidFormatError):
+      self.source.read([self.settings])
+
+  def test_write_large_data_is_compressed(self, mock_gimp_module):
+    self.settings['file_extension'].set_value(
+      '|'.join(f'/home/user/Pictures/image_{i}.png' for i in range(5000)))
+
+    self.source.write([self.settings])
+
+    compressed_length = len(mock_gimp_module.get_parasite(self.source_name).get_data())
+
+    self.assertLess(
+      compressed_length, len(pickle.dumps(self.source.read_data_from_source())) // 5)
   
   def test_read_settings_invalid_format(self, _mock_gimp_module):
     self.source.write([self.settings])
@@ -1055,3 +1114,147 @@ def setUp(self):
     self.filepath = self._filepath
     self.source = self._source_class(self.source_name, self.filepath)
     self.settings = stubs_group.create_test_settings()
+
+
+class TestCachedJsonFileSource(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+    self.filepath = os.path.join(self.temp_dir.name, 'settings.json')
+    self.source = sources_.CachedJsonFileSource('test_settings', self.filepath)
+    self.settings = stubs_group.create_test_settings()
+
+  def test_write_read(self):
+    self.settings['file_extension'].set_value('jpg')
+    self.settings['flatten'].set_value(True)
+
+    self.source.write([self.settings])
+
+    self.settings['file_extension'].reset()
+    self.settings['flatten'].reset()
+
+    self.source.read([self.settings])
+
+    self.assertEqual(self.settings['file_extension'].value, 'jpg')
+    self.assertEqual(self.settings['flatten'].value, True)
+
+  def test_read_does_not_parse_unmodified_file_again(self):
+    self.source.write([self.settings])
+
+    with mock.patch('src.setting.sources.json.load') as mock_json_load:
+      self.source.read([self.settings])
+      self.assertTrue(self.source.has_data())
+
+      source_2 = sources_.CachedJsonFileSource('test_settings', self.filepath)
+      source_2.read([self.settings])
+
+    self.assertEqual(mock_json_load.call_count, 0)
+
+  def test_read_parses_file_modified_externally(self):
+    self.source.write([self.settings])
+
+    source_2 = sources_.JsonFileSource('test_settings', self.filepath)
+    self.settings['file_extension'].set_value('tiff')
+    source_2.write([self.settings])
+
+    self.settings['file_extension'].reset()
+
+    self.source.read([self.settings])
+
+    self.assertEqual(self.settings['file_extension'].value, 'tiff')
+
+  def test_write_does_not_leave_temporary_files(self):
+    self.source.write([self.settings])
+
+    self.assertListEqual(os.listdir(self.temp_dir.name), ['settings.json'])
+
+  def test_write_failure_keeps_original_file_intact(self):
+    self.settings['file_extension'].set_value('jpg')
+    self.source.write([self.settings])
+
+    with open(self.filepath, 'r') as f:
+      orig_contents = f.read()
+
+    self.settings['file_extension'].set_value('gif')
+
+    with mock.patch('src.setting.sources.json.dump', side_effect=ValueError):
+      with self.assertRaises(sources_.SourceWriteError):
+        self.source.write([self.settings])
+
+    with open(self.filepath, 'r') as f:
+      self.assertEqual(f.read(), orig_contents)
+
+    self.assertListEqual(os.listdir(self.temp_dir.name), ['settings.json'])
+
+  def test_write_compact(self):
+    source = sources_.CachedJsonFileSource('test_settings', self.filepath, compact=True)
+
+    source.write([self.settings])
+
+    with open(self.filepath, 'r') as f:
+      contents = f.read()
+
+    self.assertNotIn('\n', contents)
+    self.assertNotIn(': ', contents)
+
+  def test_write_deferred_until_flush(self):
+    source_2 = sources_.CachedJsonFileSource('test_settings_2', self.filepath)
+
+    self.settings['file_extension'].set_value('jpg')
+    self.source.write([self.settings['file_extension']], flush=False)
+
+    self.settings['flatten'].set_value(True)
+    source_2.write([self.settings['flatten']], flush=False)
+
+    self.assertFalse(os.path.isfile(self.filepath))
+    self.assertTrue(self.source.has_data())
+
+    with mock.patch(
+          'src.setting.sources.CachedJsonFileSource.write_all_data',
+          wraps=self.source.write_all_data) as spy_write_all_data:
+      self.source.flush()
+      source_2.flush()
+
+    self.assertEqual(spy_write_all_data.call_count, 1)
+
+    with open(self.filepath, 'r') as f:
+      all_data = json.load(f)
+
+    self.assertIn('test_settings', all_data)
+    self.assertIn('test_settings_2', all_data)
+
+  def test_failed_flush_does_not_keep_unsaved_data(self):
+    self.settings['file_extension'].set_value('jpg')
+    self.source.write([self.settings])
+
+    self.settings['file_extension'].set_value('gif')
+    self.source.write([self.settings], flush=False)
+
+    with mock.patch('src.setting.sources.json.dump', side_effect=ValueError):
+      with self.assertRaises(sources_.SourceWriteError):
+        self.source.flush()
+
+    self.settings['file_extension'].reset()
+
+    self.source.read([self.settings])
+
+    self.assertEqual(self.settings['file_extension'].value, 'jpg')
+
+  def test_clear_retains_other_source_names(self):
+    source_2 = sources_.CachedJsonFileSource('test_settings_2', self.filepath)
+
+    self.source.write([self.settings['file_extension']])
+    source_2.write([self.settings['flatten']])
+
+    self.source.clear()
+
+    self.assertFalse(self.source.has_data())
+    self.assertTrue(source_2.has_data())
+
+  def test_has_data_invalid_format(self):
+    with open(self.filepath, 'w') as f:
+      f.write('{invalid')
+
+    self.assertEqual(self.source.has_data(), 'invalid_format')
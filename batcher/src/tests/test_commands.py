@@ -667,3 +667,22 @@ def test_with_non_unique_param_names(self, _mock_get_pdb):
        'filename',
        'save-options-2',
        'filename-2'])
+
+
+class TestGeglOperationsCustomAttributes(unittest.TestCase):
+
+  def setUp(self):
+    self.orig_gegl_operations_custom_attributes = commands_._gegl_operations_custom_attributes
+    commands_._gegl_operations_custom_attributes = None
+
+  def tearDown(self):
+    commands_._gegl_operations_custom_attributes = self.orig_gegl_operations_custom_attributes
+
+  def test_custom_attributes_are_loaded_on_first_use_only(self):
+    with mock.patch('src.commands.json.load', wraps=commands_.json.load) as spy_json_load:
+      custom_attributes = commands_._get_gegl_operations_custom_attributes()
+      commands_._get_gegl_operations_custom_attributes()
+
+    self.assertEqual(spy_json_load.call_count, 1)
+    self.assertIn('gegl:wind', custom_attributes)
+    self.assertIn('gui_type_kwargs', custom_attributes['gegl:wind']['strength'])
@@ -1,6 +1,8 @@
 import unittest
 import unittest.mock as mock
 
+import parameterized
+
 import gi
 gi.require_version('Gimp', '3.0')
 from gi.repository import Gimp
@@ -10,9 +12,11 @@
 from src import builtin_actions
 from src import commands as commands_
 from src import core
+from src import exceptions
 from src import invoker as invoker_
 from src import itemtree
 from src import plugin_settings
+from src import progress as progress_
 from src import utils
 from src import utils_setting as utils_setting_
 from src.procedure_groups import *
@@ -236,3 +240,289 @@ def test_get_replaced_args(self):
         'offset_y': 50,
         'same_value_as_placeholder_value': 'current_image',
       })
+
+
+class TestFuseOrientations(unittest.TestCase):
+
+  def test_flipping_twice_restores_orientation(self):
+    orientation = core._get_flipped_orientation(core._get_flipped_orientation((0, False)))
+
+    self.assertEqual(orientation, (0, False))
+
+  def test_rotating_after_flipping(self):
+    orientation = core._get_rotated_orientation(core._get_flipped_orientation((0, False)), 1)
+
+    self.assertEqual(orientation, (1, True))
+
+  def test_flipping_after_rotating_reverses_rotation(self):
+    orientation = core._get_flipped_orientation(core._get_rotated_orientation((0, False), 1))
+
+    self.assertEqual(orientation, (3, True))
+
+  def test_full_rotation_restores_orientation(self):
+    orientation = (0, False)
+    for _i in range(4):
+      orientation = core._get_rotated_orientation(orientation, 1)
+
+    self.assertEqual(orientation, (0, False))
+
+  def test_apply_orientation(self):
+    image = mock.Mock()
+
+    core._apply_orientation(image, (1, True))
+
+    self.assertListEqual(
+      image.mock_calls,
+      [mock.call.flip(Gimp.OrientationType.HORIZONTAL),
+       mock.call.rotate(Gimp.RotationType.DEGREES90)])
+
+  def test_apply_orientation_flipped_and_rotated_by_180_degrees_flips_vertically(self):
+    image = mock.Mock()
+
+    core._apply_orientation(image, (2, True))
+
+    self.assertListEqual(image.mock_calls, [mock.call.flip(Gimp.OrientationType.VERTICAL)])
+
+  def test_apply_identity_orientation_does_nothing(self):
+    image = mock.Mock()
+
+    core._apply_orientation(image, (0, False))
+
+    self.assertFalse(image.mock_calls)
+
+  def test_apply_orientation_restores_image_if_rotation_fails(self):
+    image = mock.Mock()
+    image.rotate.side_effect = RuntimeError('error')
+
+    with self.assertRaises(RuntimeError):
+      core._apply_orientation(image, (1, True))
+
+    self.assertListEqual(
+      image.mock_calls,
+      [mock.call.flip(Gimp.OrientationType.HORIZONTAL),
+       mock.call.rotate(Gimp.RotationType.DEGREES90),
+       mock.call.flip(Gimp.OrientationType.HORIZONTAL)])
+
+  @mock.patch('src.core._apply_orientation')
+  def test_try_apply_fused_orientation(self, mock_apply_orientation):
+    batcher = _create_image_batcher()
+    image = mock.Mock()
+
+    with mock.patch.object(
+          batcher, '_get_image_and_orientation_for_fusion', return_value=(image, (1, True))):
+      self.assertTrue(batcher._try_apply_fused_orientation(batcher, []))
+
+    mock_apply_orientation.assert_called_once_with(image, (1, True))
+
+  @parameterized.parameterized.expand([
+    ('actions_cannot_be_fused', None, None),
+    ('getting_orientation_fails', RuntimeError('error'), None),
+    ('applying_orientation_fails', None, RuntimeError('error')),
+  ])
+  @mock.patch('src.core._apply_orientation')
+  def test_try_apply_fused_orientation_falls_back_to_separate_actions(
+        self,
+        _test_case_suffix,
+        get_image_and_orientation_error,
+        apply_orientation_error,
+        mock_apply_orientation,
+  ):
+    batcher = _create_image_batcher()
+    mock_apply_orientation.side_effect = apply_orientation_error
+
+    if get_image_and_orientation_error is None and apply_orientation_error is None:
+      image_and_orientation = None
+    else:
+      image_and_orientation = (mock.Mock(), (1, True))
+
+    with mock.patch.object(
+          batcher,
+          '_get_image_and_orientation_for_fusion',
+          return_value=image_and_orientation,
+          side_effect=get_image_and_orientation_error):
+      self.assertFalse(batcher._try_apply_fused_orientation(batcher, []))
+
+    self.assertEqual(batcher._get_num_failed_commands(), 0)
+
+  def test_try_apply_fused_orientation_does_not_suppress_cancel(self):
+    batcher = _create_image_batcher()
+
+    with mock.patch.object(
+          batcher,
+          '_get_image_and_orientation_for_fusion',
+          side_effect=exceptions.BatcherCancelError('canceled')):
+      with self.assertRaises(exceptions.BatcherCancelError):
+        batcher._try_apply_fused_orientation(batcher, [])
+
+
+class TestGroupConsecutiveExportActions(unittest.TestCase):
+
+  def test_group_consecutive_export_actions(self):
+    actions = [
+      _create_action('scale_for_images'),
+      _create_action('export_for_convert'),
+      _create_action('export_for_convert'),
+      _create_action('export_for_convert'),
+      _create_action('scale_for_images'),
+      _create_action('export_for_convert'),
+    ]
+
+    self.assertEqual(
+      list(core._group_consecutive_export_actions([action] for action in actions)),
+      [actions[:1], actions[1:4], actions[4:5], actions[5:]])
+
+  def test_group_consecutive_export_actions_with_incompatible_arguments(self):
+    actions = [_create_action('export_for_convert') for _i in range(5)]
+
+    actions[1]['arguments/layer_handling'].set_value(
+      builtin_actions.LayerHandlingModes.KEEP_LAYERS)
+    actions[2]['arguments/export_mode'].set_value(builtin_actions.ExportModes.SINGLE_IMAGE)
+    actions[4]['arguments/rotate_flip_image_based_on_exif_metadata'].set_value(False)
+
+    self.assertEqual(
+      list(core._group_consecutive_export_actions([action] for action in actions)),
+      [actions[:1], actions[1:2], actions[2:3], actions[3:4], actions[4:]])
+
+  def test_group_consecutive_export_actions_keeps_other_groups(self):
+    action_groups = [
+      [_create_action('export_for_convert')],
+      [_create_action('flip_horizontally_for_images'), _create_action('rotate_for_images')],
+      [_create_action('export_for_convert')],
+    ]
+
+    self.assertEqual(list(core._group_consecutive_export_actions(action_groups)), action_groups)
+
+
+def _create_action(name):
+  return commands_.create_command(builtin_actions.BUILTIN_ACTIONS[name])
+
+
+def _create_image_batcher(actions=None):
+  return core.ImageBatcher(
+    item_tree=itemtree.ImageFileTree(),
+    actions=actions if actions is not None else commands_.create('actions'),
+    conditions=commands_.create('conditions'),
+    continue_on_error=True,
+    progress_updater=progress_.ProgressUpdater(None, num_total_tasks=3),
+  )
+
+
+class TestImageBatcherGmicFilterInBatch(unittest.TestCase):
+
+  def setUp(self):
+    self.actions = commands_.create('actions')
+    self.gmic_filter_action = commands_.add(
+      self.actions, builtin_actions.BUILTIN_ACTIONS['gmic_filter'])
+    self.gmic_filter_action['arguments/command'].set_value('fx_sharpen_details 1,5')
+    self.gmic_filter_action['arguments/batch_size'].set_value(2)
+
+    self.batcher = _create_image_batcher(self.actions)
+    self.batcher._is_preview = False
+    self.batcher._edit_mode = False
+
+    self.items = [mock.Mock(raw=None, orig_name=name) for name in ['a', 'b', 'c']]
+    self.batcher._matching_items = dict(zip(self.items, [*self.items[1:], None]))
+    self.batcher._current_item = self.items[0]
+
+    self.images = {item: mock.Mock(name=f'image_{item.orig_name}') for item in self.items}
+    self.layers = {item: [mock.Mock(name=f'layer_{item.orig_name}')] for item in self.items}
+    for layers in self.layers.values():
+      layers[0].is_group_layer.return_value = False
+
+    mock.patch.object(
+      self.batcher, '_load_image_in_batch', new=lambda item: self.images[item]).start()
+    mock.patch.object(
+      self.batcher,
+      '_get_layers_to_filter_in_batch',
+      new=lambda item, _image, _action: self.layers[item],
+    ).start()
+    self.mock_gmic_filter_for_multiple_images = mock.patch(
+      'src.core.builtin_actions.gmic_filter_for_multiple_images').start()
+    self.mock_try_delete_image = mock.patch('src.core.utils_pdb.try_delete_image').start()
+    self.addCleanup(mock.patch.stopall)
+
+  def test_get_leading_batched_gmic_filter_action(self):
+    self.batcher._actions = self.actions
+
+    self.assertIs(
+      self.batcher._get_leading_batched_gmic_filter_action(), self.gmic_filter_action)
+
+  def test_get_leading_batched_gmic_filter_action_with_batch_size_of_one(self):
+    self.batcher._actions = self.actions
+    self.gmic_filter_action['arguments/batch_size'].set_value(1)
+
+    self.assertIsNone(self.batcher._get_leading_batched_gmic_filter_action())
+
+  def test_get_leading_batched_gmic_filter_action_in_preview(self):
+    self.batcher._actions = self.actions
+    self.batcher._is_preview = True
+
+    self.assertIsNone(self.batcher._get_leading_batched_gmic_filter_action())
+
+  def test_filter_is_applied_once_to_images_in_batch(self):
+    self._load_images_and_apply_gmic_filter_in_batch()
+
+    self.mock_gmic_filter_for_multiple_images.assert_called_once_with(
+      [
+        (self.images[self.items[0]], self.layers[self.items[0]]),
+        (self.images[self.items[1]], self.layers[self.items[1]]),
+      ],
+      'fx_sharpen_details 1,5')
+
+    self.assertDictEqual(
+      self.batcher._images_loaded_in_batch,
+      {self.items[0]: self.images[self.items[0]], self.items[1]: self.images[self.items[1]]})
+
+    self.assertFalse(self.batcher._is_enabled(self.gmic_filter_action))
+
+    self.batcher._current_item = self.items[2]
+    self.assertTrue(self.batcher._is_enabled(self.gmic_filter_action))
+
+  def test_unchanged_items_are_skipped(self):
+    self.batcher._manifest = mock.Mock()
+    self.batcher._manifest.is_up_to_date.side_effect = lambda item_id, _hash: (
+      item_id == self.items[1].id)
+
+    self._load_images_and_apply_gmic_filter_in_batch()
+
+    self.assertListEqual(
+      list(self.batcher._images_loaded_in_batch), [self.items[0], self.items[2]])
+
+  def test_items_with_group_layers_are_not_filtered_in_batch(self):
+    self.layers[self.items[1]] = None
+    self.gmic_filter_action['arguments/batch_size'].set_value(3)
+
+    self._load_images_and_apply_gmic_filter_in_batch()
+
+    self.mock_gmic_filter_for_multiple_images.assert_called_once_with(
+      [
+        (self.images[self.items[0]], self.layers[self.items[0]]),
+        (self.images[self.items[2]], self.layers[self.items[2]]),
+      ],
+      'fx_sharpen_details 1,5')
+
+    self.batcher._current_item = self.items[1]
+    self.assertIn(self.items[1], self.batcher._images_loaded_in_batch)
+    self.assertTrue(self.batcher._is_enabled(self.gmic_filter_action))
+
+  def test_filter_is_not_applied_to_single_image(self):
+    self.batcher._matching_items = {self.items[0]: None}
+
+    self._load_images_and_apply_gmic_filter_in_batch()
+
+    self.mock_gmic_filter_for_multiple_images.assert_not_called()
+    self.assertTrue(self.batcher._is_enabled(self.gmic_filter_action))
+
+  def test_images_are_discarded_if_filter_fails(self):
+    self.mock_gmic_filter_for_multiple_images.side_effect = ValueError('error')
+
+    self._load_images_and_apply_gmic_filter_in_batch()
+
+    self.assertDictEqual(self.batcher._images_loaded_in_batch, {})
+    self.mock_try_delete_image.assert_has_calls(
+      [mock.call(self.images[self.items[0]]), mock.call(self.images[self.items[1]])])
+    self.assertTrue(self.batcher._is_enabled(self.gmic_filter_action))
+
+  def _load_images_and_apply_gmic_filter_in_batch(self):
+    self.batcher._batched_gmic_filter_action = self.gmic_filter_action
+    self.batcher._load_images_and_apply_gmic_filter_in_batch()
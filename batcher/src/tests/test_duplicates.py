@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+
+from src import duplicates as duplicates_
+
+
+class TestGetIdenticalFiles(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+  def test_get_identical_files(self):
+    filepaths = [
+      self._create_file('a.png', b'image 1'),
+      self._create_file('b.png', b'image 2'),
+      self._create_file('c.png', b'image 1'),
+      self._create_file('d.png', b'image 2'),
+      self._create_file('e.png', b'image 3'),
+      self._create_file('f.png', b'image 1'),
+    ]
+
+    self.assertEqual(
+      duplicates_.get_identical_files(filepaths),
+      [
+        [filepaths[0], filepaths[2], filepaths[5]],
+        [filepaths[1], filepaths[3]],
+      ])
+
+  def test_get_identical_files_with_same_size_and_beginning(self):
+    contents = b'x' * (duplicates_._PARTIAL_HASH_SIZE + 10)
+
+    filepaths = [
+      self._create_file('a.png', contents + b'1'),
+      self._create_file('b.png', contents + b'2'),
+      self._create_file('c.png', contents + b'1'),
+    ]
+
+    self.assertEqual(
+      duplicates_.get_identical_files(filepaths), [[filepaths[0], filepaths[2]]])
+
+  def test_get_identical_files_ignores_nonexistent_files(self):
+    filepaths = [
+      self._create_file('a.png', b'image'),
+      os.path.join(self.temp_dir.name, 'nonexistent.png'),
+      self._create_file('b.png', b'image'),
+    ]
+
+    self.assertEqual(
+      duplicates_.get_identical_files(filepaths), [[filepaths[0], filepaths[2]]])
+
+  def test_get_identical_files_without_duplicates(self):
+    filepaths = [
+      self._create_file('a.png', b'image 1'),
+      self._create_file('b.png', b'image 2'),
+    ]
+
+    self.assertEqual(duplicates_.get_identical_files(filepaths), [])
+
+  def _create_file(self, filename, contents):
+    return _create_file(self.temp_dir.name, filename, contents)
+
+
+class TestCreateFileFromDuplicate(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+    self.source_filepath = _create_file(self.temp_dir.name, 'source.png', b'image')
+    self.filepath = os.path.join(self.temp_dir.name, 'output.png')
+
+  def test_create_file_from_duplicate(self):
+    for mode in duplicates_.DuplicateOutputModes.DUPLICATE_OUTPUT_MODES:
+      with self.subTest(mode=mode):
+        duplicates_.create_file_from_duplicate(self.source_filepath, self.filepath, mode)
+
+        with open(self.filepath, 'rb') as f:
+          self.assertEqual(f.read(), b'image')
+
+        os.remove(self.filepath)
+
+  def test_create_file_from_duplicate_as_copy(self):
+    duplicates_.create_file_from_duplicate(
+      self.source_filepath, self.filepath, duplicates_.DuplicateOutputModes.COPY)
+
+    self.assertFalse(os.path.samefile(self.source_filepath, self.filepath))
+
+  def test_create_file_from_duplicate_as_hard_link(self):
+    duplicates_.create_file_from_duplicate(
+      self.source_filepath, self.filepath, duplicates_.DuplicateOutputModes.HARDLINK)
+
+    self.assertTrue(os.path.samefile(self.source_filepath, self.filepath))
+
+  def test_create_file_from_duplicate_replaces_existing_file(self):
+    _create_file(self.temp_dir.name, 'output.png', b'existing image')
+
+    duplicates_.create_file_from_duplicate(
+      self.source_filepath, self.filepath, duplicates_.DuplicateOutputModes.HARDLINK)
+
+    with open(self.filepath, 'rb') as f:
+      self.assertEqual(f.read(), b'image')
+
+  def test_create_file_from_duplicate_with_same_file(self):
+    duplicates_.create_file_from_duplicate(
+      self.source_filepath, self.source_filepath, duplicates_.DuplicateOutputModes.COPY)
+
+    with open(self.source_filepath, 'rb') as f:
+      self.assertEqual(f.read(), b'image')
+
+
+def _create_file(dirpath, filename, contents):
+  filepath = os.path.join(dirpath, filename)
+
+  with open(filepath, 'wb') as f:
+    f.write(contents)
+
+  return filepath
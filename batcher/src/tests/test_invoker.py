@@ -743,6 +743,43 @@ def test_invoke_with_callable_command_and_initialization(self):
     
     self.assertEqual(test_list, [1, 3, 2, 4])
 
+  def test_invoke_after_modifying_commands_between_invocations(self):
+    test_list = []
+
+    self.invoker.add(append_to_list, ['main'], args=[test_list, 1])
+    command_2_id = self.invoker.add(append_to_list, ['main'], args=[test_list, 2])
+
+    self.invoker.invoke(['main'])
+
+    self.invoker.add(append_to_list, ['main'], args=[test_list, 3])
+    self.invoker.invoke(['main'])
+
+    self.invoker.reorder(command_2_id, 0, 'main')
+    self.invoker.invoke(['main'])
+
+    self.invoker.remove(command_2_id, ['main'])
+    self.invoker.invoke(['main'])
+
+    self.assertEqual(test_list, [1, 2, 1, 2, 3, 2, 1, 3, 1, 3])
+
+  def test_invoke_while_removing_and_readding_command_inside_command(self):
+    def append_to_list_and_readd_command(list_, arg):
+      list_.append(arg)
+      self.invoker.remove(command_3_id, ['main'])
+      self.invoker.add_to_groups(command_3_id, ['main'])
+
+    test_list = []
+    self.invoker.add(append_to_list, ['main'], args=[test_list, 'one'])
+    self.invoker.add(append_to_list_and_readd_command, ['main'], args=[test_list, 'two'])
+    command_3_id = self.invoker.add(append_to_list, ['main'], args=[test_list, 'three'])
+
+    # Keep the command in another group so that it is not deleted on removal.
+    self.invoker.add_to_groups(command_3_id, ['additional'])
+
+    self.invoker.invoke(['main'])
+
+    self.assertEqual(test_list, ['one', 'two', 'three'])
+
 
 class TestInvokerInvokeForeachCommands(InvokerTestCase):
   
@@ -868,6 +905,42 @@ def raise_error():
 
     self.assertListEqual(test_list, [2, 1, 2, 2, 2])
 
+  def test_invoke_foreach_command_suppressing_error(self):
+    test_list = []
+
+    class SuppressError:
+
+      def __enter__(self):
+        test_list.append('enter')
+
+      def __exit__(self, exc_type, exc_val, exc_tb):
+        test_list.append(exc_type)
+        return True
+
+    def raise_error():
+      raise ValueError
+
+    self.invoker.add(raise_error)
+    self.invoker.add(append_to_list, args=[test_list, 1])
+    self.invoker.add(SuppressError, foreach=True)
+
+    self.invoker.invoke()
+
+    self.assertListEqual(test_list, ['enter', ValueError, 'enter', 1, None])
+
+  def test_invoke_foreach_command_added_during_invocation(self):
+    def add_foreach_command(list_):
+      self.invoker.add(append_to_list_before, args=[list_, 2], foreach=True)
+
+    test_list = []
+
+    self.invoker.add(add_foreach_command, args=[test_list])
+    self.invoker.add(append_to_list, args=[test_list, 1])
+
+    self.invoker.invoke()
+
+    self.assertListEqual(test_list, [2, 1])
+
   def test_invoke_foreach_command_not_as_context_manager_raises_error(self):
     test_list = []
 
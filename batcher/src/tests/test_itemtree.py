@@ -133,6 +133,35 @@ def test_add_with_folders_but_without_expand_folders(
       self.tree[os.path.join(self.root_path, 'Overlay'), self.FOLDER_KEY].id,
       items[3].id)
 
+  def test_add_with_add_item_callback(self, mock_abspath, mock_listdir, mock_isdir):
+    self._set_up_tree_before_add(mock_abspath, mock_listdir, mock_isdir)
+
+    items_passed_to_callback = []
+
+    def _add_item_callback(item):
+      items_passed_to_callback.append(item)
+      return True
+
+    added_items = self.tree.add(self.paths[0], add_item_callback=_add_item_callback)
+
+    self.assertListEqual(items_passed_to_callback, added_items)
+    self.assertEqual(len(added_items), len(self.expected_keys_and_paths))
+
+  def test_add_stopped_by_add_item_callback_leaves_tree_unmodified(
+        self, mock_abspath, mock_listdir, mock_isdir):
+    self._set_up_tree_before_add(mock_abspath, mock_listdir, mock_isdir)
+
+    def _add_item_callback(item):
+      return item.id != os.path.join(self.root_path, 'Corners', 'top-left3')
+
+    added_items = self.tree.add(self.paths[0], add_item_callback=_add_item_callback)
+
+    self.assertListEqual(added_items, [])
+    self.assertEqual(len(self.tree), 0)
+    self.assertListEqual(list(self.tree.iter_all()), [])
+    # Children of `Corners/top-left3` are not obtained.
+    self.assertEqual(mock_listdir.call_count, 2)
+
   @parameterized.parameterized.expand([
     ('after_last_item',
      None,
@@ -816,6 +845,55 @@ def test_sort(
       else:
         self.assertIsNone(item.next)
 
+  @parameterized.parameterized.expand([
+    ('sequentially', 1000),
+    ('in_parallel', 0),
+  ])
+  @mock.patch('src.itemtree.os.stat')
+  def test_prefetch_stats(
+        self,
+        _test_case_name_suffix,
+        min_num_items_to_prefetch_stats_in_parallel,
+        mock_stat,
+        mock_abspath,
+        mock_listdir,
+        mock_isdir,
+  ):
+    self._set_up_tree_before_add(mock_abspath, mock_listdir, mock_isdir)
+
+    self.tree.add(self.paths[0])
+
+    mock_stat.side_effect = lambda path: f'stat:{path}'
+
+    with mock.patch.object(
+          self.tree,
+          '_MIN_NUM_ITEMS_TO_PREFETCH_STATS_IN_PARALLEL',
+          min_num_items_to_prefetch_stats_in_parallel):
+      self.tree.prefetch_stats()
+
+    self.assertEqual(mock_stat.call_count, len(self.expected_keys_and_paths))
+
+    for item in self.tree.iter_all():
+      self.assertEqual(item.stat, f'stat:{item.id}')
+
+    self.tree.prefetch_stats()
+
+    self.assertEqual(mock_stat.call_count, len(self.expected_keys_and_paths))
+
+  @mock.patch('src.itemtree.os.stat')
+  def test_refresh_resets_stats(self, mock_stat, mock_abspath, mock_listdir, mock_isdir):
+    self._set_up_tree_before_add(mock_abspath, mock_listdir, mock_isdir)
+
+    self.tree.add(self.paths[0])
+
+    self.tree.prefetch_stats()
+
+    self.tree.refresh()
+
+    self.tree.prefetch_stats()
+
+    self.assertEqual(mock_stat.call_count, len(self.expected_keys_and_paths) * 2)
+
 
 class TestLayerTree(unittest.TestCase):
 
@@ -1215,6 +1293,30 @@ def test_id(self):
   def test_raw_on_instantiation(self):
     self.assertIsNone(self.item.raw)
 
+  @mock.patch('src.itemtree.os.stat')
+  def test_stat_is_obtained_once(self, mock_stat):
+    self.assertEqual(self.item.stat, mock_stat.return_value)
+    self.assertEqual(self.item.stat, mock_stat.return_value)
+
+    mock_stat.assert_called_once_with(self.path)
+
+  @mock.patch('src.itemtree.os.stat', side_effect=FileNotFoundError)
+  def test_stat_for_inaccessible_file(self, mock_stat):
+    self.assertIsNone(self.item.stat)
+    self.assertIsNone(self.item.stat)
+
+    mock_stat.assert_called_once_with(self.path)
+
+  @mock.patch('src.itemtree.os.stat')
+  def test_reset_stat(self, mock_stat):
+    _unused = self.item.stat
+
+    self.item.reset_stat()
+
+    _unused = self.item.stat
+
+    self.assertEqual(mock_stat.call_count, 2)
+
 
 class TestGimpItem(unittest.TestCase):
 
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+
+from src import directory as directory_
+from src import manifest as manifest_
+from src import setting as setting_
+
+
+class TestManifest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+    self.input_filepath = self._create_file('input.jpg', b'input')
+    self.output_filepath = self._create_file('output.png', b'output')
+
+    self.manifest = manifest_.Manifest(os.path.join(self.temp_dir.name, 'manifest.db'))
+    self.manifest.open()
+    self.addCleanup(self.manifest.close)
+
+  def test_is_up_to_date(self):
+    self.assertFalse(self.manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+
+    self.assertTrue(self.manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+  def test_is_up_to_date_with_different_settings_hash(self):
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+
+    self.assertFalse(self.manifest.is_up_to_date(self.input_filepath, 'other_hash'))
+
+  def test_is_up_to_date_with_modified_input(self):
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+
+    self._create_file('input.jpg', b'modified input')
+
+    self.assertFalse(self.manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+  def test_is_up_to_date_with_modified_or_removed_output(self):
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+
+    self._create_file('output.png', b'modified output')
+
+    self.assertFalse(self.manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+    os.remove(self.output_filepath)
+
+    self.assertFalse(self.manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+  def test_update_with_nonexistent_output_removes_input(self):
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+    self.manifest.update(
+      self.input_filepath, 'hash', [os.path.join(self.temp_dir.name, 'nonexistent.png')])
+
+    self.assertFalse(self.manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+  def test_remove(self):
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+    self.manifest.remove(self.input_filepath)
+
+    self.assertFalse(self.manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+  def test_records_persist_after_reopening(self):
+    self.manifest.update(self.input_filepath, 'hash', [self.output_filepath])
+    self.manifest.close()
+
+    with manifest_.Manifest(self.manifest.filepath) as manifest:
+      self.assertTrue(manifest.is_up_to_date(self.input_filepath, 'hash'))
+
+  def _create_file(self, filename, contents):
+    filepath = os.path.join(self.temp_dir.name, filename)
+
+    with open(filepath, 'wb') as f:
+      f.write(contents)
+
+    return filepath
+
+
+class TestGetSettingsHash(unittest.TestCase):
+
+  def setUp(self):
+    self.settings = setting_.Group('main')
+    self.settings.add([
+      {
+        'type': 'int',
+        'name': 'width',
+        'default_value': 100,
+      },
+      {
+        'type': 'string',
+        'name': 'name_pattern',
+        'default_value': '[image name]',
+      },
+    ])
+
+  def test_identical_settings_and_values(self):
+    self.assertEqual(
+      manifest_.get_settings_hash([self.settings], directory_.Directory('/output'), {'a': 1}),
+      manifest_.get_settings_hash([self.settings], directory_.Directory('/output'), {'a': 1}),
+    )
+
+  def test_different_settings(self):
+    settings_hash = manifest_.get_settings_hash([self.settings])
+
+    self.settings['width'].set_value(200)
+
+    self.assertNotEqual(manifest_.get_settings_hash([self.settings]), settings_hash)
+
+  def test_different_values(self):
+    self.assertNotEqual(
+      manifest_.get_settings_hash([self.settings], directory_.Directory('/output')),
+      manifest_.get_settings_hash([self.settings], directory_.Directory('/other_output')),
+    )
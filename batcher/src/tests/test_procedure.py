@@ -123,6 +123,74 @@ def test_register_single_procedure(self, _mock_issubclass, _mock_isclass, mock_g
       'Jane Doe, John Doe', 'Jane Doe, John Doe', '2023')
     mock_procedure.set_sensitivity_mask.assert_called_once_with(0)
 
+  def test_create_temp_procedure(self, _mock_issubclass, _mock_isclass, mock_gimp_module):
+    procedure_.register_procedure(
+      sample_procedure,
+      procedure_type=mock_gimp_module.ImageProcedure,
+      arguments=[
+        self.run_mode_argument,
+      ],
+      menu_label='Sample Procedure',
+      menu_path='<Image>/Filters',
+      documentation=('A sample procedure.', 'This is a procedure for testing purposes.'),
+    )
+
+    mock_procedure = procedure_._do_create_procedure(
+      None, 'sample-procedure', temp_proc_name='sample-procedure-persistent')
+
+    new_args, _new_kwargs = mock_gimp_module.ImageProcedure.new.call_args
+    self.assertEqual(new_args[1], 'sample-procedure-persistent')
+    self.assertEqual(new_args[2], mock_gimp_module.PDBProcType.TEMPORARY)
+
+    mock_procedure.add_enum_argument.assert_called_once_with(*self.run_mode_argument[1:])
+    mock_procedure.set_menu_label.assert_not_called()
+    mock_procedure.add_menu_path.assert_not_called()
+    mock_procedure.set_documentation.assert_called_once_with(
+      'A sample procedure.',
+      'This is a procedure for testing purposes.',
+      'sample-procedure-persistent')
+
+  def test_run_persistent(self, _mock_issubclass, _mock_isclass, mock_gimp_module):
+    procedure_.register_procedure(
+      sample_procedure,
+      procedure_type=mock_gimp_module.ImageProcedure,
+    )
+
+    mock_persistent_procedure = mock.Mock()
+    mock_persistent_procedure.get_name.return_value = 'sample-server'
+    mock_plugin_instance = mock_persistent_procedure.get_plug_in.return_value
+
+    idle_func = mock.Mock()
+    num_processed_calls = 0
+
+    def _process_call(_timeout):
+      nonlocal num_processed_calls
+      num_processed_calls += 1
+
+      if num_processed_calls == 3:
+        quit_args, _quit_kwargs = mock_gimp_module.Procedure.new.call_args
+        quit_procedure_wrapper = quit_args[3]
+        quit_procedure_wrapper(
+          mock.Mock(**{'new_return_values.return_value.length.return_value': 1}),
+          mock.Mock(**{'list_properties.return_value': []}),
+          None)
+
+    mock_plugin_instance.persistent_process.side_effect = _process_call
+
+    procedure_.run_persistent(
+      mock_persistent_procedure, ['sample-procedure'], idle_func=idle_func)
+
+    new_args, _new_kwargs = mock_gimp_module.ImageProcedure.new.call_args
+    self.assertEqual(new_args[1], 'sample-procedure-persistent')
+
+    quit_args, _quit_kwargs = mock_gimp_module.Procedure.new.call_args
+    self.assertEqual(quit_args[1], 'sample-server-quit')
+
+    self.assertEqual(mock_plugin_instance.add_temp_procedure.call_count, 2)
+    mock_plugin_instance.persistent_ready.assert_called_once()
+    self.assertEqual(num_processed_calls, 3)
+    self.assertEqual(idle_func.call_count, 3)
+
   def test_create_procedure_no_matching_name(self, *_mocks):
     self.assertIsNone(procedure_._do_create_procedure(None, 'nonexistent-procedure'))
 
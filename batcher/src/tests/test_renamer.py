@@ -191,3 +191,87 @@ def test_rename(self, test_case_suffix, pattern, expected_layer_names_str):
     self.assertListEqual(
       [renamed_item.name for renamed_item in layer_tree.iter(with_folders=False, filtered=False)],
       [expected_item.name for expected_item in expected_layer_tree])
+
+
+class TestRenameWithPathField(unittest.TestCase):
+
+  def setUp(self):
+    layers_string = """
+      foreground
+      Corners {
+        corner
+        top-left-corner {
+          bottom-left-corner
+          bottom-right-corner
+        }
+        top-right-corner
+      }
+      background
+    """
+
+    self.image = utils_itemtree.parse_layers(layers_string)[0]
+
+    self.layer_tree = itemtree.LayerTree()
+    self.layer_tree.add_from_image(self.image)
+    self.layer_tree.filter.add(lambda item_: item_.type == itemtree.TYPE_ITEM)
+
+    self.batcher_mock = mock.Mock()
+    self.batcher_mock.item_tree = self.layer_tree
+    self.batcher_mock.matching_items = self.layer_tree
+
+  @parameterized.parameterized.expand([
+    ('default_separator',
+     '[layer path]',
+     ['foreground',
+      'Corners-corner',
+      'Corners-top-left-corner-bottom-left-corner',
+      'Corners-top-left-corner-bottom-right-corner',
+      'Corners-top-right-corner',
+      'background']),
+
+    ('custom_separator_and_wrapper',
+     '[layer path, _, (%c)]',
+     ['(foreground)',
+      '(Corners)_(corner)',
+      '(Corners)_(top-left-corner)_(bottom-left-corner)',
+      '(Corners)_(top-left-corner)_(bottom-right-corner)',
+      '(Corners)_(top-right-corner)',
+      '(background)']),
+
+    ('multiple_path_fields_with_different_separators',
+     '[layer path]_[layer path, .]',
+     ['foreground_foreground',
+      'Corners-corner_Corners.corner',
+      ('Corners-top-left-corner-bottom-left-corner'
+       '_Corners.top-left-corner.bottom-left-corner'),
+      ('Corners-top-left-corner-bottom-right-corner'
+       '_Corners.top-left-corner.bottom-right-corner'),
+      'Corners-top-right-corner_Corners.top-right-corner',
+      'background_background']),
+  ])
+  def test_rename(self, test_case_suffix, pattern, expected_names):
+    renamer = renamer_.ItemRenamer(pattern, fields_raw=renamer_.get_fields([EXPORT_LAYERS_GROUP]))
+
+    names = []
+
+    for item in self.layer_tree:
+      self.batcher_mock.current_item = item
+      names.append(renamer.rename(self.batcher_mock))
+
+    self.assertListEqual(names, expected_names)
+
+  def test_rename_after_parent_is_renamed(self):
+    renamer = renamer_.ItemRenamer(
+      '[layer path]', fields_raw=renamer_.get_fields([EXPORT_LAYERS_GROUP]))
+
+    items = list(self.layer_tree)
+
+    self.batcher_mock.current_item = items[2]
+    self.assertEqual(
+      renamer.rename(self.batcher_mock), 'Corners-top-left-corner-bottom-left-corner')
+
+    items[2].parents[0].name = 'Edges'
+
+    self.batcher_mock.current_item = items[3]
+    self.assertEqual(
+      renamer.rename(self.batcher_mock), 'Edges-top-left-corner-bottom-right-corner')
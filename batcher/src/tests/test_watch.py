@@ -0,0 +1,279 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import watch as watch_
+
+
+class TestDirectoryWatcher(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+    self.dirpath = self.temp_dir.name
+
+  def test_poll_returns_file_after_it_settles(self):
+    filepath = _create_file(self.dirpath, 'image.png', b'image')
+
+    watcher = self._create_watcher()
+
+    self.assertEqual(watcher.poll(), [])
+    self.assertEqual(watcher.num_pending_files, 1)
+
+    self.assertEqual(watcher.poll(), [filepath])
+    self.assertEqual(watcher.num_pending_files, 0)
+
+    self.assertEqual(watcher.poll(), [])
+
+  def test_poll_does_not_return_file_that_did_not_settle(self):
+    _create_file(self.dirpath, 'image.png', b'image')
+
+    watcher = self._create_watcher(settle_time=3600)
+
+    self.assertEqual(watcher.poll(), [])
+    self.assertEqual(watcher.poll(), [])
+    self.assertEqual(watcher.num_pending_files, 1)
+
+  def test_poll_returns_modified_file_again(self):
+    filepath = _create_file(self.dirpath, 'image.png', b'image')
+
+    watcher = self._create_watcher()
+
+    watcher.poll()
+    watcher.poll()
+
+    _create_file(self.dirpath, 'image.png', b'modified image')
+
+    self.assertEqual(watcher.poll(), [])
+    self.assertEqual(watcher.poll(), [filepath])
+
+  def test_poll_with_max_num_files(self):
+    filepaths = [
+      _create_file(self.dirpath, f'image{index}.png', b'image') for index in range(5)]
+
+    watcher = self._create_watcher()
+
+    watcher.poll()
+
+    returned_filepaths = watcher.poll(max_num_files=3)
+    self.assertEqual(len(returned_filepaths), 3)
+    self.assertEqual(watcher.num_pending_files, 2)
+
+    returned_filepaths.extend(watcher.poll(max_num_files=3))
+    self.assertCountEqual(returned_filepaths, filepaths)
+
+  def test_poll_includes_subfolders_and_skips_hidden_and_excluded_paths(self):
+    subdirpath = os.path.join(self.dirpath, 'subfolder')
+    hidden_dirpath = os.path.join(self.dirpath, '.hidden')
+    excluded_dirpath = os.path.join(self.dirpath, 'output')
+
+    for dirpath in [subdirpath, hidden_dirpath, excluded_dirpath]:
+      os.makedirs(dirpath)
+
+    filepath = _create_file(self.dirpath, 'image.png', b'image')
+    filepath_in_subfolder = _create_file(subdirpath, 'image.png', b'image')
+    _create_file(self.dirpath, '.image.png', b'image')
+    _create_file(hidden_dirpath, 'image.png', b'image')
+    _create_file(excluded_dirpath, 'image.png', b'image')
+
+    watcher = self._create_watcher(excluded_dirpaths=[excluded_dirpath])
+
+    watcher.poll()
+
+    self.assertCountEqual(watcher.poll(), [filepath, filepath_in_subfolder])
+
+  def test_poll_skips_excluded_watched_folder(self):
+    _create_file(self.dirpath, 'image.png', b'image')
+
+    watcher = self._create_watcher(excluded_dirpaths=[self.dirpath])
+
+    watcher.poll()
+
+    self.assertEqual(watcher.poll(), [])
+
+  def test_poll_does_not_return_ignored_files(self):
+    filepath = _create_file(self.dirpath, 'image.png', b'image')
+    ignored_filepath = _create_file(self.dirpath, 'output.png', b'output')
+
+    watcher = self._create_watcher()
+
+    watcher.poll()
+    watcher.ignore_files([ignored_filepath])
+
+    self.assertEqual(watcher.poll(), [filepath])
+
+  def test_poll_returns_ignored_file_if_modified(self):
+    filepath = _create_file(self.dirpath, 'image.png', b'image')
+
+    watcher = self._create_watcher()
+
+    watcher.ignore_files([filepath])
+
+    self.assertEqual(watcher.poll(), [])
+
+    _create_file(self.dirpath, 'image.png', b'modified image')
+
+    watcher.poll()
+
+    self.assertEqual(watcher.poll(), [filepath])
+
+  def test_poll_without_existing_files(self):
+    _create_file(self.dirpath, 'image.png', b'image')
+
+    watcher = self._create_watcher(include_existing_files=False)
+
+    new_filepath = _create_file(self.dirpath, 'new_image.png', b'image')
+
+    watcher.poll()
+
+    self.assertEqual(watcher.poll(), [new_filepath])
+
+  def _create_watcher(self, **kwargs):
+    kwargs.setdefault('settle_time', 0)
+
+    watcher = watch_.DirectoryWatcher([self.dirpath], use_file_monitors=False, **kwargs)
+    self.addCleanup(watcher.close)
+
+    return watcher
+
+
+class TestFolderWatchProcessor(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.temp_dir.cleanup)
+
+    self.dirpath = os.path.join(self.temp_dir.name, 'inputs')
+    os.makedirs(self.dirpath)
+
+    self.batches = []
+
+    self.batcher = mock.Mock(num_processed_items=0, skipped_items=[], output_filepaths={})
+    self.batcher.run.side_effect = self._run_batcher
+
+  def test_run_processes_files_in_batches(self):
+    filepaths = [
+      _create_file(self.dirpath, f'image{index}.png', b'image') for index in range(5)]
+
+    processor = self._create_processor(max_batch_size=2)
+
+    processor.run(max_num_iterations=2)
+
+    self.assertEqual([len(batch) for batch in self.batches], [2, 2, 1])
+    self.assertCountEqual([filepath for batch in self.batches for filepath in batch], filepaths)
+
+    self.assertEqual(processor.stats.num_batches, 3)
+    self.assertEqual(processor.stats.num_processed_files, 5)
+    self.assertEqual(processor.stats.num_failed_files, 0)
+
+  def test_run_counts_skipped_files(self):
+    filepaths = [
+      _create_file(self.dirpath, f'image{index}.png', b'image') for index in range(3)]
+
+    def _run_batcher_and_skip_file(**kwargs):
+      self._run_batcher(**kwargs)
+      self.batcher.num_processed_items -= 1
+      self.batcher.skipped_items = [(filepaths[0], 'Unchanged since the last run')]
+
+    self.batcher.run.side_effect = _run_batcher_and_skip_file
+
+    processor = self._create_processor()
+
+    processor.run(max_num_iterations=2)
+
+    self.assertEqual(processor.stats.num_processed_files, 2)
+    self.assertEqual(processor.stats.num_skipped_files, 1)
+    self.assertEqual(processor.stats.num_failed_files, 0)
+
+  def test_run_passes_batcher_kwargs(self):
+    _create_file(self.dirpath, 'image.png', b'image')
+
+    processor = self._create_processor(batcher_kwargs={'file_extension': 'jpg'})
+
+    processor.run(max_num_iterations=2)
+
+    _args, kwargs = self.batcher.run.call_args
+    self.assertEqual(kwargs['file_extension'], 'jpg')
+    self.assertTrue(kwargs['continue_on_error'])
+
+  def test_run_does_not_process_output_files_in_watched_folder(self):
+    filepath = _create_file(self.dirpath, 'image.png', b'image')
+
+    def _run_batcher_and_export(**kwargs):
+      self._run_batcher(**kwargs)
+
+      self.batcher.output_filepaths = {
+        item: [_create_file(self.dirpath, f'{os.path.basename(item.id)}.jpg', b'output')]
+        for item in kwargs['item_tree']}
+
+    self.batcher.run.side_effect = _run_batcher_and_export
+
+    processor = self._create_processor()
+
+    processor.run(max_num_iterations=4)
+
+    self.assertEqual(self.batches, [[filepath]])
+
+  def test_run_limits_queued_files(self):
+    for index in range(5):
+      _create_file(self.dirpath, f'image{index}.png', b'image')
+
+    processor = self._create_processor(max_batch_size=10, max_queued_files=2)
+
+    processor.run(max_num_iterations=3)
+
+    self.assertEqual([len(batch) for batch in self.batches], [2, 2])
+
+  def test_run_stops_if_stop_file_exists(self):
+    _create_file(self.dirpath, 'image.png', b'image')
+    stop_filepath = _create_file(self.temp_dir.name, 'stop', b'')
+
+    processor = self._create_processor(stop_filepath=stop_filepath)
+
+    processor.run(max_num_iterations=10)
+
+    self.assertEqual(self.batches, [])
+    self.assertFalse(os.path.exists(stop_filepath))
+
+  def test_stop_during_batch(self):
+    for index in range(4):
+      _create_file(self.dirpath, f'image{index}.png', b'image')
+
+    processor = self._create_processor(max_batch_size=1)
+
+    def _run_batcher_and_stop(**kwargs):
+      self._run_batcher(**kwargs)
+      processor.stop()
+
+    self.batcher.run.side_effect = _run_batcher_and_stop
+
+    processor.run(max_num_iterations=10)
+
+    self.assertEqual(len(self.batches), 1)
+    self.batcher.queue_stop.assert_called_once()
+
+  def _create_processor(self, **kwargs):
+    return watch_.FolderWatchProcessor(
+      self.batcher,
+      [self.dirpath],
+      poll_interval=0,
+      settle_time=0,
+      use_file_monitors=False,
+      **kwargs)
+
+  def _run_batcher(self, **kwargs):
+    filepaths = [item.id for item in kwargs['item_tree']]
+
+    self.batches.append(filepaths)
+    self.batcher.num_processed_items = len(filepaths)
+
+
+def _create_file(dirpath, filename, contents):
+  filepath = os.path.join(dirpath, filename)
+
+  with open(filepath, 'wb') as f:
+    f.write(contents)
+
+  return filepath
@@ -0,0 +1,133 @@
+"""Test cases comparing images loaded at full size and at a reduced size before
+scaling down. Requires GIMP to be running.
+"""
+
+import os
+import shutil
+import unittest
+
+import gi
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+from gi.repository import Gio
+
+from config import CONFIG
+from src import builtin_actions
+from src import commands
+from src import core
+from src import directory as directory_
+from src import itemtree
+from src import plugin_settings
+from src import utils
+from src import utils_setting as utils_setting_
+from src.procedure_groups import *
+from src.pypdb import pdb
+
+from src.tests.tests_requiring_gimp import utils_images
+
+
+_CURRENT_MODULE_DIRPATH = os.path.dirname(os.path.abspath(utils.get_current_module_filepath()))
+TEST_IMAGES_DIRPATH = os.path.join(_CURRENT_MODULE_DIRPATH, 'test_images')
+
+OUTPUT_DIRPATH = os.path.join(TEST_IMAGES_DIRPATH, 'temp_output')
+INPUT_DIRPATH = os.path.join(OUTPUT_DIRPATH, 'inputs')
+
+
+class TestImportAtReducedSize(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    CONFIG.PROCEDURE_GROUP = CONVERT_GROUP
+
+    Gimp.context_push()
+
+  @classmethod
+  def tearDownClass(cls):
+    Gimp.context_pop()
+
+    CONFIG.PROCEDURE_GROUP = CONFIG.PLUGIN_NAME
+
+  def setUp(self):
+    os.makedirs(INPUT_DIRPATH, exist_ok=True)
+
+    self.input_filepaths = [
+      _create_jpeg_image(os.path.join(INPUT_DIRPATH, 'landscape.jpg'), 3000, 2000),
+      _create_jpeg_image(os.path.join(INPUT_DIRPATH, 'portrait.jpg'), 1500, 2500),
+    ]
+
+  def tearDown(self):
+    if os.path.exists(OUTPUT_DIRPATH):
+      shutil.rmtree(OUTPUT_DIRPATH)
+
+  def test_sizes_are_identical(self):
+    for scale_mode in [
+          builtin_actions.ScaleModes.STRETCH,
+          builtin_actions.ScaleModes.KEEP_ADJUST_WIDTH,
+          builtin_actions.ScaleModes.KEEP_ADJUST_HEIGHT,
+          builtin_actions.ScaleModes.FIT,
+    ]:
+      for new_width, new_height in [(100, 100), (800, 600), (4000, 4000)]:
+        with self.subTest(scale_mode=scale_mode, new_width=new_width, new_height=new_height):
+          full_size_dirpath = os.path.join(OUTPUT_DIRPATH, 'full_size')
+          reduced_size_dirpath = os.path.join(OUTPUT_DIRPATH, 'reduced_size')
+
+          self._convert(full_size_dirpath, scale_mode, new_width, new_height, False)
+          self._convert(reduced_size_dirpath, scale_mode, new_width, new_height, True)
+
+          for filename in os.listdir(full_size_dirpath):
+            full_size_image = utils_images.load_image(os.path.join(full_size_dirpath, filename))
+            reduced_size_image = utils_images.load_image(
+              os.path.join(reduced_size_dirpath, filename))
+
+            self.assertEqual(
+              (reduced_size_image.get_width(), reduced_size_image.get_height()),
+              (full_size_image.get_width(), full_size_image.get_height()),
+              msg=filename)
+
+            full_size_image.delete()
+            reduced_size_image.delete()
+
+          shutil.rmtree(full_size_dirpath)
+          shutil.rmtree(reduced_size_dirpath)
+
+  def _convert(self, output_dirpath, scale_mode, new_width, new_height, import_at_reduced_size):
+    settings = plugin_settings.create_settings_for_convert()
+    settings['main/output_directory'].set_value(directory_.Directory(output_dirpath))
+    settings['main/file_extension'].set_value('png')
+    settings['main/import_at_reduced_size'].set_value(import_at_reduced_size)
+
+    scale = commands.add(
+      settings['main/actions'], builtin_actions.BUILTIN_ACTIONS['scale_for_images'])
+    scale['arguments/scale_mode'].set_value(scale_mode)
+
+    for dimension_name, pixel_value in [('new_width', new_width), ('new_height', new_height)]:
+      dimension = dict(scale[f'arguments/{dimension_name}'].value)
+      dimension['unit'] = 'px'
+      dimension['pixel_value'] = pixel_value
+      scale[f'arguments/{dimension_name}'].set_value(dimension)
+
+    item_tree = itemtree.ImageFileTree()
+    item_tree.add(self.input_filepaths)
+
+    batcher = core.ImageBatcher(
+      item_tree=item_tree,
+      actions=settings['main/actions'],
+      conditions=settings['main/conditions'],
+      initial_export_run_mode=Gimp.RunMode.NONINTERACTIVE,
+    )
+
+    batcher.run(**utils_setting_.get_settings_for_batcher(settings['main']))
+
+
+def _create_jpeg_image(filepath, width, height):
+  image = utils_images.create_plasma_image(width, height)
+
+  pdb.gimp_file_save(
+    run_mode=Gimp.RunMode.NONINTERACTIVE,
+    image=image,
+    file=Gio.file_new_for_path(filepath),
+    options=None)
+
+  image.delete()
+
+  return filepath
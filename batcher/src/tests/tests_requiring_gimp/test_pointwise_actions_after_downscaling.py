@@ -0,0 +1,138 @@
+"""Test cases quantifying the difference between applying color adjustment
+actions before and after scaling down. Requires GIMP to be running.
+"""
+
+import os
+import shutil
+import unittest
+
+import gi
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+
+from config import CONFIG
+from src import builtin_actions
+from src import commands
+from src import core
+from src import directory as directory_
+from src import itemtree
+from src import plugin_settings
+from src import utils
+from src import utils_setting as utils_setting_
+from src.procedure_groups import *
+
+from src.tests.tests_requiring_gimp import utils_images
+
+
+_CURRENT_MODULE_DIRPATH = os.path.dirname(os.path.abspath(utils.get_current_module_filepath()))
+TEST_IMAGES_DIRPATH = os.path.join(_CURRENT_MODULE_DIRPATH, 'test_images')
+INPUT_IMAGES_DIRPATH = os.path.join(TEST_IMAGES_DIRPATH, 'convert_inputs')
+
+OUTPUT_DIRPATH = os.path.join(TEST_IMAGES_DIRPATH, 'temp_output')
+
+# Mean difference in the value channel, in the range 0.0-1.0.
+_MAX_MEAN_DIFFERENCE = 0.02
+
+
+class TestPointwiseActionsAfterDownscaling(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    CONFIG.PROCEDURE_GROUP = CONVERT_GROUP
+
+    Gimp.context_push()
+
+    cls.test_images_filepaths = sorted(
+      os.path.join(root, filename)
+      for root, _dirnames, filenames in os.walk(INPUT_IMAGES_DIRPATH)
+      for filename in filenames)
+
+  @classmethod
+  def tearDownClass(cls):
+    Gimp.context_pop()
+
+    CONFIG.PROCEDURE_GROUP = CONFIG.PLUGIN_NAME
+
+  def tearDown(self):
+    if os.path.exists(OUTPUT_DIRPATH):
+      shutil.rmtree(OUTPUT_DIRPATH)
+
+  def test_difference_from_original_order_when_scaling_down(self):
+    mean_differences = self._get_mean_differences(scale_percent=25.0)
+
+    for filepath, mean_difference in mean_differences.items():
+      self.assertLess(
+        mean_difference,
+        _MAX_MEAN_DIFFERENCE,
+        msg=f'{filepath}: mean difference {mean_difference:.6f} when scaling down to 25%')
+
+  def test_no_difference_from_original_order_when_scaling_up(self):
+    mean_differences = self._get_mean_differences(scale_percent=150.0)
+
+    for filepath, mean_difference in mean_differences.items():
+      self.assertEqual(mean_difference, 0.0, msg=filepath)
+
+  def _get_mean_differences(self, scale_percent):
+    original_order_dirpath = os.path.join(OUTPUT_DIRPATH, 'original_order')
+    reordered_dirpath = os.path.join(OUTPUT_DIRPATH, 'reordered')
+
+    self._convert(original_order_dirpath, scale_percent, False)
+    self._convert(reordered_dirpath, scale_percent, True)
+
+    mean_differences = {}
+
+    for root, _dirnames, filenames in os.walk(original_order_dirpath):
+      for filename in filenames:
+        original_order_filepath = os.path.join(root, filename)
+        reordered_filepath = os.path.join(
+          reordered_dirpath, os.path.relpath(original_order_filepath, original_order_dirpath))
+
+        original_order_image = utils_images.load_image(original_order_filepath)
+        reordered_image = utils_images.load_image(reordered_filepath)
+
+        mean_differences[original_order_filepath] = utils_images.get_mean_difference(
+          original_order_image, reordered_image)
+
+        original_order_image.delete()
+        reordered_image.delete()
+
+    return mean_differences
+
+  def _convert(self, output_dirpath, scale_percent, apply_pointwise_actions_after_downscaling):
+    settings = plugin_settings.create_settings_for_convert()
+    settings['main/output_directory'].set_value(directory_.Directory(output_dirpath))
+    settings['main/file_extension'].set_value('png')
+    settings['main/apply_pointwise_actions_after_downscaling'].set_value(
+      apply_pointwise_actions_after_downscaling)
+
+    brightness_contrast = commands.add(
+      settings['main/actions'], builtin_actions.BUILTIN_ACTIONS['brightness_contrast'])
+    brightness_contrast['arguments/brightness'].set_value(40)
+    brightness_contrast['arguments/contrast'].set_value(30)
+    brightness_contrast['arguments/apply_non_destructively'].set_value(False)
+
+    hue_saturation = commands.add(
+      settings['main/actions'], builtin_actions.BUILTIN_ACTIONS['hue_saturation'])
+    hue_saturation['arguments/saturation_all'].set_value(30.0)
+    hue_saturation['arguments/apply_non_destructively'].set_value(False)
+
+    scale = commands.add(
+      settings['main/actions'], builtin_actions.BUILTIN_ACTIONS['scale_for_images'])
+    scale['arguments/interpolation'].set_value(Gimp.InterpolationType.LINEAR)
+
+    for dimension_name in ['new_width', 'new_height']:
+      dimension = dict(scale[f'arguments/{dimension_name}'].value)
+      dimension['percent_value'] = scale_percent
+      scale[f'arguments/{dimension_name}'].set_value(dimension)
+
+    item_tree = itemtree.ImageFileTree()
+    item_tree.add(self.test_images_filepaths)
+
+    batcher = core.ImageBatcher(
+      item_tree=item_tree,
+      actions=settings['main/actions'],
+      conditions=settings['main/conditions'],
+      initial_export_run_mode=Gimp.RunMode.NONINTERACTIVE,
+    )
+
+    batcher.run(**utils_setting_.get_settings_for_batcher(settings['main']))
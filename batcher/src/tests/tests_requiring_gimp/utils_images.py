@@ -0,0 +1,55 @@
+"""Utility functions creating and comparing images for tests requiring GIMP and
+for measurements in the ``dev`` directory.
+"""
+
+import gi
+gi.require_version('Gimp', '3.0')
+from gi.repository import Gimp
+from gi.repository import Gio
+
+from src import utils_pdb
+from src.pypdb import pdb
+
+
+def create_plasma_image(width: int, height: int) -> Gimp.Image:
+  """Creates an RGB image with a single layer filled with random plasma noise.
+
+  Unlike a solid color, the noise makes differences between images produced in
+  different ways (e.g. by applying filters in different order) noticeable.
+  """
+  image = Gimp.Image.new(width, height, Gimp.ImageBaseType.RGB)
+  layer = Gimp.Layer.new(
+    image, 'Layer', width, height, Gimp.ImageType.RGB_IMAGE, 100.0, Gimp.LayerMode.NORMAL)
+  image.insert_layer(layer, None, 0)
+
+  pdb.gegl__plasma(layer, merge_filter_=True)
+
+  return image
+
+
+def load_image(image_filepath: str) -> Gimp.Image:
+  return pdb.gimp_file_load(
+    run_mode=Gimp.RunMode.NONINTERACTIVE, file=Gio.file_new_for_path(image_filepath))
+
+
+def get_mean_difference(image: Gimp.Image, other_image: Gimp.Image) -> float:
+  """Returns the mean difference between the first layers of the two images in
+  the value channel, in the range 0.0-1.0.
+  """
+  if utils_pdb.compare_layers([image.get_layers()[0], other_image.get_layers()[0]]):
+    return 0.0
+
+  difference_image = image.duplicate()
+
+  try:
+    other_layer = Gimp.Layer.new_from_drawable(other_image.get_layers()[0], difference_image)
+    other_layer.set_mode(Gimp.LayerMode.DIFFERENCE)
+    difference_image.insert_layer(other_layer, None, 0)
+
+    merged_layer = difference_image.merge_visible_layers(Gimp.MergeType.CLIP_TO_IMAGE)
+
+    _success, mean, *_rest = merged_layer.histogram(Gimp.HistogramChannel.VALUE, 0.0, 1.0)
+  finally:
+    difference_image.delete()
+
+  return mean
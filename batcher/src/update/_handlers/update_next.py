@@ -1,2 +1,38 @@
+from .. import _utils as update_utils_
+
+
 def update(data, _settings, _procedure_groups):
-  pass
+  main_settings_list, _index = update_utils_.get_top_level_group_list(data, 'main')
+
+  if main_settings_list is not None:
+    actions_list, _index = update_utils_.get_child_group_list(main_settings_list, 'actions')
+
+    if actions_list is not None:
+      for action_dict in actions_list:
+        action_list = action_dict['settings']
+
+        orig_name_setting_dict, _index = update_utils_.get_child_setting(action_list, 'orig_name')
+        arguments_list, _index = update_utils_.get_child_group_list(action_list, 'arguments')
+
+        if orig_name_setting_dict['value'] == 'gmic_filter' and arguments_list is not None:
+          _gmic_filter_add_batch_size_argument(arguments_list)
+
+
+def _gmic_filter_add_batch_size_argument(arguments_list):
+  argument_dict, _index = update_utils_.get_child_setting(arguments_list, 'batch_size')
+
+  if argument_dict is None:
+    arguments_list.append({
+      'type': 'int',
+      'name': 'batch_size',
+      'default_value': 1,
+      'value': 1,
+      'display_name': _('Number of images per call'),
+      'description': _(
+        "Set this to a value greater than 1 to apply the filter to multiple images"
+        " in a single call to G'MIC, which avoids starting G'MIC for each image."
+        " This only takes effect if this is the first action."
+        " Use only with filters processing each layer independently."
+        " This has no effect in previews and when editing images in GIMP."),
+      'min_value': 1,
+    })
@@ -12,6 +12,11 @@ def get_settings_for_batcher(main_settings: setting_.Group) -> Dict[str, Any]:
     'file_extension',
     'overwrite_mode',
     'continue_on_error',
+    'rebuild_all',
+    'deduplicate_inputs',
+    'duplicate_output_mode',
+    'import_at_reduced_size',
+    'apply_pointwise_actions_after_downscaling',
   ]
 
   settings_for_batcher = {
@@ -23,6 +28,13 @@ def get_settings_for_batcher(main_settings: setting_.Group) -> Dict[str, Any]:
     if setting_name in main_settings:
       settings_for_batcher[setting_name] = main_settings[setting_name].value
 
+  if 'manifest_file' in main_settings:
+    manifest_file = main_settings['manifest_file'].value
+    if manifest_file is not None and manifest_file.get_path() is not None:
+      settings_for_batcher['manifest_filepath'] = manifest_file.get_path()
+    else:
+      settings_for_batcher['manifest_filepath'] = None
+
   if 'import' in main_settings:
     settings_for_batcher['import_options'] = {}
 
@@ -0,0 +1,432 @@
+"""Continuous batch conversion of files added to watched folders."""
+
+import collections
+from collections.abc import Iterable
+import logging
+import os
+import signal
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from gi.repository import Gio
+from gi.repository import GLib
+
+from src import constants
+from src import exceptions
+from src import itemtree
+
+
+class DirectoryWatcher:
+  """Class finding new or modified files in the specified folders and their
+  subfolders.
+
+  Folders are scanned on each call to `poll()`. A file is returned only once it
+  stopped changing for ``settle_time`` seconds, so that files still being
+  written are not processed prematurely. A file is returned again if it is
+  modified afterwards.
+
+  Folders in ``excluded_dirpaths`` are not scanned, including watched folders
+  themselves. Files can also be excluded via `ignore_files()`.
+
+  If ``use_file_monitors`` is ``True``, folders are additionally monitored for
+  changes (e.g. via inotify on Linux), which allows `wait()` to return as soon
+  as a change occurs. If monitoring is not available, `wait()` simply waits for
+  the specified time (polling).
+  """
+
+  def __init__(
+        self,
+        dirpaths: Iterable[str],
+        excluded_dirpaths: Optional[Iterable[str]] = None,
+        settle_time: float = 1.0,
+        include_existing_files: bool = True,
+        use_file_monitors: bool = True,
+  ):
+    self._dirpaths = [os.path.abspath(dirpath) for dirpath in dirpaths]
+    self._excluded_dirpaths = {
+      os.path.abspath(dirpath) for dirpath in (excluded_dirpaths if excluded_dirpaths else [])}
+    self._settle_time = settle_time
+    self._use_file_monitors = use_file_monitors
+
+    # Files returned by `poll()` along with their size and modification time.
+    self._returned_files = {}
+    # Files not returned yet, along with their size, modification time and the
+    # time at which they were last seen changing.
+    self._pending_files = {}
+
+    self._file_monitors = {}
+    self._changed = False
+
+    if not include_existing_files:
+      self._returned_files = self._scan()
+
+  @property
+  def dirpaths(self) -> List[str]:
+    return list(self._dirpaths)
+
+  @property
+  def num_pending_files(self) -> int:
+    """The number of new or modified files that did not settle yet."""
+    return len(self._pending_files)
+
+  def poll(self, max_num_files: Optional[int] = None) -> List[str]:
+    """Scans the watched folders and returns paths to new or modified files
+    that did not change for at least ``settle_time`` seconds.
+
+    If ``max_num_files`` is specified, at most ``max_num_files`` files are
+    returned. Remaining files are returned by subsequent calls to `poll()`.
+    """
+    self._changed = False
+
+    current_time = time.monotonic()
+    current_files = self._scan()
+
+    for filepath in list(self._returned_files):
+      if filepath not in current_files:
+        del self._returned_files[filepath]
+
+    for filepath in list(self._pending_files):
+      if filepath not in current_files:
+        del self._pending_files[filepath]
+
+    ready_filepaths = []
+
+    for filepath, size_and_mtime in current_files.items():
+      if self._returned_files.get(filepath) == size_and_mtime:
+        continue
+
+      pending_size_and_mtime, last_change_time = self._pending_files.get(filepath, (None, None))
+
+      if pending_size_and_mtime != size_and_mtime:
+        self._pending_files[filepath] = size_and_mtime, current_time
+      elif (current_time - last_change_time >= self._settle_time
+            and (max_num_files is None or len(ready_filepaths) < max_num_files)):
+        ready_filepaths.append(filepath)
+
+    for filepath in ready_filepaths:
+      self._returned_files[filepath] = self._pending_files.pop(filepath)[0]
+
+    return ready_filepaths
+
+  def ignore_files(self, filepaths: Iterable[str]):
+    """Prevents `poll()` from returning the specified files unless they are
+    modified afterwards.
+
+    This is useful to exclude files created by processing returned files (e.g.
+    output files saved to a watched folder), which would otherwise be returned
+    and processed again.
+    """
+    for filepath in filepaths:
+      filepath = os.path.abspath(filepath)
+
+      try:
+        file_stat = os.stat(filepath)
+      except OSError:
+        continue
+
+      self._pending_files.pop(filepath, None)
+      self._returned_files[filepath] = file_stat.st_size, file_stat.st_mtime_ns
+
+  def wait(self, timeout: float, should_stop_func: Optional[Callable[[], bool]] = None):
+    """Waits for ``timeout`` seconds or until a change in the watched folders
+    is detected, whichever comes first.
+
+    If ``should_stop_func`` is specified and returns ``True``, the waiting is
+    interrupted.
+    """
+    end_time = time.monotonic() + timeout
+    main_context = GLib.MainContext.default() if self._file_monitors else None
+
+    while not self._changed and time.monotonic() < end_time:
+      if should_stop_func is not None and should_stop_func():
+        break
+
+      if main_context is not None:
+        while main_context.pending():
+          main_context.iteration(False)
+
+      time.sleep(min(0.1, max(end_time - time.monotonic(), 0)))
+
+  def close(self):
+    """Stops monitoring the watched folders."""
+    for file_monitor in self._file_monitors.values():
+      file_monitor.cancel()
+
+    self._file_monitors = {}
+
+  def _scan(self):
+    files = {}
+
+    for dirpath in self._dirpaths:
+      if dirpath in self._excluded_dirpaths:
+        continue
+
+      for root, dirnames, filenames in os.walk(dirpath):
+        dirnames[:] = [
+          dirname for dirname in dirnames
+          if (not dirname.startswith('.')
+              and os.path.join(root, dirname) not in self._excluded_dirpaths)]
+
+        self._monitor_directory(root)
+
+        for filename in filenames:
+          if filename.startswith('.'):
+            continue
+
+          filepath = os.path.join(root, filename)
+
+          try:
+            file_stat = os.stat(filepath)
+          except OSError:
+            continue
+
+          files[filepath] = file_stat.st_size, file_stat.st_mtime_ns
+
+    return files
+
+  def _monitor_directory(self, dirpath):
+    if not self._use_file_monitors or dirpath in self._file_monitors:
+      return
+
+    try:
+      file_monitor = Gio.File.new_for_path(dirpath).monitor_directory(
+        Gio.FileMonitorFlags.WATCH_MOVES, None)
+    except GLib.Error:
+      # Fall back to polling.
+      self._use_file_monitors = False
+      self.close()
+      return
+
+    file_monitor.connect('changed', self._on_file_monitor_changed)
+
+    self._file_monitors[dirpath] = file_monitor
+
+  def _on_file_monitor_changed(self, _file_monitor, _file, _other_file, _event_type):
+    self._changed = True
+
+
+class WatchStats:
+  """Statistics of files processed while watching folders."""
+
+  def __init__(self):
+    self.start_time = time.monotonic()
+    self.num_processed_files = 0
+    self.num_failed_files = 0
+    self.num_skipped_files = 0
+    self.num_batches = 0
+
+  @property
+  def files_per_second(self) -> float:
+    duration = time.monotonic() - self.start_time
+
+    if duration > 0:
+      return self.num_processed_files / duration
+    else:
+      return 0.0
+
+
+class FolderWatchProcessor:
+  """Class continuously processing new or modified files in watched folders
+  with a single `core.ImageBatcher` instance.
+
+  New files are processed in batches of at most ``max_batch_size`` files, with
+  files found in a single scan of the folders (e.g. a burst of copied files)
+  processed together. At most ``max_queued_files`` files are queued for
+  processing at any time. Files beyond this limit are left in the folders and
+  queued once previously queued files are processed.
+
+  Processing stops once `stop()` is called, the ``SIGINT`` or ``SIGTERM``
+  signal is received, or the file at ``stop_filepath`` exists. The stop file is
+  removed afterwards.
+
+  Errors in individual files are logged and do not stop processing.
+
+  Files exported by processing a batch are never processed, even if they are
+  saved to a watched folder.
+  """
+
+  def __init__(
+        self,
+        batcher: 'src.core.ImageBatcher',
+        dirpaths: Iterable[str],
+        batcher_kwargs: Optional[Dict[str, Any]] = None,
+        poll_interval: float = 2.0,
+        settle_time: float = 1.0,
+        max_batch_size: int = 100,
+        max_queued_files: int = 1000,
+        stop_filepath: Optional[str] = None,
+        stats_interval: float = 60.0,
+        include_existing_files: bool = True,
+        excluded_dirpaths: Optional[Iterable[str]] = None,
+        use_file_monitors: bool = True,
+  ):
+    self._batcher = batcher
+    self._batcher_kwargs = dict(batcher_kwargs) if batcher_kwargs is not None else {}
+    self._poll_interval = poll_interval
+    self._max_batch_size = max_batch_size
+    self._max_queued_files = max_queued_files
+    self._stop_filepath = stop_filepath
+    self._stats_interval = stats_interval
+
+    self._watcher = DirectoryWatcher(
+      dirpaths,
+      excluded_dirpaths=excluded_dirpaths,
+      settle_time=settle_time,
+      include_existing_files=include_existing_files,
+      use_file_monitors=use_file_monitors,
+    )
+
+    self._queue = collections.deque()
+    self._stats = WatchStats()
+    self._last_stats_time = None
+    self._should_stop = False
+
+    self._logger = logging.getLogger(constants.LOGGER_NAME)
+
+  @property
+  def stats(self) -> WatchStats:
+    return self._stats
+
+  @property
+  def num_queued_files(self) -> int:
+    return len(self._queue)
+
+  def run(self, max_num_iterations: Optional[int] = None):
+    """Watches folders and processes files until stopped.
+
+    ``max_num_iterations``, if specified, limits the number of scans of the
+    watched folders. This is mostly useful for testing purposes.
+    """
+    self._should_stop = False
+    self._stats = WatchStats()
+    self._last_stats_time = time.monotonic()
+
+    orig_signal_handlers = self._set_signal_handlers()
+
+    self._logger.info(
+      _('Watching folders: {}').format(', '.join(f'"{path}"' for path in self._watcher.dirpaths)))
+
+    num_iterations = 0
+
+    try:
+      while not self._is_stop_requested():
+        if max_num_iterations is not None and num_iterations >= max_num_iterations:
+          break
+
+        num_iterations += 1
+
+        self._queue_new_files()
+
+        while self._queue and not self._is_stop_requested():
+          self._process_batch(
+            [self._queue.popleft() for _i in range(min(self._max_batch_size, len(self._queue)))])
+
+          self._log_stats_periodically()
+
+        self._log_stats_periodically()
+
+        if max_num_iterations is None or num_iterations < max_num_iterations:
+          self._watcher.wait(self._poll_interval, self._is_stop_requested)
+    finally:
+      self._restore_signal_handlers(orig_signal_handlers)
+      self._watcher.close()
+
+      self._remove_stop_file()
+
+      self._log_stats()
+      self._logger.info(_('Stopped watching folders'))
+
+  def stop(self):
+    """Requests processing to stop after the currently processed file."""
+    self._should_stop = True
+
+    self._batcher.queue_stop()
+
+  def _queue_new_files(self):
+    num_files_to_queue = self._max_queued_files - len(self._queue)
+    if num_files_to_queue > 0:
+      self._queue.extend(self._watcher.poll(max_num_files=num_files_to_queue))
+
+  def _process_batch(self, filepaths):
+    item_tree = itemtree.ImageFileTree()
+    item_tree.add(filepaths)
+
+    try:
+      self._batcher.run(**dict(self._batcher_kwargs, item_tree=item_tree, continue_on_error=True))
+    except exceptions.BatcherCancelError:
+      self._should_stop = True
+    except Exception as e:
+      self._logger.error(_('Error: {}').format(e))
+
+    # Prevent processing output files saved to a watched folder over and over.
+    self._watcher.ignore_files(
+      output_filepath
+      for output_filepaths in self._batcher.output_filepaths.values()
+      for output_filepath in output_filepaths)
+
+    num_skipped_files = len(self._batcher.skipped_items)
+
+    self._stats.num_batches += 1
+    self._stats.num_processed_files += self._batcher.num_processed_items
+    self._stats.num_failed_files += (
+      len(filepaths) - self._batcher.num_processed_items - num_skipped_files)
+    self._stats.num_skipped_files += num_skipped_files
+
+  def _is_stop_requested(self):
+    if self._should_stop:
+      return True
+
+    if self._stop_filepath is not None and os.path.exists(self._stop_filepath):
+      self._logger.info(_('Stop file "{}" found').format(self._stop_filepath))
+      self._should_stop = True
+
+    return self._should_stop
+
+  def _remove_stop_file(self):
+    if self._stop_filepath is not None and os.path.exists(self._stop_filepath):
+      try:
+        os.remove(self._stop_filepath)
+      except OSError:
+        pass
+
+  def _set_signal_handlers(self):
+    orig_signal_handlers = {}
+
+    for signal_number in [signal.SIGINT, signal.SIGTERM]:
+      try:
+        orig_signal_handlers[signal_number] = signal.signal(signal_number, self._on_signal)
+      except ValueError:
+        # Signal handlers can only be set in the main thread.
+        pass
+
+    return orig_signal_handlers
+
+  @staticmethod
+  def _restore_signal_handlers(orig_signal_handlers):
+    for signal_number, orig_signal_handler in orig_signal_handlers.items():
+      signal.signal(signal_number, orig_signal_handler)
+
+  def _on_signal(self, _signal_number, _frame):
+    self.stop()
+
+  def _log_stats_periodically(self):
+    if self._stats_interval <= 0:
+      return
+
+    current_time = time.monotonic()
+
+    if current_time - self._last_stats_time >= self._stats_interval:
+      self._log_stats()
+      self._last_stats_time = current_time
+
+  def _log_stats(self):
+    self._logger.info(
+      _('{} images processed, {} failed, {} skipped, {} queued, {} waiting to settle'
+        ' ({:.2f} images per second)').format(
+        self._stats.num_processed_files,
+        self._stats.num_failed_files,
+        self._stats.num_skipped_files,
+        len(self._queue),
+        self._watcher.num_pending_files,
+        self._stats.files_per_second,
+      ))